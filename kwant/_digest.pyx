@@ -0,0 +1,151 @@
+# Copyright 2011-2016 Kwant authors.
+#
+# This file is part of Kwant.  It is subject to the license terms in the file
+# LICENSE.rst found in the top-level directory of this distribution and at
+# http://kwant-project.org/license.  A list of Kwant authors can be found in
+# the file AUTHORS.rst at the top-level directory of this distribution and at
+# http://kwant-project.org/authors.
+
+"""Compiled loops of `kwant.digest`."""
+
+cimport cython
+from libc.stdint cimport uint8_t, uint32_t, uint64_t, int64_t
+from libc.string cimport memcpy, memset
+from libc.math cimport cos, sqrt, log, M_PI
+import numpy as np
+
+cdef double TWOPI = 2 * M_PI
+cdef int64_t BPF_MASK = 2**53 - 1
+cdef double RECIP_BPF = 2.0**-53
+
+# Per-round shift amounts and sine-derived constants of MD5 (RFC 1321).
+cdef uint32_t S[64]
+S[:] = [7, 12, 17, 22, 7, 12, 17, 22, 7, 12, 17, 22, 7, 12, 17, 22,
+        5, 9, 14, 20, 5, 9, 14, 20, 5, 9, 14, 20, 5, 9, 14, 20,
+        4, 11, 16, 23, 4, 11, 16, 23, 4, 11, 16, 23, 4, 11, 16, 23,
+        6, 10, 15, 21, 6, 10, 15, 21, 6, 10, 15, 21, 6, 10, 15, 21]
+
+cdef uint32_t K[64]
+K[:] = [
+    0xd76aa478, 0xe8c7b756, 0x242070db, 0xc1bdceee, 0xf57c0faf, 0x4787c62a,
+    0xa8304613, 0xfd469501, 0x698098d8, 0x8b44f7af, 0xffff5bb1, 0x895cd7be,
+    0x6b901122, 0xfd987193, 0xa679438e, 0x49b40821, 0xf61e2562, 0xc040b340,
+    0x265e5a51, 0xe9b6c7aa, 0xd62f105d, 0x02441453, 0xd8a1e681, 0xe7d3fbc8,
+    0x21e1cde6, 0xc33707d6, 0xf4d50d87, 0x455a14ed, 0xa9e3e905, 0xfcefa3f8,
+    0x676f02d9, 0x8d2a4c8a, 0xfffa3942, 0x8771f681, 0x6d9d6122, 0xfde5380c,
+    0xa4beea44, 0x4bdecfa9, 0xf6bb4b60, 0xbebfbc70, 0x289b7ec6, 0xeaa127fa,
+    0xd4ef3085, 0x04881d05, 0xd9d4d039, 0xe6db99e5, 0x1fa27cf8, 0xc4ac5665,
+    0xf4292244, 0x432aff97, 0xab9423a7, 0xfc93a039, 0x655b59c3, 0x8f0ccc92,
+    0xffeff47d, 0x85845dd1, 0x6fa87e4f, 0xfe2ce6e0, 0xa3014314, 0x4e0811a1,
+    0xf7537e82, 0xbd3af235, 0x2ad7d2bb, 0xeb86d391]
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+cdef void md5(const uint8_t *message, Py_ssize_t length, uint8_t *work,
+              uint8_t *digest) nogil:
+    """Write the MD5 digest of `message` to `digest`.
+
+    `work` must have room for the padded message, i.e. for a multiple of 64
+    bytes that is larger than ``length + 8``.
+    """
+    cdef Py_ssize_t padded = (length + 8) // 64 * 64 + 64
+    cdef Py_ssize_t block, i
+    cdef uint64_t num_bits = (<uint64_t>length) * 8
+    cdef uint32_t a, b, c, d, f
+    cdef uint32_t m[16]
+    cdef uint32_t state[4]
+    cdef int g, r
+    state[0] = 0x67452301
+    state[1] = 0xefcdab89
+    state[2] = 0x98badcfe
+    state[3] = 0x10325476
+
+    memcpy(work, message, length)
+    work[length] = 0x80
+    memset(work + length + 1, 0, padded - length - 1)
+    for i in range(8):
+        work[padded - 8 + i] = (num_bits >> (8 * i)) & 0xff
+
+    for block in range(0, padded, 64):
+        # Message words are little endian, whatever the platform.
+        for i in range(16):
+            m[i] = (work[block + 4 * i]
+                    | (<uint32_t>work[block + 4 * i + 1]) << 8
+                    | (<uint32_t>work[block + 4 * i + 2]) << 16
+                    | (<uint32_t>work[block + 4 * i + 3]) << 24)
+        a, b, c, d = state[0], state[1], state[2], state[3]
+        for r in range(64):
+            if r < 16:
+                f = (b & c) | (~b & d)
+                g = r
+            elif r < 32:
+                f = (d & b) | (~d & c)
+                g = (5 * r + 1) % 16
+            elif r < 48:
+                f = b ^ c ^ d
+                g = (3 * r + 5) % 16
+            else:
+                f = c ^ (b | ~d)
+                g = (7 * r) % 16
+            f = f + a + K[r] + m[g]
+            a, d, c = d, c, b
+            b = b + ((f << S[r]) | (f >> (32 - S[r])))
+        state[0] += a
+        state[1] += b
+        state[2] += c
+        state[3] += d
+
+    for i in range(16):
+        digest[i] = (state[i // 4] >> (8 * (i % 4))) & 0xff
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def uniform2_rows(const uint8_t[:, ::1] rows, bytes salt):
+    """For internal use by `kwant.digest`.
+
+    Return two arrays of [0,1)-distributed numbers, each element depending
+    on the bytes of one row of `rows` followed by `salt`.
+    """
+    cdef Py_ssize_t num_rows = rows.shape[0], row_len = rows.shape[1]
+    cdef Py_ssize_t salt_len = len(salt), length = row_len + salt_len
+    cdef Py_ssize_t n
+    cdef const uint8_t *c_salt = salt
+    cdef int64_t words[2]
+    cdef uint8_t digest[16]
+    message = np.empty(max(length, 1), np.uint8)
+    work = np.empty((length + 8) // 64 * 64 + 64, np.uint8)
+    cdef uint8_t[::1] c_message = message, c_work = work
+    result = np.empty((2, num_rows))
+    cdef double[:, ::1] c_result = result
+    with nogil:
+        memcpy(&c_message[0] + row_len, c_salt, salt_len)
+        for n in range(num_rows):
+            if row_len:
+                memcpy(&c_message[0], &rows[n, 0], row_len)
+            md5(&c_message[0], length, &c_work[0], digest)
+            # Like ``struct.unpack('qq', digest)``.
+            memcpy(words, digest, 16)
+            c_result[0, n] = (words[0] & BPF_MASK) * RECIP_BPF
+            c_result[1, n] = (words[1] & BPF_MASK) * RECIP_BPF
+    return result
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def box_muller(double[:, ::1] uniform):
+    """For internal use by `kwant.digest`.
+
+    Return the first of the two normal variables of the Box-Muller transform
+    of the pairs of uniform numbers ``uniform[:, n]``.
+    """
+    cdef Py_ssize_t n, num = uniform.shape[1]
+    result = np.empty(num)
+    cdef double[::1] c_result = result
+    with nogil:
+        for n in range(num):
+            c_result[n] = (cos(uniform[0, n] * TWOPI)
+                           * sqrt(-2.0 * log(1.0 - uniform[1, n])))
+    return result
@@ -7,6 +7,7 @@
 # http://kwant-project.org/authors.
 
 cimport cython
+from cython.parallel cimport prange
 import tinyarray as ta
 import numpy as np
 from scipy import sparse as sp
@@ -240,9 +241,212 @@ def make_dense_full(ham, args, CGraph gr, diag,
     return h_sub
 
 
+cdef class BlockSparseMatrix:
+    """Sparse matrix made of dense blocks that belong to pairs of sites.
+
+    The blocks are stored in compressed sparse row format over the sites:
+    the blocks of the row of site ``i`` are ``indptr[i]`` to ``indptr[i +
+    1] - 1``, ``indices`` holds the sites of their columns.  Block ``k`` is
+    stored in row-major order in ``data[block_offsets[k] :
+    block_offsets[k + 1]]``.  Site ``i`` has ``norb[i]`` orbitals, the first
+    of which is orbital number ``offsets[i]``.
+
+    Compared to a sparse matrix in CSR format, only one column index is
+    stored per block instead of one per matrix element, and the
+    multiplication with a block of vectors is done in a compiled loop that
+    traverses the matrix only once for all the vectors.
+    """
+    cdef readonly object indptr, indices, block_offsets, data, norb, offsets
+    cdef readonly tuple shape
+
+    def __init__(self, indptr, indices, block_offsets, data, norb):
+        self.indptr = np.asarray(indptr, gint_dtype)
+        self.indices = np.asarray(indices, gint_dtype)
+        self.block_offsets = np.asarray(block_offsets, np.intp)
+        self.data = np.asarray(data, complex)
+        self.norb = np.asarray(norb, gint_dtype)
+        self.offsets = np.zeros(len(self.norb) + 1, gint_dtype)
+        np.cumsum(self.norb, out=self.offsets[1:])
+        self.shape = (int(self.offsets[-1]),) * 2
+
+    def _coordinates(self):
+        """Return the rows and columns of all the entries of `data`."""
+        norb = self.norb
+        block_rows = np.repeat(np.arange(len(norb)), np.diff(self.indptr))
+        block_cols = self.indices
+        sizes = np.diff(self.block_offsets)
+        local = (np.arange(self.block_offsets[-1])
+                 - np.repeat(self.block_offsets[:-1], sizes))
+        width = np.repeat(norb[block_cols], sizes)
+        rows = np.repeat(self.offsets[block_rows], sizes) + local // width
+        cols = np.repeat(self.offsets[block_cols], sizes) + local % width
+        return rows, cols
+
+    def tocoo(self):
+        """Return the matrix as a `scipy.sparse.coo_matrix`."""
+        rows, cols = self._coordinates()
+        return sp.coo_matrix((self.data, (rows, cols)), shape=self.shape)
+
+    def tobsr(self):
+        """Return the matrix as a `scipy.sparse.bsr_matrix`.
+
+        This requires all sites to have the same number of orbitals.  The
+        data and index arrays are shared, not copied.
+        """
+        norb = self.norb
+        if len(norb) and np.any(norb != norb[0]):
+            raise ValueError('The BSR format requires the same number of '
+                             'orbitals on all sites.')
+        n = norb[0] if len(norb) else 1
+        return sp.bsr_matrix((self.data.reshape(-1, n, n), self.indices,
+                              self.indptr), shape=self.shape)
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    def dot(self, vectors, int num_threads=1):
+        """Return the product of the matrix with a vector or with the columns
+        of a 2d array.
+
+        The computation releases the global interpreter lock.  If Kwant has
+        been compiled with OpenMP support, up to `num_threads` threads are
+        used.
+        """
+        cdef gint [:] indptr = self.indptr, indices = self.indices
+        cdef gint [:] norb = self.norb, offsets = self.offsets
+        cdef Py_ssize_t [:] block_offsets = self.block_offsets
+        cdef complex [:] data = self.data
+        cdef complex [:, ::1] vecs, out
+        cdef gint i, j, k, r, c, l, ni, nj, oi, oj, num_vecs
+        cdef gint num_sites = norb.shape[0]
+        cdef Py_ssize_t b
+        cdef complex h
+        cdef complex *row
+        cdef complex *vec
+
+        vectors = np.asarray(vectors)
+        if vectors.ndim not in (1, 2) or vectors.shape[0] != self.shape[1]:
+            raise ValueError('Dimension mismatch.')
+        is_vector = vectors.ndim == 1
+        vecs = np.ascontiguousarray(vectors.reshape(self.shape[1], -1),
+                                    complex)
+        result = np.zeros((self.shape[0], vecs.shape[1]), complex)
+        out = result
+        num_vecs = vecs.shape[1]
+
+        for i in prange(num_sites, nogil=True, num_threads=num_threads,
+                        schedule='guided'):
+            ni = norb[i]
+            oi = offsets[i]
+            for k in range(indptr[i], indptr[i + 1]):
+                j = indices[k]
+                nj = norb[j]
+                oj = offsets[j]
+                b = block_offsets[k]
+                for r in range(ni):
+                    row = &out[oi + r, 0]
+                    for c in range(nj):
+                        h = data[b + r * nj + c]
+                        vec = &vecs[oj + c, 0]
+                        for l in range(num_vecs):
+                            row[l] = row[l] + h * vec[l]
+        return result[:, 0] if is_vector else result
+
+
+@cython.boundscheck(False)
+def make_block_sparse(ham, args, CGraph gr):
+    """For internal use by System.hamiltonian_blocks."""
+    cdef gintArraySlice nbors
+    cdef gint n, i, j, r, c, ni, nj, k, t, num_blocks
+    cdef gint [:] rows_view, cols_view, norb_view
+    cdef Py_ssize_t [:] offsets_view, transposed_view
+    cdef complex [:, :] h
+    cdef complex [:] data_view
+    cdef Py_ssize_t b, bt
+
+    matrix = ta.matrix
+    n = gr.num_nodes
+
+    diag = n * [None]
+    norb = np.empty(n, gint_dtype)
+    norb_view = norb
+    for i in range(n):
+        diag[i] = h = matrix(ham(i, i, *args), complex)
+        if h.shape[0] != h.shape[1]:
+            raise ValueError(msg.format(i, i))
+        norb_view[i] = h.shape[0]
+
+    # The block structure: all the edges of the graph and the diagonal,
+    # sorted by rows and columns.
+    rows = np.empty(gr.num_edges + n, gint_dtype)
+    cols = np.empty(gr.num_edges + n, gint_dtype)
+    rows_view = rows
+    cols_view = cols
+    num_blocks = 0
+    for i in range(n):
+        rows_view[num_blocks] = cols_view[num_blocks] = i
+        num_blocks += 1
+        nbors = gr.out_neighbors(i)
+        for j in nbors.data[:nbors.size]:
+            rows_view[num_blocks] = i
+            cols_view[num_blocks] = j
+            num_blocks += 1
+    order = np.lexsort((cols[:num_blocks], rows[:num_blocks]))
+    rows = rows[order]
+    cols = cols[order]
+    rows_view = rows
+    cols_view = cols
+    indptr = np.searchsorted(rows, np.arange(n + 1)).astype(gint_dtype)
+
+    # Position of the transposed block of each block.
+    keys = rows.astype(np.int64) * n + cols
+    transposed_keys = cols.astype(np.int64) * n + rows
+    transposed = np.searchsorted(keys, transposed_keys).astype(np.intp)
+    transposed[transposed == len(keys)] = 0
+    if np.any(keys[transposed] != transposed_keys):
+        raise ValueError('The graph of the system is not symmetric.')
+    transposed_view = transposed
+
+    block_offsets = np.zeros(num_blocks + 1, np.intp)
+    np.cumsum(norb[rows] * norb[cols].astype(np.intp),
+              out=block_offsets[1:])
+    offsets_view = block_offsets
+    data = np.empty(block_offsets[-1], complex)
+    data_view = data
+
+    # Only the diagonal and the lower triangle are evaluated, the upper
+    # triangle is obtained by Hermitian conjugation.
+    for k in range(num_blocks):
+        i = rows_view[k]
+        j = cols_view[k]
+        if i < j:
+            continue
+        ni = norb_view[i]
+        nj = norb_view[j]
+        b = offsets_view[k]
+        if i == j:
+            h = diag[i]
+            for r in range(ni):
+                for c in range(nj):
+                    data_view[b + r * nj + c] = h[r, c]
+            continue
+        h = matrix(ham(i, j, *args), complex)
+        if h.shape[0] != ni or h.shape[1] != nj:
+            raise ValueError(msg.format(j, i))
+        bt = offsets_view[transposed_view[k]]
+        for r in range(ni):
+            for c in range(nj):
+                data_view[b + r * nj + c] = h[r, c]
+                data_view[bt + c * ni + r] = h[r, c].conjugate()
+
+    return BlockSparseMatrix(indptr, cols, block_offsets, data, norb)
+
+
+_sparse_formats = ('bsr', 'coo', 'csc', 'csr', 'dia', 'dok', 'lil')
+
+
 @cython.embedsignature(True)
 def hamiltonian_submatrix(self, args=(), to_sites=None, from_sites=None,
-                          sparse=False, return_norb=False):
+                          sparse=False, return_norb=False, format=None):
     """Return a submatrix of the system Hamiltonian.
 
     Parameters
@@ -253,13 +457,21 @@ def hamiltonian_submatrix(self, args=(), to_sites=None, from_sites=None,
     from_sites : sequence of sites or None (default)
     sparse : bool
         Whether to return a sparse or a dense matrix. Defaults to `False`.
+        Ignored if `format` is given.
     return_norb : bool
         Whether to return arrays of numbers of orbitals.  Defaults to `False`.
+    format : string or None (default)
+        Format of the returned sparse matrix, one of ``'bsr'``, ``'coo'``,
+        ``'csc'``, ``'csr'``, ``'dia'``, ``'dok'``, or ``'lil'``.  If given,
+        a sparse matrix is returned whatever the value of `sparse`.
+        ``'bsr'`` requires all sites to have the same number of orbitals,
+        which is used as block size.
 
     Returns
     -------
-    hamiltonian_part : numpy.ndarray or scipy.sparse.coo_matrix
-        Submatrix of Hamiltonian of the system.
+    hamiltonian_part : numpy.ndarray or scipy.sparse matrix
+        Submatrix of Hamiltonian of the system.  A sparse matrix is in COO
+        format unless `format` is given.
     to_norb : array of integers
         Numbers of orbitals on each site in to_sites.  Only returned when
         `return_norb` is true.
@@ -273,10 +485,44 @@ def hamiltonian_submatrix(self, args=(), to_sites=None, from_sites=None,
     from `from_sites` to `to_sites`.  The default for `from_sites` and
     `to_sites` is `None` which means to use all sites of the system in the
     order in which they appear.
+
+    For the full Hamiltonian, the BSR format is filled directly, one dense
+    block per pair of connected sites, without going through the COO
+    format.  All other cases are assembled as for ``sparse=True`` and
+    converted to the requested format.
     """
     cdef gint [:] to_norb, from_norb
     cdef gint site, n_site, n
 
+    if format is not None:
+        if format not in _sparse_formats:
+            raise ValueError('Unknown sparse matrix format: {0!r}'
+                             .format(format))
+        if format == 'bsr' and to_sites is from_sites is None:
+            blocks = make_block_sparse(self.hamiltonian, args, self.graph)
+            mat = blocks.tobsr()
+            return (mat, blocks.norb, blocks.norb) if return_norb else mat
+        mat, to_n, from_n = hamiltonian_submatrix(
+            self, args, to_sites, from_sites, sparse=True, return_norb=True)
+        if format == 'bsr':
+            to_n, from_n = np.asarray(to_n), np.asarray(from_n)
+            if np.any(to_n != to_n[:1]) or np.any(from_n != from_n[:1]):
+                raise ValueError('The BSR format requires the same number of '
+                                 'orbitals on all sites.')
+            mat = mat.tobsr((to_n[0] if len(to_n) else 1,
+                             from_n[0] if len(from_n) else 1))
+        else:
+            mat = mat.asformat(format)
+        return (mat, to_n, from_n) if return_norb else mat
+
+    # Systems may optionally provide a faster way to assemble the full
+    # Hamiltonian.
+    if to_sites is from_sites is None:
+        hamiltonian_full = getattr(self, '_hamiltonian_full', None)
+        if hamiltonian_full is not None:
+            mat, norb = hamiltonian_full(args, sparse)
+            return (mat, norb, norb) if return_norb else mat
+
     ham = self.hamiltonian
     n = self.graph.num_nodes
     matrix = ta.matrix
@@ -7,17 +7,24 @@
 # http://kwant-project.org/authors.
 
 __all__ = ['Builder', 'Site', 'SiteFamily', 'SimpleSiteFamily', 'Symmetry',
-           'HoppingKind', 'Lead', 'BuilderLead', 'SelfEnergyLead', 'ModesLead']
+           'HoppingKind', 'Lead', 'BuilderLead', 'SelfEnergyLead', 'ModesLead',
+           'SiteArray', 'vectorized', 'ValueProfile']
 
 import abc
+import collections.abc
+import numbers
+import time
 import warnings
 import operator
-from functools import total_ordering
+from collections import namedtuple
+from functools import total_ordering, update_wrapper
 from itertools import islice, chain
 import tinyarray as ta
 import numpy as np
+from scipy import sparse as sp
 from . import system, graph, KwantDeprecationWarning, UserCodeError
 from ._common import ensure_isinstance
+from .graph.defs import gint_dtype
 
 
 
@@ -107,7 +114,9 @@ class SiteFamily(metaclass=abc.ABCMeta):
 
     Site families that are intended for use with plotting should also provide a
     method `pos(tag)`, which returns a vector with real-space coordinates of the
-    site belonging to this family with a given tag.
+    site belonging to this family with a given tag.  The method `positions`,
+    which does the same for a whole array of tags, is implemented in terms of
+    `pos` but may be overridden with a more efficient version.
 
     If the ``norbs`` of a site family are provided, and sites of this family
     are used to populate a `~kwant.builder.Builder`, then the associated
@@ -169,6 +178,13 @@ class SiteFamily(metaclass=abc.ABCMeta):
         """
         pass
 
+    def positions(self, tags):
+        """Return the real-space positions of the sites with given tags.
+
+        Returns a 2d NumPy array with one row per tag.
+        """
+        return np.array([self.pos(tag) for tag in tags], float)
+
     def __call__(self, *tag):
         """
         A convenience function.
@@ -212,6 +228,49 @@ class SimpleSiteFamily(SiteFamily):
         return tag
 
 
+class SiteArray:
+    """An array of sites, all belonging to the same `SiteFamily`.
+
+    Instances of this class are passed to `vectorized` value functions in place
+    of single sites.
+
+    Parameters
+    ----------
+    family : an instance of `SiteFamily`
+        The family of all the sites in the array.
+    tags : NumPy array
+        The tags of the sites.  For lattice site families this is a 2d
+        integer array with one row per site.
+
+    Notes
+    -----
+    Indexing a site array with an integer returns the corresponding `Site`.
+    """
+
+    def __init__(self, family, tags):
+        self.family = family
+        self.tags = tags
+
+    def __len__(self):
+        return len(self.tags)
+
+    def __getitem__(self, i):
+        return Site(self.family, self.tags[i], True)
+
+    def __iter__(self):
+        family = self.family
+        for tag in self.tags:
+            yield Site(family, tag, True)
+
+    def __repr__(self):
+        return 'SiteArray({0}, {1})'.format(repr(self.family), repr(self.tags))
+
+    @property
+    def positions(self):
+        """Real space positions of the sites, one row per site."""
+        return self.family.positions(self.tags)
+
+
 def validate_hopping(hopping):
     """Verify that the argument is a valid hopping."""
 
@@ -311,6 +370,33 @@ class Symmetry(metaclass=abc.ABCMeta):
                 return False
         return True
 
+    def which_tags(self, family, tags):
+        """Calculate the domains of many sites of one family.
+
+        `tags` is a 2d integer array with the tag of one site per row.  Return
+        a 2d integer array whose rows are the group elements that `which`
+        returns for these sites.
+
+        This default implementation works but may be not efficient.
+        """
+        result = [self.which(Site(family, ta.array(tag), True))
+                  for tag in tags.tolist()]
+        return np.array(result, int).reshape(len(tags), self.num_directions)
+
+    def act_tags(self, elements, family, tags):
+        """Act with group elements on many sites of one family.
+
+        Return the tags of the sites that result from acting with the group
+        element ``elements[i]`` on the site with the tag ``tags[i]``, as a 2d
+        integer array.
+
+        This default implementation works but may be not efficient.
+        """
+        result = [self.act(ta.array(element),
+                           Site(family, ta.array(tag), True)).tag
+                  for element, tag in zip(elements.tolist(), tags.tolist())]
+        return np.array(result, int).reshape(tags.shape)
+
 
 class NoSymmetry(Symmetry):
     """A symmetry with a trivial symmetry group."""
@@ -457,6 +543,82 @@ class HermConjOfFunc:
         return herm_conj(self.function(j, i, *args))
 
 
+################ Vectorized value functions
+
+class VectorizedFunction:
+    """A value function that is evaluated for many sites or hoppings at once.
+
+    Do not instantiate this class directly, use `vectorized` instead.
+    """
+
+    def __init__(self, function):
+        self.function = function
+        update_wrapper(self, function)
+
+    def __call__(self, *args):
+        # Evaluation for a single site or hopping, as done by the generic
+        # (not vectorized) code paths.
+        num_sites = 2 if len(args) > 1 and isinstance(args[1], Site) else 1
+        site_arrays = [SiteArray(site.family, np.array([site.tag]))
+                       for site in args[:num_sites]]
+        value = np.asarray(self.function(*(site_arrays + list(args[num_sites:]))))
+        return value if value.ndim == 0 else value[0]
+
+    def evaluate(self, site_arrays, args):
+        """Evaluate the function in bulk.
+
+        Return a complex array of shape ``(N, norbs_to, norbs_from)`` for
+        ``N`` sites or hoppings.
+        """
+        num = len(site_arrays[0])
+        value = np.asarray(self.function(*(list(site_arrays) + list(args))),
+                           complex)
+        if value.ndim == 0:
+            value = np.resize(value, (num, 1, 1))
+        elif value.ndim == 1:
+            value = value.reshape(-1, 1, 1)
+        if value.ndim != 3 or value.shape[0] != num:
+            msg = ('Vectorized value function must return a scalar or an '
+                   'array of shape (N,) or (N, norbs_to, norbs_from) for N '
+                   'sites or hoppings.  Got an array of shape {0} for N={1}.')
+            raise ValueError(msg.format(value.shape, num))
+        return value
+
+
+def vectorized(function):
+    """Decorate a value function such that it is evaluated in bulk.
+
+    The decorated function receives instances of `SiteArray` instead of
+    single sites, one for onsite values and two for hoppings, followed by the
+    usual additional arguments.  It must return an array of shape ``(N,)``
+    (one number per site or hopping) or ``(N, norbs_to, norbs_from)``, or a
+    single number for all of them.
+
+    When the full Hamiltonian of a finalized `Builder` is assembled by
+    `~kwant.system.System.hamiltonian_submatrix`, all the sites or hoppings
+    that share such a value function and have the same site families are
+    passed to it in a single call.  This can speed up the construction of the
+    Hamiltonian considerably for functions that can be written in terms of
+    NumPy array operations.  In all other cases the function is called with
+    site arrays of length one.
+
+    Examples
+    --------
+    >>> @kwant.builder.vectorized
+    ... def onsite(sites, salt):
+    ...     return 4 + np.array([kwant.digest.uniform(t, salt)
+    ...                          for t in sites.tags])
+    ...
+    >>> @kwant.builder.vectorized
+    ... def hopping(to_sites, from_sites, phi):
+    ...     x = to_sites.positions[:, 0] + from_sites.positions[:, 0]
+    ...     return -np.exp(0.5j * phi * x)
+    """
+    if isinstance(function, VectorizedFunction):
+        return function
+    return VectorizedFunction(function)
+
+
 ################ Leads
 
 class Lead(metaclass=abc.ABCMeta):
@@ -631,6 +793,607 @@ def _site_ranges(sites):
     return site_ranges
 
 
+def _group_by_value(values):
+    """Group the indices of ``values`` by the identity of the value.
+
+    Return a list of pairs ``(value, ids)`` where `ids` is a sorted array of
+    all the indices at which `value` occurs.  Groups are ordered by first
+    occurrence.
+    """
+    groups = {}
+    for i, value in enumerate(values):
+        try:
+            groups[id(value)][1].append(i)
+        except KeyError:
+            groups[id(value)] = value, [i]
+    return [(value, np.array(ids, int)) for value, ids in groups.values()]
+
+
+def _tag_array(family, tags):
+    """Return `tags` as a 2d integer array of valid tags of `family`."""
+    tags = np.asarray(tags)
+    if tags.ndim != 2:
+        raise ValueError('Tags must be given as a 2d array with one tag per '
+                         'row.')
+    if not len(tags):
+        return tags.astype(int)
+    if tags.dtype.kind not in 'iu':
+        raise TypeError('Tags must be integers.')
+    # Only check the first tag, the others have the same length and type.
+    if not isinstance(Site(family, tags[0]).tag, ta.ndarray_int):
+        raise TypeError('Site family {0} does not have integer tags.'
+                        .format(family))
+    return tags.astype(int, copy=False)
+
+
+def _unique_rows(array):
+    """Return the distinct rows of `array`, in order of first occurrence."""
+    if len(array) < 2:
+        return array
+    return array[np.sort(_distinct_rows(array)[0])]
+
+
+################ Compact storage of the graph of a builder
+
+_HASH_MULTIPLIERS = (0x9e3779b97f4a7c15, 0xbf58476d1ce4e5b9, 0x94d049bb133111eb)
+_MASK64 = 2**64 - 1
+
+
+def _hash_tag(tag):
+    """Hash a sequence of integers, like `_hash_tags` does for one row."""
+    h = 0
+    for k, x in enumerate(tag):
+        h = ((h ^ (x & _MASK64)) * _HASH_MULTIPLIERS[k % 3]) & _MASK64
+    return h ^ (h >> 32)
+
+
+def _hash_tags(tags):
+    """Hash the rows of a 2d integer array."""
+    h = np.zeros(len(tags), np.uint64)
+    for k in range(tags.shape[1]):
+        h ^= tags[:, k].astype(np.int64).view(np.uint64)
+        h *= np.uint64(_HASH_MULTIPLIERS[k % 3])
+    return h ^ (h >> np.uint64(32))
+
+
+def _distinct_rows(array):
+    """Find the distinct rows of a 2d array.
+
+    Return ``(first, inverse)``: the positions of the first occurrences of
+    the distinct rows, in lexicographic order of the rows, and for each row
+    the number of its distinct row, such that ``array[first][inverse]``
+    equals `array`.
+    """
+    order = np.lexsort(array.T[::-1])
+    ordered = array[order]
+    is_first = np.ones(len(array), bool)
+    is_first[1:] = np.any(ordered[1:] != ordered[:-1], axis=1)
+    inverse = np.empty(len(array), np.intp)
+    inverse[order] = np.cumsum(is_first) - 1
+    return order[is_first], inverse
+
+
+def _grow(array, size):
+    """Return `array`, or a larger copy of it with room for `size` rows."""
+    if size <= len(array):
+        return array
+    result = np.empty((max(size, 2 * len(array)),) + array.shape[1:],
+                      array.dtype)
+    result[:len(array)] = array
+    return result
+
+
+class _TagTable:
+    """The integer tags of the sites of one family, with a hash index.
+
+    The tags are stored as rows of a 2d array, in the order of their
+    addition.  `slots` is an open addressing hash table with linear probing
+    that holds the row numbers of the tags, or -1 for empty slots.  Rows are
+    never removed.
+    """
+
+    def __init__(self, ndim):
+        self.tags = np.empty((8, ndim), np.int64)
+        self.ids = np.empty(8, np.int64)    # Id of the site of each row.
+        self.size = 0
+        self.slots = -np.ones(16, np.int64)
+
+    def find(self, tag):
+        """Return the row of `tag` (a list of integers) or -1."""
+        slots = self.slots
+        mask = len(slots) - 1
+        i = _hash_tag(tag) & mask
+        while True:
+            row = slots[i]
+            if row < 0:
+                return -1
+            if self.tags[row].tolist() == tag:
+                return row
+            i = (i + 1) & mask
+
+    def add(self, tag, id):
+        """Add `tag` (a list of integers), which must be new."""
+        if 2 * (self.size + 1) > len(self.slots):
+            return self.add_many(np.array([tag], np.int64), [id])[0]
+        row = self.size
+        self.tags = _grow(self.tags, row + 1)
+        self.ids = _grow(self.ids, row + 1)
+        self.tags[row] = tag
+        self.ids[row] = id
+        self.size += 1
+        slots = self.slots
+        mask = len(slots) - 1
+        i = _hash_tag(tag) & mask
+        while slots[i] >= 0:
+            i = (i + 1) & mask
+        slots[i] = row
+        return row
+
+    def find_many(self, tags):
+        """Return the rows of `tags` (a 2d array), -1 for missing ones."""
+        slots = self.slots
+        mask = len(slots) - 1
+        result = -np.ones(len(tags), np.int64)
+        pos = (_hash_tags(tags) & np.uint64(mask)).astype(np.int64)
+        active = np.arange(len(tags))
+        while len(active):
+            rows = slots[pos[active]]
+            found = rows >= 0
+            match = np.zeros(len(active), bool)
+            match[found] = np.all(self.tags[rows[found]] == tags[active[found]],
+                                  axis=1)
+            result[active[match]] = rows[match]
+            active = active[found & ~match]
+            pos[active] = (pos[active] + 1) & mask
+        return result
+
+    def add_many(self, tags, ids):
+        """Add `tags`, which must be new and unique, and return their rows."""
+        rows = np.arange(self.size, self.size + len(tags))
+        self.tags = _grow(self.tags, self.size + len(tags))
+        self.ids = _grow(self.ids, self.size + len(tags))
+        self.tags[rows] = tags
+        self.ids[rows] = ids
+        self.size += len(tags)
+        if 2 * self.size > len(self.slots):
+            num_slots = len(self.slots)
+            while 2 * self.size > num_slots:
+                num_slots *= 2
+            self.slots = -np.ones(num_slots, np.int64)
+            self._index(np.arange(self.size))
+        else:
+            self._index(rows)
+        return rows
+
+    def _index(self, rows):
+        """Enter `rows` into the hash table."""
+        slots = self.slots
+        mask = len(slots) - 1
+        pos = (_hash_tags(self.tags[rows]) & np.uint64(mask)).astype(np.int64)
+        while len(rows):
+            # Of several rows that probe the same free slot, the first one
+            # gets it.  All the others continue with the next slot.
+            free = np.flatnonzero(slots[pos] < 0)
+            winners = free[np.unique(pos[free], return_index=True)[1]]
+            slots[pos[winners]] = rows[winners]
+            placed = np.zeros(len(rows), bool)
+            placed[winners] = True
+            rows = rows[~placed]
+            pos = (pos[~placed] + 1) & mask
+
+
+class _CompactGraph(collections.abc.Mapping):
+    """Memory-efficient replacement for the dictionary `Builder.H`.
+
+    Reading it gives the same results as reading the dictionary: it maps
+    each site to a list ``[site, value, head, value, head, value, ...]``.
+    These lists are created on the fly, such that modifications are done
+    with the dedicated methods instead.
+
+    Each site (or head of a hopping) has an integer id.  Per id, the number
+    of the family, the row of the tag in the `_TagTable` of the family, and
+    the index of the value (-1 for ids that are not sites of the builder)
+    are stored.  The hoppings are stored in compressed sparse row format:
+    the heads of the hoppings of the tail with id ``i`` are
+    ``_heads[_indptr[i]:_indptr[i + 1]]``, and the indices of their values
+    are in `_edge_values` (-1 for deleted hoppings).  New hoppings are
+    collected in the dictionary `_pending` (mapping tail ids to lists
+    ``[head id, value index, ...]``) and merged into the arrays once there
+    are enough of them.
+
+    The values themselves are stored once in `_values`.  Numbers are shared
+    by value, all other values by identity.  Values that are no longer used
+    are dropped from time to time.  Note that each distinct value costs a
+    Python object and a dictionary entry: site-dependent values that are
+    computed while building (e.g. random disorder) undo much of the memory
+    saving, and are better provided by value functions.
+    """
+
+    def __init__(self):
+        self._families = []
+        self._family_numbers = {}
+        self._tables = []
+        self._family_of = np.empty(16, np.int32)
+        self._row_of = np.empty(16, np.int64)
+        self._value_of = np.empty(16, np.int32)
+        self._num_ids = 0
+        self._id_cache = {}
+        self._num_sites = 0
+        self._values = []
+        self._value_keys = []
+        self._value_numbers = {}
+        self._max_values = 1000
+        self._indptr = np.zeros(1, np.int64)
+        self._heads = np.empty(0, np.int64)
+        self._edge_values = np.empty(0, np.int32)
+        self._pending = {}
+        self._num_pending = 0
+        self._num_dead = 0
+
+    #### Sites
+
+    def _table(self, family, ndim):
+        """Return the number of `family` and its `_TagTable`."""
+        number = self._family_numbers.get(family)
+        if number is None:
+            number = self._family_numbers[family] = len(self._families)
+            self._families.append(family)
+            self._tables.append(_TagTable(ndim))
+        table = self._tables[number]
+        if table.tags.shape[1] != ndim:
+            raise ValueError('All the tags of site family {0} must have the '
+                             'same length in a compact builder.'
+                             .format(family))
+        return number, table
+
+    def _new_ids(self, number, rows):
+        ids = np.arange(self._num_ids, self._num_ids + len(rows))
+        self._num_ids += len(rows)
+        self._family_of = _grow(self._family_of, self._num_ids)
+        self._row_of = _grow(self._row_of, self._num_ids)
+        self._value_of = _grow(self._value_of, self._num_ids)
+        self._family_of[ids] = number
+        self._row_of[ids] = rows
+        self._value_of[ids] = -1
+        return ids
+
+    def _id(self, site, add=False):
+        """Return the id of `site`, or -1 if it is unknown and not `add`."""
+        # The same sites tend to be looked up several times in a row, for
+        # example when setting a hopping.  Ids never change, such that the
+        # recently found ones can be cached.
+        cache = self._id_cache
+        i = cache.get(site)
+        if i is not None:
+            return i
+        family, tag = site
+        if not isinstance(tag, ta.ndarray_int):
+            raise TypeError('Compact builders only support sites with tags '
+                            'that are tinyarrays of integers, got {0}.'
+                            .format(repr(tag)))
+        number, table = self._table(family, len(tag))
+        tag = list(tag)
+        row = table.find(tag)
+        if row >= 0:
+            i = int(table.ids[row])
+        elif not add:
+            return -1
+        else:
+            i = self._num_ids
+            row = table.add(tag, i)
+            self._new_ids(number, [row])
+        if len(cache) > 1000:
+            cache.clear()
+        cache[site] = i
+        return i
+
+    def _ids(self, family, tags, add=False):
+        """Return the ids of the sites of `family` with the given tags (a
+        2d array), like `_id` does for single sites."""
+        number, table = self._table(family, tags.shape[1])
+        if not len(tags):
+            return np.empty(0, np.int64)
+        first, inverse = _distinct_rows(tags)
+        unique = tags[first]
+        rows = table.find_many(unique)
+        new = rows < 0
+        if add and np.any(new):
+            ids = np.arange(self._num_ids, self._num_ids + np.count_nonzero(new))
+            rows[new] = table.add_many(unique[new], ids)
+            self._new_ids(number, rows[new])
+        ids = -np.ones(len(unique), np.int64)
+        ids[rows >= 0] = table.ids[rows[rows >= 0]]
+        return ids[inverse]
+
+    def _check_sites(self, family, tags, ids):
+        """Raise a `KeyError` if not all the `ids` are sites."""
+        missing = np.flatnonzero(ids < 0)
+        if not len(missing):
+            missing = np.flatnonzero(self._value_of[ids] < 0)
+        if len(missing):
+            raise KeyError(Site(family, ta.array(tags[missing[0]].tolist()),
+                                True))
+
+    def _site_id(self, site):
+        """Return the id of `site`, which must belong to the graph."""
+        i = self._id(site)
+        if i < 0 or self._value_of[i] < 0:
+            raise KeyError(site)
+        return i
+
+    def _site(self, i):
+        number = self._family_of[i]
+        tag = self._tables[number].tags[self._row_of[i]]
+        return Site(self._families[number], ta.array(tag.tolist()), True)
+
+    def _value_number(self, value):
+        if isinstance(value, numbers.Number):
+            key = (type(value), value)
+        else:
+            key = id(value)
+        number = self._value_numbers.get(key)
+        if number is None:
+            number = self._value_numbers[key] = len(self._values)
+            self._values.append(value)
+            self._value_keys.append(key)
+        return number
+
+    def _collect_values(self, force=False):
+        """Drop the values that are no longer used if there are many values.
+
+        This renumbers the values, so it must only be called when no value
+        numbers are held outside of the arrays and of `_pending`.
+        """
+        if not force and len(self._values) < self._max_values:
+            return
+        value_of = self._value_of[:self._num_ids]
+        edge_values = self._edge_values
+        is_site = value_of >= 0
+        is_edge = edge_values >= 0
+        used = np.zeros(len(self._values), bool)
+        used[value_of[is_site]] = True
+        used[edge_values[is_edge]] = True
+        for pending in self._pending.values():
+            used[pending[1::2]] = True
+        new_number = np.cumsum(used, dtype=np.int32) - 1
+        value_of[is_site] = new_number[value_of[is_site]]
+        edge_values[is_edge] = new_number[edge_values[is_edge]]
+        new_number = new_number.tolist()
+        for pending in self._pending.values():
+            pending[1::2] = [new_number[v] for v in pending[1::2]]
+        used = used.tolist()
+        self._values = [v for v, u in zip(self._values, used) if u]
+        self._value_keys = [k for k, u in zip(self._value_keys, used) if u]
+        self._value_numbers = {k: n for n, k in enumerate(self._value_keys)}
+        self._max_values = max(1000, 2 * len(self._values))
+
+    def __len__(self):
+        return self._num_sites
+
+    def __iter__(self):
+        site = self._site
+        for i in np.flatnonzero(self._value_of[:self._num_ids] >= 0):
+            yield site(i)
+
+    def __contains__(self, site):
+        i = self._id(site)
+        return i >= 0 and self._value_of[i] >= 0
+
+    def __getitem__(self, site):
+        return self._hvhv(self._site_id(site), site)
+
+    def items(self):
+        site = self._site
+        for i in np.flatnonzero(self._value_of[:self._num_ids] >= 0):
+            s = site(i)
+            yield s, self._hvhv(i, s)
+
+    def _hvhv(self, i, site):
+        values = self._values
+        result = [site, values[self._value_of[i]]]
+        for head, value in zip(*self._edges(i)):
+            result.append(self._site(head))
+            result.append(values[value])
+        return result
+
+    def value(self, site):
+        """Return the value of `site`."""
+        return self._values[self._value_of[self._site_id(site)]]
+
+    def set_site(self, site, value):
+        """Add `site` or set its value."""
+        self._collect_values()
+        i = self._id(site, True)
+        if self._value_of[i] < 0:
+            self._num_sites += 1
+        self._value_of[i] = self._value_number(value)
+
+    def set_sites(self, family, tags, value):
+        """Add the sites of `family` with the given tags (a 2d array), or set
+        their values."""
+        self._collect_values()
+        ids = np.unique(self._ids(family, tags, True))
+        self._num_sites += np.count_nonzero(self._value_of[ids] < 0)
+        self._value_of[ids] = self._value_number(value)
+
+    def __delitem__(self, site):
+        i = self._site_id(site)
+        self._value_of[i] = -1
+        self._num_sites -= 1
+        # Delete the hoppings that start at the site.
+        if i < len(self._indptr) - 1:
+            edge_values = self._edge_values[self._indptr[i]:self._indptr[i + 1]]
+            self._num_dead += np.count_nonzero(edge_values >= 0)
+            edge_values[:] = -1
+        self._num_pending -= len(self._pending.pop(i, ())) // 2
+
+    #### Hoppings
+
+    def _edges(self, i):
+        """Return the lists of the head ids and of the value indices of the
+        hoppings of the tail with id `i`."""
+        if i < len(self._indptr) - 1:
+            start, stop = self._indptr[i], self._indptr[i + 1]
+            heads = self._heads[start:stop]
+            values = self._edge_values[start:stop]
+            live = values >= 0
+            heads = heads[live].tolist()
+            values = values[live].tolist()
+        else:
+            heads, values = [], []
+        pending = self._pending.get(i)
+        if pending:
+            heads.extend(pending[::2])
+            values.extend(pending[1::2])
+        return heads, values
+
+    def _find_edge(self, i, j):
+        """Return the position of the hopping from id `i` to id `j` in the
+        compressed sparse rows, or -1."""
+        if i >= len(self._indptr) - 1:
+            return -1
+        start, stop = self._indptr[i : i + 2].tolist()
+        if start == stop:
+            return -1
+        heads = self._heads[start:stop].tolist()
+        k = -1
+        for _ in range(heads.count(j)):
+            k = heads.index(j, k + 1)
+            if self._edge_values[start + k] >= 0:
+                return start + k
+        return -1
+
+    def _missing_edge(self, tail, head):
+        # Report a missing head in the same way as `Builder._get_edge`.
+        if head in self:
+            return KeyError((tail, head))
+        return KeyError(head)
+
+    def get_edge(self, tail, head):
+        """Return the value of the hopping ``(tail, head)``."""
+        i = self._site_id(tail)
+        j = self._id(head)
+        for h, value in zip(*self._edges(i)):
+            if h == j:
+                return self._values[value]
+        raise self._missing_edge(tail, head)
+
+    def has_edge(self, tail, head):
+        i = self._id(tail)
+        if i < 0 or self._value_of[i] < 0:
+            return False
+        j = self._id(head)
+        return j >= 0 and j in self._edges(i)[0]
+
+    def set_edge(self, tail, head, value):
+        """Add the hopping ``(tail, head)`` or set its value."""
+        self._collect_values()
+        i = self._site_id(tail)
+        j = self._id(head, True)
+        value = self._value_number(value)
+        k = self._find_edge(i, j)
+        if k >= 0:
+            self._edge_values[k] = value
+            return
+        pending = self._pending.setdefault(i, [])
+        for k in range(0, len(pending), 2):
+            if pending[k] == j:
+                pending[k + 1] = value
+                return
+        pending.append(j)
+        pending.append(value)
+        self._num_pending += 1
+        if self._num_pending > max(1000, len(self._heads) // 4):
+            self._merge()
+
+    def del_edge(self, tail, head):
+        """Delete the hopping ``(tail, head)``."""
+        i = self._site_id(tail)
+        j = self._id(head)
+        k = self._find_edge(i, j)
+        if k >= 0:
+            self._edge_values[k] = -1
+            self._num_dead += 1
+            if self._num_dead > max(1000, len(self._heads) // 4):
+                self._merge()
+            return
+        pending = self._pending.get(i, ())
+        for k in range(0, len(pending), 2):
+            if pending[k] == j:
+                del pending[k : k + 2]
+                self._num_pending -= 1
+                return
+        raise self._missing_edge(tail, head)
+
+    def set_edges(self, *groups):
+        """Add many hoppings or set their values.
+
+        Each of `groups` is a tuple ``(tail_ids, head_ids, value)``, all the
+        groups having the same length.  The hoppings are set row by row, and
+        within each row in the order of the groups.  If a hopping occurs
+        several times, the value that is set last is kept.
+        """
+        self._collect_values()
+        tails = np.column_stack([tails for tails, heads, value in groups])
+        heads = np.column_stack([heads for tails, heads, value in groups])
+        values = np.empty(tails.shape, np.int32)
+        for n, (_, _, value) in enumerate(groups):
+            values[:, n] = self._value_number(value)
+        self._merge([(tails.ravel(), heads.ravel(), values.ravel())])
+
+    def out_neighbors(self, tail):
+        return [self._site(j) for j in self._edges(self._site_id(tail))[0]]
+
+    def out_degree(self, tail):
+        return len(self._edges(self._site_id(tail))[0])
+
+    def _merge(self, new=()):
+        """Merge the pending hoppings into the compressed sparse rows, and
+        drop the deleted ones.
+
+        `new` is a sequence of triples of arrays ``(tails, heads, values)`` of
+        further hoppings.  They take precedence over existing hoppings.
+        """
+        indptr = self._indptr
+        tails = [np.repeat(np.arange(len(indptr) - 1), np.diff(indptr))]
+        heads = [self._heads]
+        values = [self._edge_values]
+        for tail, pending in self._pending.items():
+            tails.append(tail * np.ones(len(pending) // 2, np.int64))
+            pending = np.array(pending, np.int64).reshape(-1, 2)
+            heads.append(pending[:, 0])
+            values.append(pending[:, 1].astype(np.int32))
+        for new_tails, new_heads, new_values in new:
+            tails.append(new_tails)
+            heads.append(new_heads)
+            values.append(new_values)
+        tails = np.concatenate(tails).astype(np.int64, copy=False)
+        heads = np.concatenate(heads)
+        values = np.concatenate(values)
+        live = values >= 0
+        tails, heads, values = tails[live], heads[live], values[live]
+        if len(new):
+            # Keep only the last occurrence of each hopping.
+            order = np.lexsort((np.arange(len(tails)), heads, tails))
+            last = np.ones(len(order), bool)
+            last[:-1] = ((tails[order[1:]] != tails[order[:-1]]) |
+                         (heads[order[1:]] != heads[order[:-1]]))
+            keep = np.sort(order[last])
+            tails, heads, values = tails[keep], heads[keep], values[keep]
+        # A stable sort keeps the hoppings of each tail in insertion order.
+        order = np.argsort(tails, kind='mergesort')
+        heads_dtype = np.int32 if self._num_ids < 2**31 else np.int64
+        self._heads = heads[order].astype(heads_dtype)
+        self._edge_values = values[order]
+        self._indptr = np.zeros(self._num_ids + 1, np.int64)
+        np.cumsum(np.bincount(tails, minlength=self._num_ids),
+                  out=self._indptr[1:])
+        self._pending = {}
+        self._num_pending = 0
+        self._num_dead = 0
+        self._collect_values(True)
+
+
 class Builder:
     """A tight binding system defined on a graph.
 
@@ -651,6 +1414,8 @@ class Builder:
     ----------
     symmetry : `Symmetry` or `None`
         The symmetry of the system.
+    compact : bool
+        Whether to store the sites and hoppings in a compact form, see notes.
 
     Notes
     -----
@@ -693,6 +1458,18 @@ class Builder:
     are overwritten by those in ``builder1``.  The leads of ``builder1`` are
     appended to the leads of the system being extended.
 
+    A compact builder (``compact=True``) needs much less memory for large
+    systems, at the price of slower access to individual sites and
+    hoppings.  The tags of its sites must be tinyarrays of integers, as for
+    the sites of `kwant.lattice`.  The tags of each site family are stored
+    in an integer array with a hash index, and the hoppings in compressed
+    sparse row format, with an index into a table of the distinct values.
+    Equal numbers share one entry of that table; other values only if they
+    are the same object.  Values that differ from site to site (like random
+    on-site energies) each need an entry, which undoes much of the saving:
+    for such values, prefer value functions.  Compact builders behave like
+    ordinary builders in every other respect.
+
     .. warning::
 
         If functions are used to set values in a builder with a symmetry, then
@@ -729,14 +1506,20 @@ class Builder:
 
     """
 
-    def __init__(self, symmetry=None):
+    _compact = False
+
+    def __init__(self, symmetry=None, compact=False):
         if symmetry is None:
             symmetry = NoSymmetry()
         else:
             ensure_isinstance(symmetry, Symmetry)
         self.symmetry = symmetry
         self.leads = []
-        self.H = {}
+        if compact:
+            self._compact = True
+            self.H = _CompactGraph()
+        else:
+            self.H = {}
 
     #### Note on H ####
     #
@@ -759,8 +1542,14 @@ class Builder:
     # associated with the tail node itself, and it is necessary for the
     # method getkey_tail which helps to conserve memory by storing equal
     # node label only once.
+    #
+    # For compact builders, H is a `_CompactGraph`.  It can be read like the
+    # dictionary, but is modified with its own methods, as done by the methods
+    # below.
 
     def _get_edge(self, tail, head):
+        if self._compact:
+            return self.H.get_edge(tail, head)
         for h, value in edges(self.H[tail]):
             if h == head:
                 return value
@@ -774,6 +1563,9 @@ class Builder:
             raise KeyError(head)
 
     def _set_edge(self, tail, head, value):
+        if self._compact:
+            self.H.set_edge(tail, head, value)
+            return
         hvhv = self.H[tail]
         heads = hvhv[2::2]
         if head in heads:
@@ -785,6 +1577,9 @@ class Builder:
             hvhv.append(value)
 
     def _del_edge(self, tail, head):
+        if self._compact:
+            self.H.del_edge(tail, head)
+            return
         hvhv = self.H[tail]
         heads = hvhv[2::2]
 
@@ -802,10 +1597,14 @@ class Builder:
         del hvhv[i : i + 2]
 
     def _out_neighbors(self, tail):
+        if self._compact:
+            return iter(self.H.out_neighbors(tail))
         hvhv = self.H[tail]
         return islice(hvhv, 2, None, 2)
 
     def _out_degree(self, tail):
+        if self._compact:
+            return self.H.out_degree(tail)
         hvhv = self.H[tail]
         return len(hvhv) // 2 - 1
 
@@ -823,6 +1622,7 @@ class Builder:
             raise ValueError('System to be reversed may not have leads.')
         result.leads = []
         result.H = self.H
+        result._compact = self._compact
         return result
 
     def __bool__(self):
@@ -876,6 +1676,8 @@ class Builder:
         """Get the value of a single site or hopping."""
         if isinstance(key, Site):
             site = self.symmetry.to_fd(key)
+            if self._compact:
+                return self.H.value(site)
             return self.H[site][1]
 
         sym = self.symmetry
@@ -902,6 +1704,8 @@ class Builder:
 
         validate_hopping(key)
         a, b = self.symmetry.to_fd(*key)
+        if self._compact:
+            return self.H.has_edge(a, b)
         hvhv = self.H.get(a, ())
         return b in islice(hvhv, 2, None, 2)
 
@@ -910,6 +1714,9 @@ class Builder:
         if not isinstance(site, Site):
             raise TypeError('Expecting a site, got {0} instead.'.format(type(site).__name__))
         site = self.symmetry.to_fd(site)
+        if self._compact:
+            self.H.set_site(site, value)
+            return
         hvhv = self.H.setdefault(site, [])
         if hvhv:
             hvhv[1] = value
@@ -923,10 +1730,16 @@ class Builder:
         a, b = sym.to_fd(*hopping)
 
         if sym.in_fd(b):
-            # Make sure that we do not waste space by storing multiple instances
-            # of identical sites.
-            a2 = a = self.H[a][0]
-            b2 = b = self.H[b][0]
+            if self._compact:
+                for site in (a, b):
+                    if site not in self.H:
+                        raise KeyError(site)
+                a2, b2 = a, b
+            else:
+                # Make sure that we do not waste space by storing multiple
+                # instances of identical sites.
+                a2 = a = self.H[a][0]
+                b2 = b = self.H[b][0]
         else:
             b2, a2 = sym.to_fd(b, a)
             assert not sym.in_fd(a2)
@@ -952,6 +1765,146 @@ class Builder:
                         else self._set_hopping)
             func(sh, value)
 
+    def add_sites(self, family, tags, value):
+        """Add many sites of one family, or set their values.
+
+        This is equivalent to, but much faster than ::
+
+            for tag in tags:
+                builder[family(*tag)] = value
+
+        Parameters
+        ----------
+        family : `SiteFamily`
+            The family of the sites.  Its tags must be sequences of integers,
+            as for the lattices of `kwant.lattice`.
+        tags : 2d array of integers
+            The tags of the sites, one per row.
+        value : object
+            The value of all the sites.
+
+        Notes
+        -----
+        The tags are mapped to the fundamental domain of the symmetry of the
+        builder all at once, using `Symmetry.which_tags` and
+        `Symmetry.act_tags`.  Sites that occur several times are only
+        added once.
+        """
+        tags = _tag_array(family, tags)
+        sym = self.symmetry
+        if sym.num_directions and len(tags):
+            tags = sym.act_tags(-sym.which_tags(family, tags), family, tags)
+        tags = _unique_rows(tags)
+        if self._compact:
+            self.H.set_sites(family, tags, value)
+            return
+        H = self.H
+        for tag in tags.tolist():
+            site = Site(family, ta.array(tag), True)
+            hvhv = H.get(site)
+            if hvhv:
+                hvhv[1] = value
+            else:
+                H[site] = [site, value]
+
+    def add_hoppings(self, family_a, tags_a, family_b, tags_b, value):
+        """Add many hoppings between two site families, or set their values.
+
+        This is equivalent to, but much faster than ::
+
+            for tag_a, tag_b in zip(tags_a, tags_b):
+                builder[family_a(*tag_a), family_b(*tag_b)] = value
+
+        Parameters
+        ----------
+        family_a, family_b : `SiteFamily`
+            The families of the sites that are connected by the hoppings.
+        tags_a, tags_b : 2d arrays of integers
+            The tags of the sites, one hopping per row.
+        value : object
+            The value of all the hoppings.
+
+        Raises
+        ------
+        KeyError
+            If not all the sites are present in the builder.  In that case,
+            no hopping is added.
+
+        Notes
+        -----
+        The hoppings are mapped to the fundamental domain of the symmetry of
+        the builder all at once, using `Symmetry.which_tags` and
+        `Symmetry.act_tags`.  Hoppings that occur several times are only
+        added once.
+        """
+        tags_a = _tag_array(family_a, tags_a)
+        tags_b = _tag_array(family_b, tags_b)
+        if len(tags_a) != len(tags_b):
+            raise ValueError('tags_a and tags_b must have the same length.')
+        if family_a == family_b and tags_a.shape == tags_b.shape:
+            loops = np.flatnonzero(np.all(tags_a == tags_b, axis=1))
+            if len(loops):
+                site = Site(family_a, ta.array(tags_a[loops[0]].tolist()))
+                raise ValueError('A hopping connects the following site to '
+                                 'itself:\n{0}'.format(site))
+
+        #### Map the hoppings to the fundamental domain.
+        sym = self.symmetry
+        if sym.num_directions and len(tags_a):
+            element = -sym.which_tags(family_a, tags_a)
+            tags_a = sym.act_tags(element, family_a, tags_a)
+            tags_b = sym.act_tags(element, family_b, tags_b)
+        num_a = tags_a.shape[1]
+        pairs = _unique_rows(np.hstack([tags_a, tags_b]))
+        tags_a, tags_b = pairs[:, :num_a], pairs[:, num_a:]
+        # The reversed hoppings, with the first site in the fundamental domain.
+        tags_b2, tags_a2 = tags_b, tags_a
+        if sym.num_directions and len(tags_a):
+            element = sym.which_tags(family_b, tags_b)
+            outside = np.flatnonzero(np.any(element != 0, axis=1))
+            if len(outside):
+                tags_b2, tags_a2 = tags_b.copy(), tags_a.copy()
+                tags_b2[outside] = sym.act_tags(-element[outside], family_b,
+                                                tags_b[outside])
+                tags_a2[outside] = sym.act_tags(-element[outside], family_a,
+                                                tags_a[outside])
+
+        if isinstance(value, HermConjOfFunc):
+            # Avoid nested HermConjOfFunc instances.
+            value, reverse_value = Other, value.function
+        else:
+            reverse_value = Other
+
+        if self._compact:
+            H = self.H
+            ids_a = H._ids(family_a, tags_a)
+            H._check_sites(family_a, tags_a, ids_a)
+            ids_b2 = H._ids(family_b, tags_b2)
+            H._check_sites(family_b, tags_b2, ids_b2)
+            H.set_edges((ids_a, H._ids(family_b, tags_b, True), value),
+                        (ids_b2, H._ids(family_a, tags_a2, True),
+                         reverse_value))
+            return
+
+        # Looking up the sites checks that they are present, and makes sure
+        # that we do not waste space by storing multiple instances of
+        # identical sites.
+        H = self.H
+        sites_a = [H[Site(family_a, ta.array(tag), True)][0]
+                   for tag in tags_a.tolist()]
+        sites_b2 = [H[Site(family_b, ta.array(tag), True)][0]
+                    for tag in tags_b2.tolist()]
+        if tags_b2 is tags_b:
+            sites_b, sites_a2 = sites_b2, sites_a
+        else:
+            sites_b = [Site(family_b, ta.array(tag), True)
+                       for tag in tags_b.tolist()]
+            sites_a2 = [Site(family_a, ta.array(tag), True)
+                        for tag in tags_a2.tolist()]
+        for a, b, b2, a2 in zip(sites_a, sites_b, sites_b2, sites_a2):
+            self._set_edge(a, b, value)
+            self._set_edge(b2, a2, reverse_value)
+
     def _del_site(self, site):
         """Delete a single site and all associated hoppings."""
         if not isinstance(site, Site):
@@ -1302,11 +2255,24 @@ class Builder:
         result.site_ranges = _site_ranges(sites)
         result.id_by_site = id_by_site
         result.leads = finalized_leads
+        edges = np.array(list(g), int).reshape(-1, 2)
         result.hoppings = [self._get_edge(sites[tail], sites[head])
-                           for tail, head in g]
+                           for tail, head in edges]
         result.onsite_hamiltonians = [self.H[site][1] for site in sites]
         result.lead_interfaces = lead_interfaces
         result.symmetry = self.symmetry
+
+        #### Index the values, for fast assembly of the Hamiltonian.
+        result._edges = edges
+        result._onsite_groups = _group_by_value(result.onsite_hamiltonians)
+        hopping_groups = _group_by_value(result.hoppings)
+        result._conj_edges = np.zeros(len(edges), bool)
+        for value, edge_ids in hopping_groups:
+            if value is Other:
+                result._conj_edges[edge_ids] = True
+        result._hopping_groups = [(value, edge_ids)
+                                  for value, edge_ids in hopping_groups
+                                  if value is not Other]
         return result
 
     def _finalized_infinite(self, interface_order=None):
@@ -1444,13 +2410,116 @@ class Builder:
 
 ################ Finalized systems
 
+_shape_msg = ('Hopping from site {0} to site {1} does not match the '
+              'dimensions of onsite Hamiltonians of these sites.')
+
+
 def _raise_user_error(exc, func):
     msg = ('Error occurred in user-supplied value function "{0}".\n'
            'See the upper part of the above backtrace for more information.')
     raise UserCodeError(msg.format(func.__name__)) from exc
 
 
-class FiniteSystem(system.FiniteSystem):
+def _value_name(value):
+    if isinstance(value, HermConjOfFunc):
+        value = value.function
+    return getattr(value, '__qualname__', None) or type(value).__qualname__
+
+
+ValueProfileRow = namedtuple('ValueProfileRow',
+                             ['name', 'calls', 'evaluations', 'time'])
+
+
+class ValueProfile:
+    """Calls of value functions and time spent in them.
+
+    Returned by ``value_profile`` of finalized builders.  Value functions are
+    identified by their ``__qualname__``, such that all the functions created
+    by the same ``lambda`` expression or closure share one entry.  Printing
+    the profile shows a table with the most expensive functions first.
+
+    Notes
+    -----
+    A vectorized value function (see `vectorized`) is called once for many
+    sites or hoppings: one call, but many evaluations are counted.
+    """
+
+    def __init__(self):
+        self._entries = {}
+
+    def call(self, value, num_evaluations, func, *args):
+        """Return ``func(*args)`` and add the time spent to `value`."""
+        start = time.perf_counter()
+        try:
+            return func(*args)
+        finally:
+            elapsed = time.perf_counter() - start
+            name = _value_name(value)
+            entry = self._entries.get(name)
+            if entry is None:
+                entry = self._entries[name] = [0, 0, 0.]
+            entry[0] += 1
+            entry[1] += num_evaluations
+            entry[2] += elapsed
+
+    def rows(self):
+        """Return a list of `ValueProfileRow`, by decreasing time."""
+        rows = [ValueProfileRow(name, *entry)
+                for name, entry in self._entries.items()]
+        rows.sort(key=lambda row: row.time, reverse=True)
+        return rows
+
+    def total(self):
+        """Return the total time spent in value functions."""
+        return sum(entry[2] for entry in self._entries.values())
+
+    def __str__(self):
+        total = self.total()
+        rows = self.rows()
+        width = max([len(row.name) for row in rows] + [8]) + 2
+        lines = ['{:<{}}{:>10}{:>12}{:>12}{:>8}'.format(
+            'function', width, 'calls', 'evaluations', 'time (s)', 'share')]
+        for row in rows:
+            lines.append('{:<{}}{:>10}{:>12}{:>12.4g}{:>7.1f}%'.format(
+                row.name, width, row.calls, row.evaluations, row.time,
+                100 * row.time / total if total else 0))
+        return '\n'.join(lines)
+
+
+class _ValueProfiling:
+    """Methods of finalized builders to profile their value functions."""
+
+    # Checked before each call of a value function, such that the profiling
+    # costs nothing when disabled.
+    _value_profile = None
+
+    def enable_value_profile(self):
+        """Count the calls of value functions and the time spent in them.
+
+        Once enabled, all evaluations of the Hamiltonian, be it by
+        ``hamiltonian``, ``hamiltonian_submatrix`` or the solvers, are
+        recorded until `disable_value_profile` is called.  Calling this
+        method again discards the recorded data.
+        """
+        self._value_profile = ValueProfile()
+
+    def disable_value_profile(self):
+        """Stop profiling the value functions and discard the data."""
+        self._value_profile = None
+
+    def value_profile(self):
+        """Return the profile of the value functions.
+
+        Returns
+        -------
+        profile : `ValueProfile` or ``None``
+            The calls and times of all the value functions since profiling
+            was enabled, or ``None`` if profiling is not enabled.
+        """
+        return self._value_profile
+
+
+class FiniteSystem(_ValueProfiling, system.FiniteSystem):
     """Finalized `Builder` with leads.
 
     Usable as input for the solvers in `kwant.solvers`.
@@ -1465,12 +2534,26 @@ class FiniteSystem(system.FiniteSystem):
         The inverse of ``sites``; maps from ``i`` to ``sites[i]``.
     """
 
+    # The values of the system are additionally indexed when finalizing:
+    #
+    # _edges: int array with one row ``(tail, head)`` per edge id of `graph`.
+    # _onsite_groups: list of ``(value, site_ids)``, where `site_ids` are all
+    #     the sites whose onsite value is the object `value`.
+    # _hopping_groups: likewise, list of ``(value, edge_ids)``, for all the
+    #     edges that are not marked as `Other`.
+    # _conj_edges: bool array, true for the edges marked as `Other`, i.e.
+    #     whose value is the Hermitian conjugate of the reverse edge.
+
     def hamiltonian(self, i, j, *args):
         if i == j:
             value = self.onsite_hamiltonians[i]
             if callable(value):
                 try:
-                    value = value(self.sites[i], *args)
+                    if self._value_profile is None:
+                        value = value(self.sites[i], *args)
+                    else:
+                        value = self._value_profile.call(
+                            value, 1, value, self.sites[i], *args)
                 except Exception as exc:
                     _raise_user_error(exc, value)
         else:
@@ -1484,13 +2567,267 @@ class FiniteSystem(system.FiniteSystem):
             if callable(value):
                 sites = self.sites
                 try:
-                    value = value(sites[i], sites[j], *args)
+                    if self._value_profile is None:
+                        value = value(sites[i], sites[j], *args)
+                    else:
+                        value = self._value_profile.call(
+                            value, 1, value, sites[i], sites[j], *args)
                 except Exception as exc:
                     _raise_user_error(exc, value)
             if conj:
                 value = herm_conj(value)
         return value
 
+    def _callable_groups(self):
+        """Return the groups of sites and hoppings with value functions.
+
+        The result is a pair of lists ``(onsites, hoppings)`` with one entry
+        ``(value, ids, parts)`` per value function.  `ids` are the site ids
+        (for `onsites`) or the edge ids (for `hoppings`) that share the value.
+        For vectorized value functions, `parts` is a list of ``(selection,
+        site_arrays)``, one for each combination of site families, where
+        `selection` indexes into `ids` and `site_arrays` is a tuple of
+        `SiteArray` instances to be passed to the function.  For ordinary
+        value functions, `parts` is ``None``.
+        """
+        try:
+            return self._callable_groups_cache
+        except AttributeError:
+            pass
+        sites = self.sites
+
+        def split(value, elements):
+            # `elements` has one row of site ids per site or hopping.
+            if not isinstance(value, VectorizedFunction):
+                return None
+            selections = {}
+            for k, element in enumerate(elements):
+                key = tuple(sites[i].family for i in element)
+                selections.setdefault(key, []).append(k)
+            parts = []
+            for families, selection in selections.items():
+                selection = np.array(selection)
+                site_arrays = tuple(
+                    SiteArray(family, np.array([sites[i].tag for i in ids]))
+                    for family, ids in zip(families, elements[selection].T))
+                parts.append((selection, site_arrays))
+            return parts
+
+        onsites = [(value, site_ids, split(value, site_ids[:, None]))
+                   for value, site_ids in self._onsite_groups
+                   if callable(value)]
+        hoppings = [(value, edge_ids, split(value, self._edges[edge_ids]))
+                    for value, edge_ids in self._hopping_groups
+                    if callable(value)]
+        self._callable_groups_cache = result = onsites, hoppings
+        return result
+
+    def _evaluate(self, value, elements, parts, args):
+        """Evaluate a value function for many sites or hoppings.
+
+        Return a list of pairs ``(selection, values)``, where `values` is
+        either a complex array of shape ``(len(selection), m, n)`` or a list
+        of matrices.
+        """
+        profile = self._value_profile
+        if parts is None:
+            sites = self.sites
+            values = []
+            for element in elements.tolist():
+                try:
+                    if profile is None:
+                        h = value(*([sites[i] for i in element] + list(args)))
+                    else:
+                        h = profile.call(value, 1, value,
+                                         *([sites[i] for i in element]
+                                           + list(args)))
+                except Exception as exc:
+                    _raise_user_error(exc, value)
+                values.append(ta.matrix(h, complex))
+            return [(slice(None), values)]
+        result = []
+        for selection, site_arrays in parts:
+            try:
+                if profile is None:
+                    h = value.evaluate(site_arrays, args)
+                else:
+                    h = profile.call(value, len(selection), value.evaluate,
+                                     site_arrays, args)
+            except Exception as exc:
+                _raise_user_error(exc, value)
+            result.append((selection, h))
+        return result
+
+    def _assembly_layout(self, norb):
+        """Return the positions of all the Hamiltonian matrix elements.
+
+        The result is a tuple ``(rows, cols, data, onsite_starts,
+        hopping_starts, num_hoppings)``.  `data` contains the constant
+        values, and zeros for the values given by functions.  It consists of
+        the onsite entries, the entries of the hoppings that are not marked as
+        `Other` (`num_hoppings` of them), and the Hermitian conjugates of the
+        latter, in the same order.  For each value function, there is an array
+        of the positions in `data` at which the blocks of the individual sites
+        or hoppings start, in `onsite_starts` and `hopping_starts`.  These
+        blocks are stored completely, in row-major order, while for constant
+        values only the nonzero entries are kept.
+        """
+        off = np.zeros(len(norb) + 1, int)
+        off[1:] = np.cumsum(norb)
+        all_rows = [np.empty(0, int)]
+        all_cols = [np.empty(0, int)]
+        all_data = [np.empty(0, complex)]
+        size = 0
+
+        def add_groups(groups, blocks, all_starts):
+            nonlocal size
+            for value, ids in groups:
+                tails, heads = blocks(ids)
+                if callable(value):
+                    nrows = norb[tails]
+                    ncols = norb[heads]
+                    sizes = nrows * ncols
+                    starts = np.cumsum(sizes) - sizes
+                    block = np.repeat(np.arange(len(ids)), sizes)
+                    k = np.arange(len(block)) - starts[block]
+                    ncols = ncols[block]
+                    rows = off[tails][block] + k // ncols
+                    cols = off[heads][block] + k % ncols
+                    data = np.zeros(len(rows), complex)
+                    all_starts.append(starts + size)
+                else:
+                    h = np.asarray(ta.matrix(value, complex))
+                    bad = np.flatnonzero((norb[tails] != h.shape[0]) |
+                                         (norb[heads] != h.shape[1]))
+                    if len(bad):
+                        raise ValueError(_shape_msg.format(heads[bad[0]],
+                                                           tails[bad[0]]))
+                    i, j = np.nonzero(h)
+                    rows = (off[tails][:, None] + i).ravel()
+                    cols = (off[heads][:, None] + j).ravel()
+                    data = np.tile(h[i, j], len(ids))
+                all_rows.append(rows)
+                all_cols.append(cols)
+                all_data.append(data)
+                size += len(rows)
+
+        onsite_starts = []
+        add_groups(self._onsite_groups, lambda ids: (ids, ids), onsite_starts)
+        num_onsites = size
+        hopping_starts = []
+        add_groups(self._hopping_groups, lambda ids: self._edges[ids].T,
+                   hopping_starts)
+
+        rows = np.concatenate(all_rows)
+        cols = np.concatenate(all_cols)
+        data = np.concatenate(all_data)
+        hops = slice(num_onsites, None)
+        return (np.concatenate([rows, cols[hops]]).astype(gint_dtype),
+                np.concatenate([cols, rows[hops]]).astype(gint_dtype),
+                np.concatenate([data, data[hops].conjugate()]),
+                onsite_starts, hopping_starts, size - num_onsites)
+
+    def _hamiltonian_full(self, args, sparse):
+        """Assemble the full Hamiltonian, reusing its constant part.
+
+        Used by `~kwant.system.System.hamiltonian_submatrix`.  Return the
+        Hamiltonian and the numbers of orbitals of all sites.
+
+        The positions of all the matrix elements and the constant values are
+        computed once and cached, such that subsequent calls only evaluate
+        the value functions and fill in their values.
+        """
+        onsites, hoppings = self._callable_groups()
+        edges = self._edges
+
+        #### Evaluate the onsite value functions, they determine the numbers
+        #### of orbitals.
+        onsite_values = []
+        onsite_norbs = []
+        for value, site_ids, parts in onsites:
+            values = self._evaluate(value, site_ids[:, None], parts, args)
+            for selection, h in values:
+                if isinstance(h, np.ndarray):
+                    shapes = np.resize(h.shape[1:], (len(h), 2))
+                else:
+                    shapes = np.array([x.shape for x in h], int)
+                bad = np.flatnonzero(shapes[:, 0] != shapes[:, 1])
+                if len(bad):
+                    site = site_ids[selection][bad[0]]
+                    raise ValueError(_shape_msg.format(site, site))
+                onsite_norbs.append((site_ids[selection], shapes[:, 0]))
+            onsite_values.append(values)
+
+        try:
+            layout = self._assembly_cache
+        except AttributeError:
+            layout = None
+        if layout is not None:
+            norb = layout[0]
+            if not all(np.array_equal(norb[ids], n) for ids, n in onsite_norbs):
+                layout = None
+        if layout is None:
+            norb = np.empty(self.graph.num_nodes, gint_dtype)
+            for value, site_ids in self._onsite_groups:
+                if not callable(value):
+                    h = ta.matrix(value, complex)
+                    if h.shape[0] != h.shape[1]:
+                        raise ValueError(_shape_msg.format(site_ids[0],
+                                                           site_ids[0]))
+                    norb[site_ids] = h.shape[0]
+            for ids, n in onsite_norbs:
+                norb[ids] = n
+            layout = (norb,) + self._assembly_layout(norb)
+            self._assembly_cache = layout
+        (norb, rows, cols, data, onsite_starts, hopping_starts,
+         num_hoppings) = layout
+
+        #### Fill in the values of the value functions.
+        data = data.copy()
+
+        def fill(starts, values, tails, heads, conj_offset=None):
+            for selection, h in values:
+                sel_starts = starts[selection]
+                if isinstance(h, np.ndarray):
+                    bad = np.flatnonzero(
+                        (norb[tails[selection]] != h.shape[1]) |
+                        (norb[heads[selection]] != h.shape[2]))
+                    if len(bad):
+                        raise ValueError(_shape_msg.format(
+                            heads[selection][bad[0]], tails[selection][bad[0]]))
+                    h = h.reshape(len(h), -1)
+                    idx = sel_starts[:, None] + np.arange(h.shape[1])
+                    data[idx] = h
+                    if conj_offset is not None:
+                        data[idx + conj_offset] = h.conjugate()
+                    continue
+                for start, x, tail, head in zip(sel_starts, h, tails[selection],
+                                                heads[selection]):
+                    if x.shape != (norb[tail], norb[head]):
+                        raise ValueError(_shape_msg.format(head, tail))
+                    x = np.asarray(x).ravel()
+                    data[start : start + len(x)] = x
+                    if conj_offset is not None:
+                        start += conj_offset
+                        data[start : start + len(x)] = x.conjugate()
+
+        for (value, site_ids, parts), starts, values in zip(
+                onsites, onsite_starts, onsite_values):
+            fill(starts, values, site_ids, site_ids)
+        for (value, edge_ids, parts), starts in zip(hoppings, hopping_starts):
+            values = self._evaluate(value, edges[edge_ids], parts, args)
+            tails, heads = edges[edge_ids].T
+            fill(starts, values, tails, heads, num_hoppings)
+
+        size = int(np.sum(norb))
+        if sparse:
+            mat = sp.coo_matrix((data, (rows.copy(), cols.copy())),
+                                shape=(size, size))
+        else:
+            mat = np.zeros((size, size), complex)
+            mat[rows, cols] = data
+        return mat, norb.copy()
+
     def site(self, i):
         warnings.warn("The function `site` will disappear after Kwant 1.1.  "
                       "Use `sites` instead.", KwantDeprecationWarning,
@@ -1501,7 +2838,7 @@ class FiniteSystem(system.FiniteSystem):
         return self.sites[i].pos
 
 
-class InfiniteSystem(system.InfiniteSystem):
+class InfiniteSystem(_ValueProfiling, system.InfiniteSystem):
     """Finalized infinite system, extracted from a `Builder`.
 
     Attributes
@@ -1526,8 +2863,13 @@ class InfiniteSystem(system.InfiniteSystem):
                 i -= self.cell_size
             value = self.onsite_hamiltonians[i]
             if callable(value):
+                site = self.symmetry.to_fd(self.sites[i])
                 try:
-                    value = value(self.symmetry.to_fd(self.sites[i]), *args)
+                    if self._value_profile is None:
+                        value = value(site, *args)
+                    else:
+                        value = self._value_profile.call(value, 1, value,
+                                                         site, *args)
                 except Exception as exc:
                     _raise_user_error(exc, value)
         else:
@@ -1544,7 +2886,11 @@ class InfiniteSystem(system.InfiniteSystem):
                 site_j = sites[j]
                 site_i, site_j = self.symmetry.to_fd(site_i, site_j)
                 try:
-                    value = value(site_i, site_j, *args)
+                    if self._value_profile is None:
+                        value = value(site_i, site_j, *args)
+                    else:
+                        value = self._value_profile.call(value, 1, value,
+                                                         site_i, site_j, *args)
                 except Exception as exc:
                     _raise_user_error(exc, value)
             if conj:
@@ -22,8 +22,10 @@ this module.
 from math import pi, log, sqrt, cos
 from hashlib import md5
 from struct import unpack
+import numpy as np
+from . import _digest
 
-__all__ = ['uniform', 'gauss', 'test']
+__all__ = ['uniform', 'gauss', 'uniform_array', 'gauss_array', 'test']
 
 
 TWOPI = 2 * pi
@@ -72,6 +74,55 @@ def gauss(input, salt=''):
     return cos(a * TWOPI) * sqrt(-2.0 * log(1.0 - b))
 
 
+def _byte_rows(input):
+    """Return the bytes of each element of `input` as rows of a 2d array.
+
+    Integers are converted to C long and real numbers to double, such that
+    the bytes are the same as those of the corresponding tinyarrays.
+    """
+    input = np.asarray(input)
+    if input.ndim == 0:
+        raise ValueError('Input must be an array of at least one dimension.')
+    if input.dtype.kind in 'biu':
+        input = input.astype(np.dtype('l'), copy=False)
+    elif input.dtype.kind == 'f':
+        input = input.astype(float, copy=False)
+    elif input.dtype.kind == 'c':
+        input = input.astype(complex, copy=False)
+    input = np.ascontiguousarray(input).view(np.uint8)
+    return input.reshape(input.shape[0], int(np.prod(input.shape[1:])))
+
+
+def uniform2_array(input, salt=''):
+    """Vectorized `uniform2`: return two arrays of [0,1)-distributed
+    numbers."""
+    return _digest.uniform2_rows(_byte_rows(input), str_to_bytes(salt))
+
+
+def uniform_array(input, salt=''):
+    """Vectorized version of `uniform`.
+
+    `input` is an array whose first axis runs over the inputs, e.g. an array
+    of shape ``(N, d)`` with the tags of ``N`` sites.  Return an array of
+    length ``N`` whose n-th element is equal to ``uniform(input[n], salt)``,
+    where ``input[n]`` is converted to a tinyarray.  Integer inputs are thus
+    hashed as C long integers and real inputs as doubles.
+
+    The hashing is done in a compiled loop and does not create any Python
+    objects per element.
+    """
+    return uniform2_array(input, salt)[0]
+
+
+def gauss_array(input, salt=''):
+    """Vectorized version of `gauss`.
+
+    See `uniform_array` for the meaning of `input`.  Return an array whose
+    n-th element is equal to ``gauss(input[n], salt)``.
+    """
+    return _digest.box_muller(uniform2_array(input, salt))
+
+
 def test(n=20000):
     """Test the generator with the dieharder suite generating n**2 samples.
 
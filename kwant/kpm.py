@@ -0,0 +1,257 @@
+# Copyright 2011-2016 Kwant authors.
+#
+# This file is part of Kwant.  It is subject to the license terms in the file
+# LICENSE.rst found in the top-level directory of this distribution and at
+# http://kwant-project.org/license.  A list of Kwant authors can be found in
+# the file AUTHORS.rst at the top-level directory of this distribution and at
+# http://kwant-project.org/authors.
+
+"""Spectral densities of large systems with the kernel polynomial method"""
+
+__all__ = ['SpectralDensity', 'jackson_kernel']
+
+import numpy as np
+from . import system, digest
+from ._common import ensure_isinstance
+
+
+def jackson_kernel(num_moments):
+    """Return the Jackson kernel coefficients for `num_moments` moments.
+
+    The coefficients damp the Gibbs oscillations of a truncated Chebyshev
+    expansion, such that a delta peak is broadened into an approximately
+    Gaussian peak of width ``pi / num_moments`` (in rescaled units).
+    """
+    n = np.arange(num_moments)
+    q = np.pi / (num_moments + 1)
+    return ((num_moments - n + 1) * np.cos(q * n)
+            + np.sin(q * n) / np.tan(q)) / (num_moments + 1)
+
+
+def _bounds(ham):
+    """Return lower and upper bounds of the spectrum of `ham`.
+
+    The bounds follow from the Gershgorin circle theorem and are obtained in
+    a single pass over the nonzero entries.
+    """
+    ham = ham.tocoo()
+    size = ham.shape[0]
+    if not size:
+        return 0., 0.
+    on_diag = ham.row == ham.col
+    diag = np.bincount(ham.row[on_diag], ham.data[on_diag].real, size)
+    radius = np.bincount(ham.row, abs(ham.data), size) - abs(diag)
+    return (diag - radius).min(), (diag + radius).max()
+
+
+def _random_vectors(size, first, num, salt):
+    """Return `num` random phase vectors of length `size` as columns.
+
+    The vector with index ``n`` is the same whatever the values of `first`
+    and `num`, as its random number generator is seeded with
+    ``kwant.digest.uniform`` of ``n`` and `salt`.
+    """
+    vectors = np.empty((size, num), complex)
+    for i in range(num):
+        seed = int(digest.uniform(str(first + i), salt) * 2**32)
+        phases = np.random.RandomState(seed).random_sample(size)
+        vectors[:, i] = np.exp(2j * np.pi * phases)
+    return vectors
+
+
+class SpectralDensity:
+    """Density of states of a finite system by the kernel polynomial method.
+
+    The Hamiltonian, rescaled to have its spectrum within ``(-1, 1)``, is
+    expanded in Chebyshev polynomials.  The expansion coefficients (moments)
+    are traces that are estimated stochastically with random phase vectors,
+    only requiring products of the sparse Hamiltonian with vectors.  The
+    truncated expansion is damped with the Jackson kernel.
+
+    Parameters
+    ----------
+    sys : `kwant.system.FiniteSystem`
+        The low level system.  Its leads are ignored.
+    args : tuple, defaults to empty
+        Positional arguments to pass to the ``hamiltonian`` method.
+    num_moments : integer
+        Number of Chebyshev moments.  The energy resolution is roughly
+        ``pi * (upper - lower) / (2 * num_moments)``.
+    num_vectors : integer
+        Number of random vectors for the stochastic trace estimation.
+    orbitals : sequence of integers or ``None``
+        If given, the local density of states of these orbitals is computed
+        exactly, each orbital taking the place of a random vector, and
+        `num_vectors` is ignored.
+    bounds : pair of real numbers or ``None``
+        Lower and upper bound of the spectrum.  If not given, bounds are
+        obtained from the Gershgorin circle theorem.
+    eps : float
+        Safety margin: the spectrum is rescaled to ``(-1 + eps / 2, 1 - eps /
+        2)``.
+    salt : string
+        Salt of the random vectors.  Different salts give statistically
+        independent estimates.
+    num_threads : integer
+        Number of threads for the products of the Hamiltonian with vectors,
+        see ``kwant._system.BlockSparseMatrix.dot``.
+
+    Attributes
+    ----------
+    num_moments : integer
+        The number of moments computed so far.
+    num_vectors : integer
+        The number of random vectors (or orbitals) used so far.
+
+    Notes
+    -----
+    The Hamiltonian is stored as returned by
+    `~kwant.system.System.hamiltonian_blocks`.  Besides the Hamiltonian, four
+    vectors per random vector (or orbital) are held in memory: the random
+    vector itself, the last two vectors of the Chebyshev recursion, and a
+    temporary.  This allows to add moments and vectors later on with
+    `add_moments` and `add_vectors` without repeating any work.
+
+    The random vectors are reproducible: for a given `salt`, the n-th random
+    vector is always the same.
+    """
+
+    def __init__(self, sys, args=(), num_moments=100, num_vectors=10,
+                 orbitals=None, bounds=None, eps=0.05, salt='',
+                 num_threads=1):
+        syst = sys  # ensure consistent naming across function bodies
+        ensure_isinstance(syst, system.FiniteSystem)
+        if num_moments < 2:
+            raise ValueError('At least two moments are needed.')
+        self._ham = ham = syst.hamiltonian_blocks(args)
+        self._num_threads = num_threads
+        if bounds is None:
+            bounds = _bounds(ham)
+        lower, upper = bounds
+        self._a = (upper - lower) / (2 - eps)
+        if self._a <= 0:
+            # A spectrum that is a single point, e.g. no hoppings.
+            self._a = 1.
+        self._b = (upper + lower) / 2
+        self._salt = salt
+        self._orbitals = None if orbitals is None else np.asarray(orbitals)
+
+        self.num_moments = num_moments
+        self.num_vectors = 0
+        # Each block is a list [vectors, previous, current, moments] for a
+        # set of random vectors (columns) whose moments are computed together.
+        self._blocks = []
+        if orbitals is None:
+            self.add_vectors(num_vectors)
+        else:
+            self._add_block(len(self._orbitals))
+
+    def _add_block(self, num):
+        size = self._ham.shape[0]
+        if self._orbitals is None:
+            vectors = _random_vectors(size, self.num_vectors, num, self._salt)
+        else:
+            vectors = np.zeros((size, num), complex)
+            vectors[self._orbitals, np.arange(num)] = 1
+        current = self._apply(vectors)
+        moments = np.empty((self.num_moments, num), complex)
+        moments[0] = np.einsum('ij,ij->j', vectors.conj(), vectors)
+        moments[1] = np.einsum('ij,ij->j', vectors.conj(), current)
+        block = [vectors, vectors, current, moments]
+        self._extend(block, 2, self.num_moments)
+        self._blocks.append(block)
+        self.num_vectors += num
+
+    def _apply(self, vectors):
+        """Apply the rescaled Hamiltonian to `vectors`."""
+        return ((self._ham.dot(vectors, self._num_threads) - self._b * vectors)
+                / self._a)
+
+    def _extend(self, block, start, stop):
+        """Compute the moments ``start`` to ``stop - 1`` of `block`."""
+        vectors, previous, current, moments = block
+        for n in range(start, stop):
+            previous, current = current, 2 * self._apply(current) - previous
+            moments[n] = np.einsum('ij,ij->j', vectors.conj(), current)
+        block[1:3] = previous, current
+
+    def add_moments(self, num_moments):
+        """Increase the number of moments by `num_moments`."""
+        if num_moments < 0:
+            raise ValueError('The number of moments must be positive.')
+        start = self.num_moments
+        self.num_moments += num_moments
+        for block in self._blocks:
+            moments = block[3]
+            block[3] = np.empty((self.num_moments, moments.shape[1]), complex)
+            block[3][:start] = moments
+            self._extend(block, start, self.num_moments)
+
+    def add_vectors(self, num_vectors):
+        """Increase the number of random vectors by `num_vectors`."""
+        if self._orbitals is not None:
+            raise ValueError('No random vectors are used for the local '
+                             'density of states.')
+        if num_vectors < 0:
+            raise ValueError('The number of vectors must be positive.')
+        if num_vectors:
+            self._add_block(num_vectors)
+
+    def _moments(self):
+        moments = np.hstack([block[3] for block in self._blocks]).real
+        if self._orbitals is None:
+            return moments.mean(axis=1)
+        return moments
+
+    @property
+    def energies(self):
+        """The default energies at which the density is evaluated.
+
+        These are ``2 * num_moments`` points, ascending, that are dense close
+        to the bounds of the spectrum.
+        """
+        num = 2 * self.num_moments
+        x = np.cos(np.pi * (np.arange(num)[::-1] + 0.5) / num)
+        return self._a * x + self._b
+
+    def __call__(self, energy=None):
+        """Return the density of states at the given energies.
+
+        Parameters
+        ----------
+        energy : real number, sequence of real numbers, or ``None``
+            The energies.  If ``None``, the energies returned by the
+            attribute `energies` are used.
+
+        Returns
+        -------
+        energies : numpy array
+            Only returned if `energy` is ``None``.
+        densities : float or numpy array
+            The density of states, normalized to the number of orbitals of
+            the system.  For the local density of states, the last axis
+            runs over the orbitals.  The density vanishes outside of the
+            bounds of the spectrum.
+        """
+        return_energies = energy is None
+        if return_energies:
+            energy = self.energies
+        energy = np.asarray(energy, float)
+        x = (energy - self._b) / self._a
+        inside = abs(x) < 1
+        x = np.where(inside, x, 0)
+
+        coefs = jackson_kernel(self.num_moments)
+        coefs[1:] *= 2
+        moments = self._moments()
+        coefs = coefs.reshape((-1,) + (1,) * (moments.ndim - 1)) * moments
+        densities = np.polynomial.chebyshev.chebval(x, coefs)
+        if moments.ndim > 1:
+            densities = np.rollaxis(densities, 0, densities.ndim)
+            inside = inside[..., np.newaxis]
+            x = x[..., np.newaxis]
+        densities = np.where(inside, densities, 0)
+        densities /= np.pi * np.sqrt(1 - x**2) * self._a
+        if return_energies:
+            return energy, densities
+        return densities
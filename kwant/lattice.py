@@ -52,6 +52,26 @@ def general(prim_vecs, basis=None, name='', norbs=None):
         return Polyatomic(prim_vecs, basis, name=name, norbs=norbs)
 
 
+def _row_keys(*arrays):
+    """Return keys of the rows of 2d integer arrays.
+
+    A list with one 1d array of keys per given array is returned.  Equal rows
+    have equal keys, such that the keys can be used with the set operations
+    of NumPy.  The keys are integers unless the rows span too large a range.
+    """
+    nonempty = [a for a in arrays if len(a)]
+    if not nonempty:
+        return [np.empty(0, int) for a in arrays]
+    low = np.min([a.min(0) for a in nonempty], 0)
+    extent = np.max([a.max(0) for a in nonempty], 0) - low + 1
+    if np.prod(extent.astype(float)) < 2**62:
+        strides = np.r_[np.cumprod(extent[:0:-1])[::-1], 1]
+        return [np.dot(a - low, strides) for a in arrays]
+    # Too large for integer keys: compare the rows as raw bytes.
+    item = np.dtype((np.void, arrays[0].dtype.itemsize * len(low)))
+    return [np.ascontiguousarray(a).view(item).ravel() for a in arrays]
+
+
 class Polyatomic:
     """
     A Bravais lattice with an arbitrary number of sites in the basis.
@@ -119,7 +139,7 @@ class Polyatomic:
         sl_names = ', '.join(str(sl.name) for sl in self.sublattices)
         return '<Polyatomic lattice with sublattices {0}>'.format(sl_names)
 
-    def shape(self, function, start):
+    def shape(self, function, start, vectorized=False):
         """Return a key for all the lattice sites inside a given shape.
 
         The object returned by this method is primarily meant to be used as a
@@ -132,6 +152,11 @@ class Polyatomic:
             true for coordinates inside the shape, and false otherwise.
         start : 1d array-like
             The real-space origin for the flood-fill algorithm.
+        vectorized : bool, optional
+            If true, `function` is called with a 2d array of positions, one
+            position per row, and must return a 1d array of truth values, one
+            per row.  The flood-fill then treats all the sites of one step at
+            once, which is much faster for large shapes.
 
         Returns
         -------
@@ -159,7 +184,18 @@ class Polyatomic:
         >>> syst = kwant.Builder()
         >>> syst[lat.shape(circle, (0, 0))] = 0
         >>> syst[lat.neighbors()] = 1
+
+        The same shape, with the shape function working on arrays:
+
+        >>> def circle(pos):
+        ...     x, y = pos.T
+        ...     return x**2 + y**2 < 100
+        ...
+        >>> syst[lat.shape(circle, (0, 0), vectorized=True)] = 0
         """
+        if vectorized:
+            return self._vectorized_shape(function, start)
+
         def shape_sites(symmetry=None):
             Site = builder.Site
 
@@ -214,6 +250,73 @@ class Polyatomic:
 
         return shape_sites
 
+    def _vectorized_shape(self, function, start):
+        """Like `shape`, for a shape function that works on arrays."""
+        def shape_sites(symmetry=None):
+            Site = builder.Site
+
+            if symmetry is None:
+                symmetry = builder.NoSymmetry()
+            elif not isinstance(symmetry, builder.Symmetry):
+                symmetry = symmetry.symmetry
+
+            dim = len(start)
+            if dim != self._prim_vecs.shape[1]:
+                raise ValueError('Dimensionality of start position does not '
+                                 'match the space dimensionality.')
+            lats = self.sublattices
+            deltas = np.array(self.voronoi, int)
+            lattice_dim = deltas.shape[1]
+            # Without a symmetry, a neighbor of a site found in one step of
+            # the flood-fill can only be found in the previous, the same, or
+            # the next step.  Otherwise, all the found tags must be checked.
+            forget = not symmetry.num_directions
+
+            def new_tags(tags, old_tags):
+                # Return the rows of `tags` that are not in `old_tags`,
+                # without duplicates.
+                keys, old_keys = _row_keys(tags, old_tags)
+                keys, index = np.unique(keys, return_index=True)
+                return tags[index[~np.in1d(keys, old_keys)]]
+
+            def inside(lat, tags, old_tags):
+                if symmetry.num_directions:
+                    tags = symmetry.act_tags(-symmetry.which_tags(lat, tags),
+                                             lat, tags)
+                tags = new_tags(tags, old_tags)
+                if not len(tags):
+                    return tags
+                mask = np.asarray(function(lat.positions(tags)), bool)
+                if mask.shape != (len(tags),):
+                    raise ValueError('The shape function must return one '
+                                     'truth value per position.')
+                return tags[mask]
+
+            #### Flood-fill ####
+            tags = np.array([lat.closest(start) for lat in lats], int)
+            old_tags = previous = np.empty((0, lattice_dim), int)
+            found = [inside(lat, tags, old_tags) for lat in lats]
+            if not any(len(tags) for tags in found):
+                msg = 'No sites close to {0} are inside the desired shape.'
+                raise ValueError(msg.format(start))
+
+            while any(len(tags) for tags in found):
+                for lat, tags in zip(lats, found):
+                    for tag in tags.tolist():
+                        yield Site(lat, ta.array(tag), True)
+                tags = np.concatenate(found)
+                if forget:
+                    old_tags = np.concatenate([previous, tags])
+                    previous = tags
+                else:
+                    old_tags = np.concatenate([old_tags, tags])
+
+                tags = (tags[:, None, :] + deltas).reshape(-1, lattice_dim)
+                tags = new_tags(tags, old_tags)
+                found = [inside(lat, tags, old_tags) for lat in lats]
+
+        return shape_sites
+
     def wire(self, center, radius):
         """Return a key for all the lattice sites inside an infinite cylinder.
 
@@ -499,6 +602,15 @@ class Monatomic(builder.SiteFamily, Polyatomic):
         """Return the real-space position of the site with a given tag."""
         return ta.dot(tag, self._prim_vecs) + self.offset
 
+    def positions(self, tags):
+        """Return the real-space positions of the sites with given tags.
+
+        `tags` is a 2d integer array with one tag per row.  The positions are
+        returned as a 2d NumPy array with one row per tag.
+        """
+        tags = np.asarray(tags, int).reshape(-1, self.lattice_dim)
+        return np.dot(tags, self._prim_vecs) + self.offset
+
 
 # The following class is designed such that it should avoid floating
 # point precision issues.
@@ -660,6 +772,16 @@ class TranslationalSymmetry(builder.Symmetry):
         result = ta.dot(det_x_inv_m_part, site.tag) // det_m
         return -result if self.is_reversed else result
 
+    def which_tags(self, family, tags):
+        det_x_inv_m_part, det_m = self._get_site_family_data(family)[-2:]
+        result = np.dot(tags, np.array(det_x_inv_m_part, int).T) // det_m
+        return -result if self.is_reversed else result
+
+    def act_tags(self, elements, family, tags):
+        m_part = self._get_site_family_data(family)[0]
+        delta = np.dot(elements, np.array(m_part, int).T)
+        return tags - delta if self.is_reversed else tags + delta
+
     def act(self, element, a, b=None):
         m_part = self._get_site_family_data(a.family)[0]
         try:
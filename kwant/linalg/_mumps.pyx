@@ -214,3 +214,107 @@ cdef class zmumps:
         self.params.size_schur = schur.shape[0]
         self.params.schur = <cmumps.ZMUMPS_COMPLEX *>schur.data
         self.params.listvar_schur = <cmumps.MUMPS_INT *>schur_vars.data
+
+#############################################################
+
+cdef class dmumps:
+    cdef cmumps.DMUMPS_STRUC_C params
+
+    cdef public mumps_int_array icntl
+    cdef public dmumps_real_array cntl
+    cdef public mumps_int_array info
+    cdef public mumps_int_array infog
+    cdef public dmumps_real_array rinfo
+    cdef public dmumps_real_array rinfog
+
+    def __init__(self, verbose=False, sym=0):
+        self.params.job = -1
+        self.params.sym = sym
+        self.params.par = 1
+        self.params.comm_fortran = -987654
+
+        cmumps.dmumps_c(&self.params)
+
+        self.icntl = make_mumps_int_array(self.params.icntl)
+        self.cntl = make_dmumps_real_array(self.params.cntl)
+        self.info = make_mumps_int_array(self.params.info)
+        self.infog = make_mumps_int_array(self.params.infog)
+        self.rinfo = make_dmumps_real_array(self.params.rinfo)
+        self.rinfog = make_dmumps_real_array(self.params.rinfog)
+
+        # no diagnostic output (MUMPS is very verbose normally)
+        if not verbose:
+            self.icntl[1] = 0
+            self.icntl[3] = 0
+
+    def __dealloc__(self):
+        self.params.job = -2
+        cmumps.dmumps_c(&self.params)
+
+    def call(self):
+        cmumps.dmumps_c(&self.params)
+
+    def _set_job(self, value):
+        self.params.job = value
+
+    def _get_job(self):
+        return self.params.job
+
+    job = property(_get_job, _set_job)
+
+    @property
+    def sym(self):
+        return self.params.sym
+
+    def set_assembled_matrix(self,
+                             cmumps.MUMPS_INT N,
+                             np.ndarray[cmumps.MUMPS_INT, ndim=1] i,
+                             np.ndarray[cmumps.MUMPS_INT, ndim=1] j,
+                             np.ndarray[np.float64_t, ndim=1] a):
+        self.params.n = N
+        self.params.nz = a.shape[0]
+        self.params.irn = <cmumps.MUMPS_INT *>i.data
+        self.params.jcn = <cmumps.MUMPS_INT *>j.data
+        self.params.a = <cmumps.DMUMPS_COMPLEX *>a.data
+
+    def set_dense_rhs(self, np.ndarray rhs):
+
+        assert_fortran_matvec(rhs)
+        if rhs.dtype != np.float64:
+            raise ValueError("numpy array must be of dtype float64!")
+
+        if rhs.ndim == 1:
+            self.params.nrhs = 1
+        else:
+            self.params.nrhs = rhs.shape[1]
+        self.params.lrhs = rhs.shape[0]
+        self.params.rhs = <cmumps.DMUMPS_COMPLEX *>rhs.data
+
+    def set_sparse_rhs(self,
+                       np.ndarray[cmumps.MUMPS_INT, ndim=1] col_ptr,
+                       np.ndarray[cmumps.MUMPS_INT, ndim=1] row_ind,
+                       np.ndarray[np.float64_t, ndim=1] data):
+
+        if row_ind.shape[0] != data.shape[0]:
+            raise ValueError("Number of entries in row index and value "
+                             "array differ!")
+
+        self.params.nz_rhs = data.shape[0]
+        self.params.nrhs = col_ptr.shape[0] - 1
+        self.params.rhs_sparse = <cmumps.DMUMPS_COMPLEX *>data.data
+        self.params.irhs_sparse = <cmumps.MUMPS_INT *>row_ind.data
+        self.params.irhs_ptr = <cmumps.MUMPS_INT *>col_ptr.data
+
+    def set_schur(self,
+                  np.ndarray[np.float64_t, ndim=2, mode='c'] schur,
+                  np.ndarray[cmumps.MUMPS_INT, ndim=1] schur_vars):
+
+        if schur.shape[0] != schur.shape[1]:
+            raise ValueError("Schur matrix must be squared!")
+        if schur.shape[0] != schur_vars.shape[0]:
+            raise ValueError("Number of Schur variables must agree "
+                             "with Schur complement size!")
+
+        self.params.size_schur = schur.shape[0]
+        self.params.schur = <cmumps.DMUMPS_COMPLEX *>schur.data
+        self.params.listvar_schur = <cmumps.MUMPS_INT *>schur_vars.data
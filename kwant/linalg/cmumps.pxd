@@ -60,3 +60,37 @@ cdef extern from "zmumps_c.h":
         ZMUMPS_COMPLEX *schur
 
     cdef void zmumps_c(ZMUMPS_STRUC_C *)
+
+
+cdef extern from "dmumps_c.h":
+    ctypedef struct DMUMPS_STRUC_C:
+        MUMPS_INT sym, par, job
+        MUMPS_INT comm_fortran
+        MUMPS_INT icntl[40]
+        DMUMPS_REAL cntl[15]
+
+        MUMPS_INT n
+
+        MUMPS_INT nz
+        MUMPS_INT *irn
+        MUMPS_INT *jcn
+        DMUMPS_COMPLEX *a
+
+        MUMPS_INT nrhs, lrhs
+        DMUMPS_COMPLEX *rhs
+
+        MUMPS_INT info[40]
+        MUMPS_INT infog[40]
+        DMUMPS_REAL rinfo[40]
+        DMUMPS_REAL rinfog[40]
+
+        MUMPS_INT nz_rhs
+        DMUMPS_COMPLEX *rhs_sparse
+        MUMPS_INT *irhs_sparse
+        MUMPS_INT *irhs_ptr
+
+        MUMPS_INT size_schur
+        MUMPS_INT *listvar_schur
+        DMUMPS_COMPLEX *schur
+
+    cdef void dmumps_c(DMUMPS_STRUC_C *)
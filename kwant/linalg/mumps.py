@@ -88,7 +88,7 @@ class MUMPSError(RuntimeError):
 
 
 class AnalysisStatistics:
-    def __init__(self, inst, time=None):
+    def __init__(self, inst, time=None, cpu_time=None):
         self.est_mem_incore = inst.infog[17]
         self.est_mem_ooc = inst.infog[27]
         self.est_nonzeros = (inst.infog[20] if inst.infog[20] > 0 else
@@ -96,6 +96,7 @@ class AnalysisStatistics:
         self.est_flops = inst.rinfog[1]
         self.ordering = ordering_name[inst.infog[7]]
         self.time = time
+        self.cpu_time = cpu_time
 
     def __str__(self):
         parts = ["estimated memory for in-core factorization:",
@@ -112,7 +113,8 @@ class AnalysisStatistics:
 
 
 class FactorizationStatistics:
-    def __init__(self, inst, time=None, include_ordering=False):
+    def __init__(self, inst, time=None, include_ordering=False,
+                 cpu_time=None):
         # information about pivoting
         self.offdiag_pivots = inst.infog[12] if inst.sym == 0 else 0
         self.delayed_pivots = inst.infog[13]
@@ -129,6 +131,7 @@ class FactorizationStatistics:
         self.flops = inst.rinfog[3]
         if time:
             self.time = time
+            self.cpu_time = cpu_time
 
     def __str__(self):
         parts = ["off-diagonal pivots:", str(self.offdiag_pivots), "\n",
@@ -149,7 +152,9 @@ class MUMPSContext:
     """MUMPSContext contains the internal data structures needed by the
     MUMPS library and contains a user-friendly interface.
 
-    WARNING: Only complex numbers supported.
+    WARNING: Only double precision (real or complex) numbers supported.  A
+    real matrix is factorized in real arithmetics, complex right hand sides
+    are then solved for as separate real and imaginary parts.
 
     Examples
     --------
@@ -175,7 +180,7 @@ class MUMPSContext:
 
     """
 
-    def __init__(self, verbose=False):
+    def __init__(self, verbose=False, symmetric=False):
         """Init the MUMPSContext class
 
         Parameters
@@ -184,13 +189,21 @@ class MUMPSContext:
         verbose : True or False
             control whether MUMPS prints lots of internal statistics
             and debug information to screen.
+        symmetric : True or False
+            whether the matrices are symmetric (``a == a.T``; note that this
+            is not the same as Hermitian for complex matrices).  If True,
+            only the upper triangle of the matrix is passed to MUMPS, which
+            computes an LDL^T factorization.  This needs about half the
+            memory and operations of the general LU factorization.  The
+            symmetry of the matrix is not checked.  Default is False.
         """
         self.mumps_instance = None
         self.dtype = None
         self.verbose = verbose
+        self.symmetric = symmetric
         self.factored = False
 
-    def analyze(self, a, ordering='auto', overwrite_a=False):
+    def analyze(self, a, ordering='auto', overwrite_a=False, borrow_a=False):
         """Perform analysis step of MUMPS.
 
         In the analyis step, MUMPS figures out a reordering for the matrix and
@@ -213,6 +226,13 @@ class MUMPSContext:
         overwrite_a : True or False
             whether the data in a may be overwritten, which can lead to a small
             performance gain. Default is False.
+        borrow_a : True or False
+            whether MUMPS may work directly on the arrays of a (in `coo`
+            format) if they already have the required types, instead of
+            copying them.  The indices are converted to Fortran (1-based)
+            indices in place and converted back before returning, so `a` must
+            not be used by others (e.g. other threads) in the meantime.
+            Default is False.
         """
 
         a = a.tocoo()
@@ -223,10 +243,40 @@ class MUMPSContext:
         if not ordering in orderings.keys():
             raise ValueError("Unknown ordering '"+ordering+"'!")
 
-        dtype, row, col, data = _make_assembled_from_coo(a, overwrite_a)
+        try:
+            self._analyze(a, ordering, overwrite_a, borrow_a)
+        finally:
+            self._return_borrowed()
+
+    def _set_matrix(self, a, overwrite_a, borrow_a):
+        if self.symmetric:
+            # MUMPS only needs the upper triangle of symmetric matrices.
+            # These are new arrays that MUMPS may keep.
+            upper = a.row <= a.col
+            a = scipy.sparse.coo_matrix(
+                (a.data[upper], (a.row[upper], a.col[upper])), shape=a.shape)
+            return _make_assembled_from_coo(a, True, True)
+        dtype, row, col, data = _make_assembled_from_coo(a, overwrite_a,
+                                                         borrow_a)
+        if borrow_a:
+            self._borrowed = [index for index, orig in [(row, a.row),
+                                                        (col, a.col)]
+                              if index is orig]
+        return dtype, row, col, data
+
+    def _return_borrowed(self):
+        # MUMPS only reads the matrix during analysis and factorization, so
+        # borrowed indices can be converted back afterwards.
+        for index in getattr(self, '_borrowed', ()):
+            index -= 1
+        self._borrowed = []
+
+    def _analyze(self, a, ordering, overwrite_a, borrow_a):
+        dtype, row, col, data = self._set_matrix(a, overwrite_a, borrow_a)
 
         if dtype != self.dtype:
-            self.mumps_instance = getattr(_mumps, dtype+"mumps")(self.verbose)
+            self.mumps_instance = getattr(_mumps, dtype+"mumps")(
+                self.verbose, sym=2 if self.symmetric else 0)
             self.dtype = dtype
 
         self.n = a.shape[0]
@@ -239,19 +289,19 @@ class MUMPSContext:
         self.mumps_instance.set_assembled_matrix(a.shape[0], row, col, data)
         self.mumps_instance.icntl[7] = orderings[ordering]
         self.mumps_instance.job = 1
-        t1 = time.clock()
+        t1, c1 = time.perf_counter(), time.process_time()
         self.mumps_instance.call()
-        t2 = time.clock()
+        t2, c2 = time.perf_counter(), time.process_time()
         self.factored = False
 
         if self.mumps_instance.infog[1] < 0:
             raise MUMPSError(self.mumps_instance.infog)
 
         self.analysis_stats = AnalysisStatistics(self.mumps_instance,
-                                                 t2 - t1)
+                                                 t2 - t1, c2 - c1)
 
     def factor(self, a, ordering='auto', ooc=False, pivot_tol=0.01,
-               reuse_analysis=False, overwrite_a=False):
+               reuse_analysis=False, overwrite_a=False, borrow_a=False):
         """Perform the LU factorization of the matrix.
 
         This LU factorization can then later be used to solve a linear system
@@ -287,12 +337,23 @@ class MUMPSContext:
         overwrite_a : True or False
             whether the data in a may be overwritten, which can lead to a small
             performance gain. Default is False.
+        borrow_a : True or False
+            whether MUMPS may work directly on the arrays of a, see `analyze`.
+            Default is False.
         """
         a = a.tocoo()
 
         if a.ndim != 2 or a.shape[0] != a.shape[1]:
             raise ValueError("Input matrix must be square!")
 
+        try:
+            self._factor(a, ordering, ooc, pivot_tol, reuse_analysis,
+                         overwrite_a, borrow_a)
+        finally:
+            self._return_borrowed()
+
+    def _factor(self, a, ordering, ooc, pivot_tol, reuse_analysis,
+                overwrite_a, borrow_a):
         # Analysis phase must be done before factorization
         # Note: previous analysis is reused only if reuse_analysis == True
 
@@ -300,10 +361,10 @@ class MUMPSContext:
             if self.mumps_instance is None:
                 warnings.warn("Missing analysis although reuse_analysis=True. "
                               "New analysis is performed.", RuntimeWarning)
-                self.analyze(a, ordering=ordering, overwrite_a=overwrite_a)
+                reuse_analysis = False
             else:
-                dtype, row, col, data = _make_assembled_from_coo(a,
-                                                                 overwrite_a)
+                dtype, row, col, data = self._set_matrix(a, overwrite_a,
+                                                         borrow_a)
                 if self.dtype != dtype:
                     raise ValueError("MUMPSContext dtype and matrix dtype "
                                      "incompatible!")
@@ -314,8 +375,10 @@ class MUMPSContext:
                 self.data = data
                 self.mumps_instance.set_assembled_matrix(a.shape[0],
                                                          row, col, data)
-        else:
-            self.analyze(a, ordering=ordering, overwrite_a=overwrite_a)
+        if not reuse_analysis:
+            if not ordering in orderings.keys():
+                raise ValueError("Unknown ordering '"+ordering+"'!")
+            self._analyze(a, ordering, overwrite_a, borrow_a)
 
         self.mumps_instance.icntl[22] = 1 if ooc else 0
         self.mumps_instance.job = 2
@@ -323,9 +386,9 @@ class MUMPSContext:
 
         done = False
         while not done:
-            t1 = time.clock()
+            t1, c1 = time.perf_counter(), time.process_time()
             self.mumps_instance.call()
-            t2 = time.clock()
+            t2, c2 = time.perf_counter(), time.process_time()
 
             # error -8, -9 (not enough allocated memory) is treated
             # specially, by increasing the memory relaxation parameter
@@ -340,7 +403,8 @@ class MUMPSContext:
 
         self.factored = True
         self.factor_stats = FactorizationStatistics(self.mumps_instance,
-                                                    t2 - t1)
+                                                    t2 - t1,
+                                                    cpu_time=c2 - c1)
 
     def _solve_sparse(self, b):
         b = b.tocsc()
@@ -412,11 +476,72 @@ class MUMPSContext:
         if not self.factored:
             raise RuntimeError("Factorization must be done before solving!")
 
+        if self.dtype == 'd' and np.iscomplexobj(b):
+            # Stay in real arithmetics.
+            return self.solve(b.real) + 1j * self.solve(b.imag)
+
         if scipy.sparse.isspmatrix(b):
             return self._solve_sparse(b)
         else:
             return self._solve_dense(b, overwrite_b)
 
+    def inverse_diagonal(self, indices=None):
+        """Compute diagonal entries of the inverse of the matrix.
+
+        This uses the selected inversion feature of MUMPS (available since
+        MUMPS 4.10.0), which computes entries of the inverse directly from the
+        LU factorization that has previously been performed by `factor`.
+
+        Parameters
+        ----------
+
+        indices : 1d array of integers or None
+            indices of the requested diagonal entries.  ``None`` (default)
+            means the whole diagonal.
+
+        Returns
+        -------
+
+        diag : NumPy array
+            the requested diagonal entries of the inverse matrix, in the
+            order of `indices`.
+        """
+
+        if not self.factored:
+            raise RuntimeError("Factorization must be done before solving!")
+
+        if indices is None:
+            indices = np.arange(self.n)
+        indices = np.asanyarray(indices)
+        if indices.ndim != 1:
+            raise ValueError("Indices must be specified in a 1d array!")
+        if len(indices) == 0:
+            return np.empty(0, self.data.dtype)
+        if indices.min() < 0 or indices.max() >= self.n:
+            raise IndexError("Index out of range.")
+
+        # The requested entries of the inverse are specified by the sparsity
+        # pattern of a sparse right hand side, the result is returned in
+        # place of its data.
+        unique = np.unique(indices)
+        pattern = scipy.sparse.csc_matrix(
+            (np.ones(len(unique)), (unique, unique)), shape=(self.n, self.n))
+        dtype, col_ptr, row_ind, data = _make_sparse_rhs_from_csc(
+            pattern, self.data.dtype)
+
+        self.mumps_instance.set_sparse_rhs(col_ptr, row_ind, data)
+        self.mumps_instance.job = 3
+        self.mumps_instance.icntl[30] = 1
+        try:
+            self.mumps_instance.call()
+        finally:
+            self.mumps_instance.icntl[30] = 0
+
+        if self.mumps_instance.infog[1] < 0:
+            raise MUMPSError(self.mumps_instance.infog)
+
+        return data[np.searchsorted(unique, indices)]
+
 
 def schur_complement(a, indices, ordering='auto', ooc=False, pivot_tol=0.01,
                      calc_stats=False, overwrite_a=False):
@@ -490,23 +615,34 @@ def schur_complement(a, indices, ordering='auto', ooc=False, pivot_tol=0.01,
     mumps_instance.set_schur(schur_compl, indices)
 
     mumps_instance.job = 4   # job=4 -> 1 and 2 after each other
-    t1 = time.clock()
+    t1, c1 = time.perf_counter(), time.process_time()
     mumps_instance.call()
-    t2 = time.clock()
+    t2, c2 = time.perf_counter(), time.process_time()
 
     if not calc_stats:
         return schur_compl
     else:
         return (schur_compl, FactorizationStatistics(
-            mumps_instance, time=t2 - t1, include_ordering=True))
+            mumps_instance, time=t2 - t1, include_ordering=True,
+            cpu_time=c2 - c1))
 
 
 # Some internal helper functions
-def _make_assembled_from_coo(a, overwrite_a):
-    dtype, data = prepare_for_fortran(overwrite_a, a.data)
-
-    row = np.asfortranarray(a.row.astype(_mumps.int_dtype))
-    col = np.asfortranarray(a.col.astype(_mumps.int_dtype))
+def _make_assembled_from_coo(a, overwrite_a, borrow_a=False):
+    # MUMPS does not modify the matrix, so borrowed data need not be copied.
+    dtype, data = prepare_for_fortran(overwrite_a or borrow_a, a.data)
+
+    def index_array(index):
+        if (borrow_a and index.dtype == _mumps.int_dtype and
+            index.flags['C_CONTIGUOUS'] and index.flags['WRITEABLE']):
+            return index
+        return np.asfortranarray(index.astype(_mumps.int_dtype))
+
+    row = index_array(a.row)
+    col = index_array(a.col)
+    if np.may_share_memory(row, col):
+        # Never convert the same memory twice.
+        col = np.asfortranarray(a.col.astype(_mumps.int_dtype))
 
     # MUMPS uses Fortran indices.
     row += 1
@@ -49,6 +49,7 @@ def test_lu_with_dense():
                                   bvec.reshape(5,1))
 
     _test_lu_with_dense(np.complex128)
+    _test_lu_with_dense(np.float64)
 
 
 def test_schur_complement_with_dense():
@@ -60,6 +61,7 @@ def test_schur_complement_with_dense():
                                   np.linalg.inv(a)[:3, :3])
 
     _test_schur_complement_with_dense(np.complex128)
+    _test_schur_complement_with_dense(np.float64)
 
 
 def test_error_minus_9(r=10):
@@ -88,3 +90,45 @@ def test_factor_warning():
     a = sp.identity(10, dtype=complex)
     with pytest.warns(RuntimeWarning):
         MUMPSContext().factor(a, reuse_analysis=True)
+
+
+def test_borrow_a():
+    rand = _Random()
+    dtype = np.complex128
+    a = sp.coo_matrix(rand.randmat(5, 5, dtype))
+    a.row = a.row.astype(np.int32)
+    a.col = a.col.astype(np.int32)
+    row, col = a.row.copy(), a.col.copy()
+    bvec = rand.randvec(5, dtype)
+
+    ctx = MUMPSContext()
+    for reuse_analysis in [False, True]:
+        ctx.factor(a, reuse_analysis=reuse_analysis, borrow_a=True)
+        # The borrowed indices have been converted back.
+        assert np.all(a.row == row) and np.all(a.col == col)
+        xvec = ctx.solve(bvec)
+        assert_array_almost_equal(dtype, a.dot(xvec), bvec)
+
+
+def test_real_matrix_complex_rhs():
+    rand = _Random()
+    a = rand.randmat(5, 5, np.float64)
+    b = rand.randmat(5, 3, np.complex128)
+    ctx = MUMPSContext()
+    ctx.factor(sp.coo_matrix(a))
+    assert ctx.dtype == 'd'
+    for rhs in [b, sp.csc_matrix(b)]:
+        assert_array_almost_equal(np.complex128, np.dot(a, ctx.solve(rhs)), b)
+
+
+def test_symmetric():
+    rand = _Random()
+    for dtype in [np.float64, np.complex128]:
+        a = rand.randmat(6, 6, dtype)
+        a = a + a.T
+        b = rand.randvec(6, dtype)
+        ctx = MUMPSContext(symmetric=True)
+        ctx.factor(sp.coo_matrix(a))
+        assert ctx.mumps_instance.sym == 2
+        assert len(ctx.data) == 21
+        assert_array_almost_equal(dtype, np.dot(a, ctx.solve(b)), b)
@@ -17,7 +17,8 @@ from .. import linalg as kla
 
 dot = np.dot
 
-__all__ = ['selfenergy', 'modes', 'PropagatingModes', 'StabilizedModes']
+__all__ = ['selfenergy', 'modes', 'modes_batch', 'PropagatingModes',
+           'StabilizedModes']
 
 
 if np.__version__ >= '1.8':
@@ -35,6 +36,7 @@ else:
 
 # Container classes
 Linsys = namedtuple('Linsys', ['eigenproblem', 'v', 'extract'])
+Hopping = namedtuple('Hopping', ['h_hop', 'eps', 'hop_inv', 'u', 'v', 'uv'])
 
 
 class PropagatingModes:
@@ -170,11 +172,6 @@ def setup_linsys(h_cell, h_hop, tol=1e6, stabilization=None):
     details of the algorithm will be published elsewhere.
 
     """
-    n = h_cell.shape[0]
-    m = h_hop.shape[1]
-    if stabilization is not None:
-        stabilization = list(stabilization)
-
     if not complex_any(h_hop):
         # Inter-cell hopping is zero.  The current algorithm is not suited to
         # treat this extremely singular case.
@@ -185,6 +182,28 @@ def setup_linsys(h_cell, h_hop, tol=1e6, stabilization=None):
         h_hop = h_hop.real
         h_cell = h_cell.real
 
+    hopping = _decompose_hopping(h_cell, h_hop, tol, stabilization)
+    return _setup_linsys(h_cell, hopping, tol, stabilization)
+
+
+def _decompose_hopping(h_cell, h_hop, tol=1e6, stabilization=None):
+    """Prepare the energy-independent part of the lead eigenvalue problem.
+
+    `h_cell` is only used to determine the precision of the calculation.  The
+    arrays must be either both real or such that the calculation is done in
+    complex arithmetics.
+
+    Returns
+    -------
+    hopping : namedtuple
+        A named tuple containing the hopping matrix `h_hop`, the threshold
+        `eps` for singular values, and either its inverse `hop_inv` (if the
+        regular transfer matrix can be used), or the matrices `u` and `v` of
+        the singular value decomposition restricted to the nonzero singular
+        values and `uv` the sum of ``u u^dagger`` and ``v v^dagger``.
+    """
+    n = h_cell.shape[0]
+    m = h_hop.shape[1]
     eps = np.finfo(np.common_type(h_cell, h_hop)).eps * tol
 
     # First check if the hopping matrix has singular values close to 0.
@@ -198,8 +217,36 @@ def setup_linsys(h_cell, h_hop, tol=1e6, stabilization=None):
     if (n_nonsing == n and stabilization is None):
         # The hopping matrix is well-conditioned and can be safely inverted.
         # Hence the regular transfer matrix may be used.
-        hop_inv = la.inv(h_hop)
+        return Hopping(h_hop, eps, la.inv(h_hop), None, None, None)
+
+    # The hopping matrix has eigenvalues close to 0 - those
+    # need to be eliminated.
+
+    # Recast the svd of h_hop = u s v^dagger such that
+    # u, v are matrices with shape n x n_nonsing.
+    u = u[:, :n_nonsing]
+    s = s[:n_nonsing]
+    u = u * np.sqrt(s)
+    # pad v with zeros if necessary
+    v = np.zeros((n, n_nonsing), dtype=vh.dtype)
+    v[:vh.shape[1]] = vh[:n_nonsing].T.conj()
+    v = v * np.sqrt(s)
+    uv = dot(u, u.T.conj()) + dot(v, v.T.conj())
+    return Hopping(h_hop, eps, None, u, v, uv)
+
 
+def _setup_linsys(h_cell, hopping, tol, stabilization):
+    """Make the eigenvalue problem from a decomposed hopping.
+
+    See `setup_linsys` for the parameters.
+    """
+    n = h_cell.shape[0]
+    h_hop, eps, hop_inv, u, v, uv = hopping
+    m = h_hop.shape[1]
+    if stabilization is not None:
+        stabilization = list(stabilization)
+
+    if hop_inv is not None:
         A = np.zeros((2*n, 2*n), dtype=np.common_type(h_cell, h_hop))
         A[:n, :n] = dot(hop_inv, -h_cell)
         A[:n, n:] = -hop_inv
@@ -217,19 +264,7 @@ def setup_linsys(h_cell, h_hop, tol=1e6, stabilization=None):
     else:
         if stabilization is None:
             stabilization = [None, False]
-
-        # The hopping matrix has eigenvalues close to 0 - those
-        # need to be eliminated.
-
-        # Recast the svd of h_hop = u s v^dagger such that
-        # u, v are matrices with shape n x n_nonsing.
-        u = u[:, :n_nonsing]
-        s = s[:n_nonsing]
-        u = u * np.sqrt(s)
-        # pad v with zeros if necessary
-        v = np.zeros((n, n_nonsing), dtype=vh.dtype)
-        v[:vh.shape[1]] = vh[:n_nonsing].T.conj()
-        v = v * np.sqrt(s)
+        n_nonsing = u.shape[1]
 
         # Eliminating the zero eigenvalues requires inverting the on-site
         # Hamiltonian, possibly including a self-energy-like term.  The
@@ -258,8 +293,7 @@ def setup_linsys(h_cell, h_hop, tol=1e6, stabilization=None):
             need_to_stabilize = True
             # Matrices are complex or need self-energy-like term to be
             # stabilized.
-            temp = dot(u, u.T.conj()) + dot(v, v.T.conj())
-            h = h_cell + 1j * temp
+            h = h_cell + 1j * uv
 
             sol = kla.lu_factor(h)
             rcond = kla.rcond_from_lu(sol, npl.norm(h, 1))
@@ -570,21 +604,101 @@ def modes(h_cell, h_hop, tol=1e6, stabilization=None):
     the mode decomposition that the Kwant authors are aware about. Its details
     are to be published.
     """
-    m = h_hop.shape[1]
-    n = h_cell.shape[0]
-
     if (h_cell.shape[0] != h_cell.shape[1] or
         h_cell.shape[0] != h_hop.shape[0]):
         raise ValueError("Incompatible matrix sizes for h_cell and h_hop.")
 
     if not complex_any(h_hop):
-        v = np.zeros((m, 0))
-        return (PropagatingModes(np.zeros((n, 0)), np.zeros((0,)),
-                                 np.zeros((0,))),
-                StabilizedModes(np.zeros((0, 0)), np.zeros((0, 0)), 0, v))
+        return _no_modes(h_cell, h_hop)
 
     # Defer most of the calculation to helper routines.
-    matrices, v, extract = setup_linsys(h_cell, h_hop, tol, stabilization)
+    return _modes(setup_linsys(h_cell, h_hop, tol, stabilization),
+                  h_cell.shape[0], tol)
+
+
+def modes_batch(h_cell, h_hop, energies, tol=1e6, stabilization=None,
+                max_workers=1):
+    """Compute the mode decompositions of a lead for several energies.
+
+    This is equivalent to ``[modes(h_cell - e * identity, h_hop) for e in
+    energies]``, but the parts of the calculation that do not depend on the
+    energy (most notably the singular value decomposition of the hopping) are
+    only done once.
+
+    Parameters
+    ----------
+    h_cell : numpy array, real or complex, shape (N,N) The unit cell
+        Hamiltonian of the lead unit cell.
+    h_hop : numpy array, real or complex, shape (N,M)
+        The hopping matrix from a lead cell to the one on which self-energy
+        has to be calculated (and any other hopping in the same direction).
+    energies : sequence of numbers
+        The energies for which to compute the modes.
+    tol : float
+        Numbers and differences are considered zero when they are smaller
+        than `tol` times the machine precision.
+    stabilization : sequence of 2 booleans or None
+        See `modes`.
+    max_workers : integer or ``None``
+        Number of threads used to treat different energies simultaneously.
+        The default of 1 computes the modes in the calling thread.  ``None``
+        means the default number of threads of
+        `concurrent.futures.ThreadPoolExecutor`.  Since most of the work is
+        done by LAPACK, which does not hold the global interpreter lock,
+        several threads can run in parallel.
+
+    Returns
+    -------
+    modes : list of pairs (`~kwant.physics.PropagatingModes`,
+            `~kwant.physics.StabilizedModes`)
+        The modes for each energy, as returned by `modes`.
+    """
+    n = h_cell.shape[0]
+    if (h_cell.shape[0] != h_cell.shape[1] or
+        h_cell.shape[0] != h_hop.shape[0]):
+        raise ValueError("Incompatible matrix sizes for h_cell and h_hop.")
+    energies = np.asarray(energies)
+
+    if not complex_any(h_hop):
+        return [_no_modes(h_cell, h_hop) for energy in energies]
+
+    # Stay in real arithmetics if possible.
+    if not (np.any(h_hop.imag) or np.any(h_cell.imag) or
+            np.any(energies.imag)):
+        h_hop = h_hop.real
+        h_cell = h_cell.real
+        energies = energies.real
+    else:
+        h_cell = h_cell.astype(np.common_type(h_cell, h_hop, energies))
+    hopping = _decompose_hopping(h_cell, h_hop, tol, stabilization)
+
+    def modes_at(energy):
+        h = h_cell.copy()
+        h.flat[::n + 1] -= energy
+        return _modes(_setup_linsys(h, hopping, tol, stabilization), n, tol)
+
+    if max_workers == 1:
+        return [modes_at(energy) for energy in energies]
+    from concurrent.futures import ThreadPoolExecutor
+    with ThreadPoolExecutor(max_workers) as executor:
+        return list(executor.map(modes_at, energies))
+
+
+def _no_modes(h_cell, h_hop):
+    """Return the (empty) modes of a lead with zero hopping."""
+    n = h_cell.shape[0]
+    v = np.zeros((h_hop.shape[1], 0))
+    return (PropagatingModes(np.zeros((n, 0)), np.zeros((0,)),
+                             np.zeros((0,))),
+            StabilizedModes(np.zeros((0, 0)), np.zeros((0, 0)), 0, v))
+
+
+def _modes(linsys, n, tol):
+    """Compute the modes from the eigenvalue problem `linsys`.
+
+    `n` is the number of orbitals in a unit cell of the lead.
+    """
+    matrices, v, extract = linsys
     ev, evanselect, propselect, vec_gen, ord_schur = unified_eigenproblem(
         *(matrices + (tol,)))
 
@@ -0,0 +1,120 @@
+# Copyright 2011-2016 Kwant authors.
+#
+# This file is part of Kwant.  It is subject to the license terms in the file
+# LICENSE.rst found in the top-level directory of this distribution and at
+# http://kwant-project.org/license.  A list of Kwant authors can be found in
+# the file AUTHORS.rst at the top-level directory of this distribution and at
+# http://kwant-project.org/authors.
+
+import numpy as np
+import scipy.sparse as sp
+import scipy.sparse.linalg as sla
+from .. import system
+from .._common import ensure_isinstance
+try:
+    from ..linalg import mumps
+except ImportError:
+    mumps = None
+
+__all__ = ['eigensolve']
+
+
+def _shift_invert(mat, sigma):
+    """Return a `LinearOperator` that applies ``(mat - sigma)^-1``.
+
+    The shifted matrix is factorized once, with MUMPS if available.
+    """
+    n = mat.shape[0]
+    shifted = (mat - sigma * sp.identity(n, mat.dtype, format='coo')).tocoo()
+    if mumps is not None:
+        # A real Hermitian matrix is symmetric, which halves the memory needed
+        # by MUMPS.
+        ctx = mumps.MUMPSContext(symmetric=not np.iscomplexobj(shifted.data))
+        ordering = [order for order in ['metis', 'scotch', 'auto']
+                    if order in mumps.possible_orderings()][0]
+        ctx.factor(shifted, ordering=ordering, overwrite_a=True)
+        solve = ctx.solve
+    else:
+        solve = sla.splu(shifted.tocsc()).solve
+    return sla.LinearOperator((n, n), matvec=solve, dtype=mat.dtype)
+
+
+def eigensolve(sys, sigma=0, k=6, args=(), return_eigenvectors=True, tol=0,
+               max_workers=1):
+    """Compute eigenvalues of a finite system close to a given energy.
+
+    The eigenvalues closest to `sigma` are computed by ARPACK in shift-invert
+    mode.  The shifted Hamiltonian is factorized only once per `sigma`, using
+    MUMPS if it is available.
+
+    Parameters
+    ----------
+    sys : `kwant.system.FiniteSystem`
+        The low level system.  Its leads are ignored.
+    sigma : real number or sequence of real numbers
+        Energy around which eigenvalues are searched.  If a sequence is
+        given, the eigenvalues around each of the energies are computed
+        (spectrum slicing).
+    k : integer
+        Number of eigenvalues to compute for each value of `sigma`.
+    args : tuple, defaults to empty
+        Positional arguments to pass to the ``hamiltonian`` method.
+    return_eigenvectors : bool
+        Whether to return the eigenvectors as well.
+    tol : float
+        Relative accuracy for the eigenvalues.  The default of 0 means
+        machine precision.
+    max_workers : integer or ``None``
+        Number of threads used to treat different values of `sigma`
+        simultaneously.  The default of 1 treats them in the calling thread.
+        ``None`` means the default number of threads of
+        `concurrent.futures.ThreadPoolExecutor`.
+
+    Returns
+    -------
+    w : numpy array
+        The `k` eigenvalues closest to `sigma`, in ascending order.
+    v : numpy array
+        The normalized eigenvectors, ``v[:, i]`` belongs to ``w[i]``.  Only
+        returned if `return_eigenvectors` is true.
+
+    If `sigma` is a sequence, a list with the results for each of its
+    entries is returned.
+
+    Notes
+    -----
+    The Hamiltonian is assumed to be Hermitian.  When it is real, it is
+    factorized in real arithmetics.
+
+    The factorizations for different values of `sigma` can run in parallel
+    threads, but the ARPACK iterations of different threads are executed
+    one after another, since ARPACK is not reentrant.
+    """
+    syst = sys  # ensure consistent naming across function bodies
+    ensure_isinstance(syst, system.FiniteSystem)
+
+    sigmas = np.asarray(sigma)
+    if np.iscomplexobj(sigmas):
+        raise ValueError('sigma must be real.')
+    ham = syst.hamiltonian_submatrix(args, sparse=True).tocoo()
+    if not np.any(ham.data.imag):
+        ham = sp.coo_matrix((ham.data.real, (ham.row, ham.col)),
+                            shape=ham.shape)
+
+    def solve(sigma):
+        result = sla.eigsh(ham, k, sigma=sigma,
+                           OPinv=_shift_invert(ham, sigma), tol=tol,
+                           return_eigenvectors=return_eigenvectors)
+        if not return_eigenvectors:
+            return np.sort(result)
+        w, v = result
+        order = np.argsort(w)
+        return w[order], v[:, order]
+
+    if sigmas.ndim == 0:
+        return solve(float(sigmas))
+    if max_workers == 1:
+        return [solve(s) for s in sigmas]
+    from concurrent.futures import ThreadPoolExecutor
+    with ThreadPoolExecutor(max_workers) as executor:
+        return list(executor.map(solve, sigmas))
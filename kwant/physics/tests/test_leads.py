@@ -340,3 +340,28 @@ def test_zero_hopping():
     assert all(np.alltrue(getattr(actual[0], attr) ==
                           getattr(expected[0], attr)) for attr
                    in ('wave_functions', 'velocities', 'momenta'))
+
+
+def test_modes_batch():
+    np.random.seed(7)
+    n = 6
+    energies = [-3, 0.5, 1 + 0.1j, 2.5]
+    t_singular = np.random.randn(n, n - 2)
+    h = np.random.randn(n, n)
+    h += h.T
+    for t, h in [(np.random.randn(n, n), h),
+                 (t_singular + 1j * np.random.randn(n, n - 2),
+                  h + 1j * (np.triu(h, 1) - np.tril(h, -1))),
+                 (t_singular, h)]:
+        for max_workers in [1, 3]:
+            batch = leads.modes_batch(h, t, energies, max_workers=max_workers)
+            assert len(batch) == len(energies)
+            for energy, (prop, stab) in zip(energies, batch):
+                prop2, stab2 = leads.modes(h - energy * np.identity(n), t)
+                assert stab.nmodes == stab2.nmodes
+                assert_almost_equal(prop.momenta, prop2.momenta)
+                assert_almost_equal(prop.velocities, prop2.velocities)
+                assert_almost_equal(stab.selfenergy(), stab2.selfenergy())
+
+    batch = leads.modes_batch(np.identity(2), np.zeros((2, 1)), [0, 1])
+    assert [stab.nmodes for prop, stab in batch] == [0, 0]
@@ -0,0 +1,44 @@
+# Copyright 2011-2016 Kwant authors.
+#
+# This file is part of Kwant.  It is subject to the license terms in the file
+# LICENSE.rst found in the top-level directory of this distribution and at
+# http://kwant-project.org/license.  A list of Kwant authors can be found in
+# the file AUTHORS.rst at the top-level directory of this distribution and at
+# http://kwant-project.org/authors.
+
+import numpy as np
+from numpy.testing import assert_almost_equal
+from pytest import raises
+import kwant
+from kwant.physics import eigensolve
+
+
+def _closest(evs, sigma, k):
+    return np.sort(evs[np.argsort(abs(evs - sigma))[:k]])
+
+
+def test_eigensolve():
+    lat = kwant.lattice.square()
+    syst = kwant.Builder()
+    syst[(lat(x, y) for x in range(10) for y in range(7))] = \
+        lambda site, B: 4 * kwant.digest.uniform(site.tag)
+    syst[lat.neighbors()] = \
+        lambda site1, site2, B: -np.exp(1j * B * site1.pos[0])
+    fsyst = syst.finalized()
+
+    for B in [0, 0.3]:
+        ham = fsyst.hamiltonian_submatrix((B,))
+        evs = np.linalg.eigvalsh(ham)
+        w, v = eigensolve(fsyst, 1.1, k=4, args=(B,))
+        assert_almost_equal(w, _closest(evs, 1.1, 4))
+        assert_almost_equal(np.dot(ham, v), v * w)
+
+        sigmas = [-2, 0.5, 3]
+        for max_workers in [1, 2]:
+            results = eigensolve(fsyst, sigmas, k=3, args=(B,),
+                                 return_eigenvectors=False,
+                                 max_workers=max_workers)
+            for sigma, w in zip(sigmas, results):
+                assert_almost_equal(w, _closest(evs, sigma, 3))
+
+    raises(ValueError, eigensolve, fsyst, 1j, args=(0,))
@@ -6,15 +6,19 @@
 # the file AUTHORS.rst at the top-level directory of this distribution and at
 # http://kwant-project.org/authors.
 
-__all__ = ['SparseSolver', 'SMatrix', 'GreensFunction']
+__all__ = ['SparseSolver', 'SMatrix', 'GreensFunction', 'SolverStats',
+           'CallStats']
 
-from collections import namedtuple
+from collections import namedtuple, OrderedDict
+from contextlib import contextmanager
 from itertools import product
 import abc
+import time
 import numpy as np
 import scipy.sparse as sp
 from .._common import ensure_isinstance
 from .. import system
+from ..graph.defs import gint_dtype
 from functools import reduce
 
 # Currently, scipy.sparse does not support matrices with one dimension being
@@ -26,7 +30,281 @@ from functools import reduce
 # the line "See comment about zero-shaped sparse matrices at the top of
 # common.py".
 
-LinearSys = namedtuple('LinearSys', ['lhs', 'rhs', 'indices', 'num_orb'])
+LinearSys = namedtuple('LinearSys', ['lhs', 'rhs', 'indices', 'num_orb',
+                                     'norb'])
+
+
+def _sparsity_pattern(a):
+    """Return the index arrays that define the sparsity pattern of `a`."""
+    if sp.isspmatrix_coo(a):
+        return a.shape, a.row, a.col
+    return a.shape, a.indptr, a.indices
+
+
+def _same_pattern(pattern1, pattern2):
+    """Tell whether two sparsity patterns are exactly identical."""
+    return (pattern1[0] == pattern2[0] and
+            all(np.array_equal(i, j) for i, j in zip(pattern1[1:],
+                                                     pattern2[1:])))
+
+
+def _dense_block(mat, rows, cols):
+    """Return the coordinate triplet of a dense block of a sparse matrix.
+
+    The entries of `mat` are placed at the crossings of `rows` and `cols`.
+    """
+    return (np.repeat(rows, len(cols)), np.tile(cols, len(rows)),
+            np.ravel(mat))
+
+
+def _assemble(blocks, size):
+    """Assemble a square COO matrix from a sequence of coordinate triplets.
+
+    Entries with identical coordinates are summed.
+    """
+    nnz = sum(len(data) for rows, cols, data in blocks)
+    # Indices of type gint can be passed on to MUMPS without conversion.
+    all_rows = np.empty(nnz, gint_dtype)
+    all_cols = np.empty(nnz, gint_dtype)
+    all_data = np.empty(nnz, complex)
+    start = 0
+    for rows, cols, data in blocks:
+        end = start + len(data)
+        all_rows[start:end] = rows
+        all_cols[start:end] = cols
+        all_data[start:end] = data
+        start = end
+    return sp.coo_matrix((all_data, (all_rows, all_cols)), shape=(size, size))
+
+
+def _shift_diagonal(block, size, energy):
+    """Subtract `energy` from the diagonal of a matrix given as a triplet.
+
+    The data of `block` is modified in place.  Return the indices of the
+    diagonal entries that are not present in `block` and still need to be
+    added.
+    """
+    rows, cols, data = block
+    diag = np.flatnonzero(rows == cols)
+    present, first = np.unique(rows[diag], return_index=True)
+    data[diag[first]] -= energy
+    return np.setdiff1d(np.arange(size), present, assume_unique=True)
+
+
+def _lead_lists(syst, in_leads, out_leads):
+    """Validate the lead lists passed to a solver, return them as lists.
+
+    ``None`` stands for all the leads of `syst`.
+    """
+    n = len(syst.lead_interfaces)
+    if in_leads is None:
+        in_leads = list(range(n))
+    else:
+        in_leads = list(in_leads)
+    if out_leads is None:
+        out_leads = list(range(n))
+    else:
+        out_leads = list(out_leads)
+    if (np.any(np.diff(in_leads) <= 0) or np.any(np.diff(out_leads) <= 0)):
+        raise ValueError("Lead lists must be sorted and "
+                         "with unique entries.")
+    if len(in_leads) == 0 or len(out_leads) == 0:
+        raise ValueError("No output is requested.")
+    return in_leads, out_leads
+
+
+def _check_hermiticity(blocks, norb):
+    """Check that a matrix given as coordinate triplets is Hermitian.
+
+    Only the blocks that belong to a single site are checked: the full
+    Hamiltonian returned by ``hamiltonian_submatrix`` contains each hopping
+    together with its Hermitian conjugate, so the matrix is Hermitian if its
+    onsite blocks are.
+    """
+    if not any(len(data) for rows, cols, data in blocks):
+        return
+    rtol = 1e-13
+    atol = 1e-300
+    tol = rtol * max(np.max(np.abs(data))
+                     for rows, cols, data in blocks if len(data)) + atol
+    site_of = np.repeat(np.arange(len(norb)), norb)
+    onsite = []
+    for rows, cols, data in blocks:
+        select = site_of[rows] == site_of[cols]
+        onsite.append((rows[select], cols[select], data[select]))
+    onsite = _assemble(onsite, len(site_of)).tocsr()
+    if np.any(np.abs((onsite - onsite.T.conj()).data) > tol):
+        raise ValueError('System Hamiltonian is not Hermitian. '
+                         'Use option `check_hermiticity=False` '
+                         'if this is intentional.')
+
+
+class CallStats:
+    """Statistics of a single call of a solver.
+
+    Attributes
+    ----------
+    method : string or ``None``
+        Name of the solver method, e.g. ``'smatrix'``.  ``None`` for the
+        totals of several calls.
+    energy : number or ``None``
+        The energy of the call.
+    wall_time, cpu_time : `~collections.OrderedDict`
+        Wall clock and CPU time in seconds spent in each phase of the call.
+        The phases are ``'hamiltonian'`` (Hamiltonian of the scattering
+        region), ``'leads'`` (modes or self-energies of the leads),
+        ``'assembly'`` (the rest of the construction of the linear system),
+        ``'analysis'`` and ``'factorization'`` of its left hand side, and
+        ``'solve'``.  A phase that does not occur is absent.
+    hamiltonian_calls : integer
+        Number of calls to the ``hamiltonian`` methods of the system and of
+        its leads, i.e. of evaluations of single matrix elements.  Systems
+        created by a `~kwant.builder.Builder` evaluate the full Hamiltonian
+        of the scattering region in bulk, without such calls.
+    lhs_size, lhs_nnz : integer
+        Size and number of stored entries of the left hand side of the
+        linear system.
+    rhs_columns : integer
+        Number of right hand side columns solved for.
+    factorizations : list of dicts
+        Information about each factorization that the solver provides, for
+        MUMPS the estimated and actual numbers of nonzeros in the factors
+        (the fill-in), floating point operations and memory in megabytes.
+    """
+
+    def __init__(self, method=None, energy=None):
+        self.method = method
+        self.energy = energy
+        self.wall_time = OrderedDict()
+        self.cpu_time = OrderedDict()
+        self.hamiltonian_calls = 0
+        self.lhs_size = 0
+        self.lhs_nnz = 0
+        self.rhs_columns = 0
+        self.factorizations = []
+        self._current = None    # Time spent in nested phases.
+
+    def add_time(self, phase, wall, cpu):
+        """Add time to one of the phases."""
+        self.wall_time[phase] = self.wall_time.get(phase, 0) + wall
+        self.cpu_time[phase] = self.cpu_time.get(phase, 0) + cpu
+
+    def __iadd__(self, other):
+        for phase in other.wall_time:
+            self.add_time(phase, other.wall_time[phase],
+                          other.cpu_time[phase])
+        self.hamiltonian_calls += other.hamiltonian_calls
+        self.lhs_size += other.lhs_size
+        self.lhs_nnz += other.lhs_nnz
+        self.rhs_columns += other.rhs_columns
+        self.factorizations.extend(other.factorizations)
+        return self
+
+    def __str__(self):
+        total = sum(self.wall_time.values())
+        lines = ['{:<15}{:>12}{:>12}{:>8}'.format('phase', 'wall (s)',
+                                                  'cpu (s)', 'share')]
+        for phase, wall in self.wall_time.items():
+            lines.append('{:<15}{:>12.4g}{:>12.4g}{:>7.1f}%'.format(
+                phase, wall, self.cpu_time[phase],
+                100 * wall / total if total else 0))
+        lines.append('hamiltonian calls: {}, lhs size: {}, lhs nonzeros: {}, '
+                     'rhs columns: {}'.format(self.hamiltonian_calls,
+                                              self.lhs_size, self.lhs_nnz,
+                                              self.rhs_columns))
+        return '\n'.join(lines)
+
+    def __repr__(self):
+        return 'CallStats(method={!r}, energy={!r})'.format(self.method,
+                                                            self.energy)
+
+
+class SolverStats:
+    """Statistics of solver calls, as collected by
+    `SparseSolver.collect_stats`.
+
+    Attributes
+    ----------
+    calls : list of `CallStats`
+        One record per call, in the order of the calls.  A sweep over
+        energies contributes one record per energy.
+
+    Notes
+    -----
+    Statistics of different collections, e.g. of several sweeps or of
+    several solver instances, can be combined with ``+``.
+    """
+
+    def __init__(self, calls=()):
+        self.calls = list(calls)
+
+    def __add__(self, other):
+        return SolverStats(self.calls + other.calls)
+
+    def total(self):
+        """Return the sum of the statistics of all calls as a `CallStats`."""
+        result = CallStats()
+        for call in self.calls:
+            result += call
+        return result
+
+    def __str__(self):
+        return '{} calls\n{}'.format(len(self.calls), self.total())
+
+
+@contextmanager
+def _timing(record, phase):
+    """Add the time spent in the ``with`` block to `phase` of `record`.
+
+    Nothing is done if `record` is ``None``.  Time spent in nested phases is
+    only counted for the innermost phase.
+    """
+    if record is None:
+        yield
+        return
+    outer = record._current
+    frame = record._current = [0, 0]
+    wall, cpu = time.perf_counter(), time.process_time()
+    try:
+        yield
+    finally:
+        wall = time.perf_counter() - wall
+        cpu = time.process_time() - cpu
+        record.add_time(phase, wall - frame[0], cpu - frame[1])
+        if outer is not None:
+            outer[0] += wall
+            outer[1] += cpu
+        record._current = outer
+
+
+@contextmanager
+def _counting_calls(record, syst):
+    """Count the calls to the ``hamiltonian`` methods of `syst` and its leads.
+
+    The methods are temporarily replaced by wrappers on the instances.
+    """
+    if record is None:
+        yield
+        return
+
+    def counting(hamiltonian):
+        def wrapped(*args):
+            record.hamiltonian_calls += 1
+            return hamiltonian(*args)
+        return wrapped
+
+    wrapped = []
+    for s in [syst] + list(getattr(syst, 'leads', [])):
+        if 'hamiltonian' in vars(s):
+            # Already wrapped or defined on the instance.
+            continue
+        s.hamiltonian = counting(s.hamiltonian)
+        wrapped.append(s)
+    try:
+        yield
+    finally:
+        for s in wrapped:
+            del s.hamiltonian
 
 
 class SparseSolver(metaclass=abc.ABCMeta):
@@ -51,8 +329,68 @@ class SparseSolver(metaclass=abc.ABCMeta):
       kept_vars covers all entries in the solution). This should be not too big
       too avoid excessive memory usage, but for some solvers not too small for
       performance reasons.
+
+    Statistics of the calls, like the time spent in their different phases,
+    are collected within a ``with solver.collect_stats()`` block.
     """
 
+    _stats = None
+    _record = None
+
+    @contextmanager
+    def collect_stats(self):
+        """Collect statistics of the solver calls within a ``with`` block.
+
+        Returns
+        -------
+        stats : `SolverStats`
+            A record is appended to ``stats.calls`` for each call of
+            `smatrix`, `greens_function`, `ldos`, `wave_function`, and for
+            each energy of `smatrix_sweep`.
+
+        Examples
+        --------
+        >>> with kwant.solvers.default.collect_stats() as stats:
+        ...     for energy in energies:
+        ...         kwant.smatrix(syst, energy)
+        >>> print(stats)
+
+        Notes
+        -----
+        To count the evaluations of the Hamiltonian, the ``hamiltonian``
+        methods of the system and of its leads are wrapped during the
+        construction of the linear system.  While statistics are collected,
+        the solver (and the system) should not be used by several threads at
+        once.
+        """
+        old_stats, old_record = self._stats, self._record
+        self._stats = stats = SolverStats()
+        try:
+            yield stats
+        finally:
+            self._stats, self._record = old_stats, old_record
+
+    def _start_record(self, method, energy):
+        """Start the statistics of a new call if statistics are collected."""
+        if self._stats is not None:
+            self._record = CallStats(method, energy)
+            self._stats.calls.append(self._record)
+
+    def _phase(self, phase):
+        """Return a context manager that times a phase of the current call."""
+        return _timing(self._record, phase)
+
+    @contextmanager
+    def _building(self, syst):
+        """Time the construction of the linear system of the current call."""
+        with _timing(self._record, 'assembly'):
+            with _counting_calls(self._record, syst):
+                yield
+
+    def _count_rhs(self, b):
+        if self._record is not None:
+            self._record.rhs_columns += b.shape[1]
+
     @abc.abstractmethod
     def _factorized(self, a):
         """
@@ -92,6 +430,105 @@ class SparseSolver(metaclass=abc.ABCMeta):
         """
         pass
 
+    def _refactorized(self, factorized_a, a):
+        """
+        Return a preprocessed version of a matrix, reusing work done for a
+        previous matrix with the same sparsity pattern.
+
+        Parameters
+        ----------
+        factorized_a : object
+            The result of a previous call to `_factorized` or `_refactorized`
+            for a matrix with exactly the same sparsity pattern as `a`.
+        a : a scipy.sparse.coo_matrix sparse matrix.
+
+        Returns
+        -------
+        factorized_a : object
+            factorized lhs to be used with `_solve_linear_sys`.
+
+        Notes
+        -----
+        This default implementation does not reuse anything.  Solvers that
+        can skip parts of the factorization (like the symbolic analysis) for
+        matrices with a known sparsity pattern should override it.
+        """
+        return self._factorized(a)
+
+    def _factorized_sys(self, linsys):
+        """
+        Return a preprocessed version of the left hand side of a linear system.
+
+        Parameters
+        ----------
+        linsys : LinearSys
+            As returned by `_make_linear_sys`.
+
+        Returns
+        -------
+        factorized_a : object
+            factorized lhs to be used with `_solve_linear_sys`.
+
+        Notes
+        -----
+        This default implementation calls `_factorized` for ``linsys.lhs``.
+        Solvers that need more information about the linear system than its
+        matrix should override it.
+        """
+        return self._factorized(linsys.lhs)
+
+    def _solve_once(self, linsys, b, kept_vars):
+        """
+        Solve the linear system `a x = b` for a matrix that is used only once.
+
+        `a` is the left hand side of `linsys`.  Return the part of the result
+        indicated in `kept_vars`.  This default implementation factorizes `a`
+        and calls `_solve_linear_sys`.  Solvers that can obtain the requested
+        part of the solution more cheaply when the factorization is not
+        needed afterwards may override it.
+        """
+        with self._phase('factorization'):
+            factorized_a = self._factorized_sys(linsys)
+        with self._phase('solve'):
+            self._count_rhs(b)
+            return self._solve_linear_sys(factorized_a, b, kept_vars)
+
+    def _inverse_diagonal(self, factorized_a, size, indices, nrhs):
+        """
+        Return diagonal entries of the inverse of a matrix.
+
+        Parameters
+        ----------
+        factorized_a : object
+            The result of calling `_factorized` for the matrix a.
+        size : integer
+            The number of rows of a.
+        indices : sequence of integers
+            Indices of the requested diagonal entries of the inverse of a.
+        nrhs : integer
+            Number of right hand sides to solve for at once.
+
+        Returns
+        -------
+        diag : NumPy array
+            The requested diagonal entries.
+
+        Notes
+        -----
+        This default implementation solves the linear system for a unit
+        vector for each requested entry.  Solvers that can compute selected
+        entries of the inverse directly should override it.
+        """
+        sprhsmat = getattr(sp, self.rhsformat + '_matrix')
+        result = np.empty(len(indices), complex)
+        for j in range(0, len(indices), nrhs):
+            cols = indices[j : j + nrhs]
+            b = sprhsmat((np.ones(len(cols)), (cols, np.arange(len(cols)))),
+                         shape=(size, len(cols)))
+            x = self._solve_linear_sys(factorized_a, b, cols)
+            result[j : j + len(cols)] = np.diagonal(x)
+        return result
+
     def _make_linear_sys(self, sys, in_leads, energy=0, args=(),
                          check_hermiticity=True, realspace=False):
         """Make a sparse linear system of equations defining a scattering
@@ -118,15 +555,17 @@ class SparseSolver(metaclass=abc.ABCMeta):
 
         Returns
         -------
-        (lhs, rhs, indices, num_orb) : LinearSys
+        (lhs, rhs, indices, num_orb, norb) : LinearSys
             `lhs` is a scipy.sparse.csc_matrix, containing the left hand side
             of the system of equations.  `rhs` is a list of matrices with the
             right hand side, with each matrix corresponding to one lead
             mentioned in `in_leads`. `indices` is a list of arrays of variables
             in the system of equations corresponding to the the outgoing modes
             in each lead, or the indices of variables, on which a lead defined
-            via self-energy adds the self-energy. Finally `num_orb` is the
+            via self-energy adds the self-energy. `num_orb` is the
             total number of degrees of freedom in the scattering region.
+            Finally, `norb` is the array of the numbers of orbitals of the
+            sites of the scattering region.
 
         lead_info : list of objects
             Contains one entry for each lead.  If `realspace=False`, this is an
@@ -145,40 +584,43 @@ class SparseSolver(metaclass=abc.ABCMeta):
         syst = sys  # ensure consistent naming across function bodies
         ensure_isinstance(syst, system.System)
 
-        splhsmat = getattr(sp, self.lhsformat + '_matrix')
         sprhsmat = getattr(sp, self.rhsformat + '_matrix')
 
         if not syst.lead_interfaces:
             raise ValueError('System contains no leads.')
-        lhs, norb = syst.hamiltonian_submatrix(args, sparse=True,
-                                              return_norb=True)[:2]
-        lhs = getattr(lhs, 'to' + self.lhsformat)()
-        lhs = lhs - energy * sp.identity(lhs.shape[0], format=self.lhsformat)
-        num_orb = lhs.shape[0]
-
-        if check_hermiticity and len(lhs.data):
-            rtol = 1e-13
-            atol = 1e-300
-            tol = rtol * np.max(np.abs(lhs.data)) + atol
-            if np.any(np.abs((lhs - lhs.T.conj()).data) > tol):
-                raise ValueError('System Hamiltonian is not Hermitian. '
-                                 'Use option `check_hermiticity=False` '
-                                 'if this is intentional.')
+        # The Hamiltonian, the energy shift, and the lead blocks of the linear
+        # system are collected as coordinate triplets and assembled in a
+        # single pass at the end.
+        with self._phase('hamiltonian'):
+            ham, norb = syst.hamiltonian_submatrix(args, sparse=True,
+                                                  return_norb=True)[:2]
+        ham = ham.tocoo()
+        num_orb = ham.shape[0]
+        blocks = [(ham.row, ham.col, ham.data)]
+        del ham
+        missing = _shift_diagonal(blocks[0], num_orb, energy)
+        if len(missing):
+            blocks.append((missing, missing,
+                           -energy * np.ones(len(missing), complex)))
+
+        if check_hermiticity:
+            _check_hermiticity(blocks, norb)
 
         offsets = np.empty(norb.shape[0] + 1, int)
         offsets[0] = 0
         offsets[1 :] = np.cumsum(norb)
 
         # Process the leads, generate the eigenvector matrices and lambda
-        # vectors. Then create blocks of the linear system and add them
-        # step by step.
+        # vectors.
+        size = num_orb
         indices = []
         rhs = []
         lead_info = []
         for leadnum, interface in enumerate(syst.lead_interfaces):
             lead = syst.leads[leadnum]
             if not realspace:
-                prop, stab = lead.modes(energy, args)
+                with self._phase('leads'):
+                    prop, stab = lead.modes(energy, args)
                 lead_info.append(prop)
                 u = stab.vecs
                 ulinv = stab.vecslmbdainv
@@ -189,14 +631,13 @@ class SparseSolver(metaclass=abc.ABCMeta):
                     rhs.append(None)
                     continue
 
-                indices.append(np.arange(lhs.shape[0], lhs.shape[0] + nprop))
+                indices.append(np.arange(size, size + nprop))
 
                 u_out, ulinv_out = u[:, nprop:], ulinv[:, nprop:]
                 u_in, ulinv_in = u[:, :nprop], ulinv[:, :nprop]
 
-                # Construct a matrix of 1's that translates the
-                # inter-cell hopping to a proper hopping
-                # from the system to the lead.
+                # The inter-cell hopping couples the lead variables to the
+                # interface orbitals of the scattering region.
                 iface_orbs = np.r_[tuple(slice(offsets[i], offsets[i + 1])
                                         for i in interface)]
 
@@ -207,37 +648,34 @@ class SparseSolver(metaclass=abc.ABCMeta):
                            'incompatible with its interface dimension.')
                     raise ValueError(msg.format(leadnum))
 
-                coords = np.r_[[np.arange(len(iface_orbs))], [iface_orbs]]
-                transf = sp.csc_matrix((np.ones(len(iface_orbs)), coords),
-                                       shape=(iface_orbs.size, lhs.shape[0]))
-
+                lead_vars = np.arange(size, size + ulinv_out.shape[1])
                 if svd_v is not None:
-                    v_sp = sp.csc_matrix(svd_v.T.conj()) * transf
-                    vdaguout_sp = (transf.T *
-                                   sp.csc_matrix(np.dot(svd_v, u_out)))
-                    lead_mat = - ulinv_out
+                    blocks.append(_dense_block(svd_v.T.conj(), lead_vars,
+                                               iface_orbs))
+                    blocks.append(_dense_block(np.dot(svd_v, u_out),
+                                               iface_orbs, lead_vars))
                 else:
-                    v_sp = transf
-                    vdaguout_sp = transf.T * sp.csc_matrix(u_out)
-                    lead_mat = - ulinv_out
-
-                lhs = sp.bmat([[lhs, vdaguout_sp], [v_sp, lead_mat]],
-                              format=self.lhsformat)
+                    blocks.append((lead_vars, iface_orbs,
+                                   np.ones(len(iface_orbs))))
+                    blocks.append(_dense_block(u_out, iface_orbs, lead_vars))
+                blocks.append(_dense_block(-ulinv_out, lead_vars, lead_vars))
+                size += len(lead_vars)
 
                 if leadnum in in_leads and nprop > 0:
                     if svd_v is not None:
-                        vdaguin_sp = transf.T * sp.csc_matrix(
-                            -np.dot(svd_v, u_in))
+                        vdaguin = -np.dot(svd_v, u_in)
                     else:
-                        vdaguin_sp = transf.T * sp.csc_matrix(-u_in)
-
-                    # defer formation of the real matrix until the proper
-                    # system size is known
-                    rhs.append((vdaguin_sp, ulinv_in))
+                        vdaguin = -u_in
+                    modes = np.arange(nprop)
+                    triplets = zip(_dense_block(vdaguin, iface_orbs, modes),
+                                   _dense_block(ulinv_in, lead_vars, modes))
+                    rhs.append((tuple(np.concatenate(t) for t in triplets),
+                                nprop))
                 else:
                     rhs.append(None)
             else:
-                sigma = lead.selfenergy(energy, args)
+                with self._phase('leads'):
+                    sigma = lead.selfenergy(energy, args)
                 lead_info.append(sigma)
                 coords = np.r_[tuple(slice(offsets[i], offsets[i + 1])
                                       for i in interface)]
@@ -248,43 +686,29 @@ class SparseSolver(metaclass=abc.ABCMeta):
                            'sites for which it is defined.')
                     raise ValueError(msg.format(leadnum))
 
-                y, x = np.meshgrid(coords, coords)
-                sig_sparse = splhsmat((sigma.flat, [x.flat, y.flat]),
-                                      lhs.shape)
-                lhs = lhs + sig_sparse  # __iadd__ is not implemented in v0.7
+                blocks.append(_dense_block(sigma, coords, coords))
                 indices.append(coords)
                 if leadnum in in_leads:
-                    # defer formation of true rhs until the proper system
-                    # size is known
-                    rhs.append((coords,))
+                    l = len(coords)
+                    rhs.append(((coords, np.arange(l), -np.ones(l)), l))
 
-        # Resize the right-hand sides to be compatible with the full lhs
-        for i, mats in enumerate(rhs):
-            if isinstance(mats, tuple):
-                if len(mats) == 1:
-                    # self-energy lead
-                    l = mats[0].shape[0]
-                    rhs[i] = sprhsmat((-np.ones(l), [mats[0], np.arange(l)]),
-                                      shape=(lhs.shape[0], l))
-                else:
-                    # lead with modes
-                    zero_rows = (lhs.shape[0] - mats[0].shape[0] -
-                                 mats[1].shape[0])
-
-                    if zero_rows:
-                        zero_mat = sprhsmat((zero_rows, mats[0].shape[1]))
-                        bmat = [[mats[0]], [mats[1]], [zero_mat]]
-                    else:
-                        bmat = [[mats[0]], [mats[1]]]
+        lhs = _assemble(blocks, size)
+        del blocks
+        lhs = getattr(lhs, 'to' + self.lhsformat)()
 
-                    rhs[i] = sp.bmat(bmat, format=self.rhsformat)
-            elif mats is None:
+        # Form the right-hand sides now that the full system size is known.
+        for i, mats in enumerate(rhs):
+            if mats is None:
                 # A lead with no rhs.
-                rhs[i] = np.zeros((lhs.shape[0], 0))
+                rhs[i] = np.zeros((size, 0))
             else:
-                raise RuntimeError('Unknown right-hand side format')
+                (rows, cols, data), ncols = mats
+                rhs[i] = sprhsmat((data, (rows, cols)), shape=(size, ncols))
 
-        return LinearSys(lhs, rhs, indices, num_orb), lead_info
+        if self._record is not None:
+            self._record.lhs_size = lhs.shape[0]
+            self._record.lhs_nnz = lhs.nnz
+        return LinearSys(lhs, rhs, indices, num_orb, norb), lead_info
 
     def smatrix(self, sys, energy=0, args=(),
                 out_leads=None, in_leads=None, check_hermiticity=True):
@@ -335,23 +759,12 @@ class SparseSolver(metaclass=abc.ABCMeta):
         syst = sys  # ensure consistent naming across function bodies
         ensure_isinstance(syst, system.System)
 
-        n = len(syst.lead_interfaces)
-        if in_leads is None:
-            in_leads = list(range(n))
-        else:
-            in_leads = list(in_leads)
-        if out_leads is None:
-            out_leads = list(range(n))
-        else:
-            out_leads = list(out_leads)
-        if (np.any(np.diff(in_leads) <= 0) or np.any(np.diff(out_leads) <= 0)):
-            raise ValueError("Lead lists must be sorted and "
-                             "with unique entries.")
-        if len(in_leads) == 0 or len(out_leads) == 0:
-            raise ValueError("No output is requested.")
+        in_leads, out_leads = _lead_lists(syst, in_leads, out_leads)
 
-        linsys, lead_info = self._make_linear_sys(syst, in_leads, energy, args,
-                                                  check_hermiticity, False)
+        self._start_record('smatrix', energy)
+        with self._building(syst):
+            linsys, lead_info = self._make_linear_sys(
+                syst, in_leads, energy, args, check_hermiticity, False)
 
         kept_vars = np.concatenate([coords for i, coords in
                                     enumerate(linsys.indices) if i in
@@ -367,11 +780,98 @@ class SparseSolver(metaclass=abc.ABCMeta):
         # See comment about zero-shaped sparse matrices at the top of common.py.
         rhs = sp.bmat([[i for i in linsys.rhs if i.shape[1]]],
                       format=self.rhsformat)
-        flhs = self._factorized(linsys.lhs)
-        data = self._solve_linear_sys(flhs, rhs, kept_vars)
+        data = self._solve_once(linsys, rhs, kept_vars)
 
         return SMatrix(data, lead_info, out_leads, in_leads, check_hermiticity)
 
+    def smatrix_sweep(self, sys, energies, args=(),
+                      out_leads=None, in_leads=None, check_hermiticity=True):
+        """
+        Compute the scattering matrix of a system for a sequence of energies.
+
+        Parameters
+        ----------
+        sys : `kwant.system.FiniteSystem`
+            Low level system, containing the leads and the Hamiltonian of a
+            scattering region.
+        energies : iterable of numbers
+            Excitation energies at which to solve the scattering problem.
+        args : tuple, defaults to empty
+            Positional arguments to pass to the ``hamiltonian`` method.
+        out_leads : sequence of integers or ``None``
+            Numbers of leads where current or wave function is extracted.  None
+            is interpreted as all leads. Default is ``None`` and means "all
+            leads".
+        in_leads : sequence of integers or ``None``
+            Numbers of leads in which current or wave function is injected.
+            None is interpreted as all leads. Default is ``None`` and means
+            "all leads".
+        check_hermiticity : ``bool``
+            Check if the Hamiltonian matrices are Hermitian.
+            Enables deduction of missing transmission coefficients.
+
+        Returns
+        -------
+        output : iterator over `~kwant.solvers.common.SMatrix`
+            One scattering matrix for each of the `energies`, in the same
+            order.
+
+        Notes
+        -----
+        The result is identical to calling `smatrix` for each energy, but
+        whenever the sparsity pattern of the linear system does not change
+        from one energy to the next (i.e. typically as long as the numbers of
+        modes in the leads stay the same), the solver may reuse a part of the
+        previous factorization.  For the MUMPS solver this means that the
+        expensive analysis (ordering) step is only performed when the pattern
+        changes.
+
+        The scattering matrices are computed lazily, one per iteration step.
+        """
+
+        syst = sys  # ensure consistent naming across function bodies
+        ensure_isinstance(syst, system.System)
+
+        in_leads, out_leads = _lead_lists(syst, in_leads, out_leads)
+
+        flhs = pattern = None
+        for energy in energies:
+            self._start_record('smatrix_sweep', energy)
+            with self._building(syst):
+                linsys, lead_info = self._make_linear_sys(
+                    syst, in_leads, energy, args, check_hermiticity, False)
+
+            kept_vars = np.concatenate([coords for i, coords in
+                                        enumerate(linsys.indices) if i in
+                                        out_leads])
+
+            # Do not perform factorization if no calculation is to be done.
+            len_rhs = sum(i.shape[1] for i in linsys.rhs)
+            len_kv = len(kept_vars)
+            if not(len_rhs and len_kv):
+                yield SMatrix(np.zeros((len_kv, len_rhs)), lead_info,
+                              out_leads, in_leads, check_hermiticity)
+                continue
+
+            # See comment about zero-shaped sparse matrices at the top of
+            # common.py.
+            rhs = sp.bmat([[i for i in linsys.rhs if i.shape[1]]],
+                          format=self.rhsformat)
+
+            new_pattern = _sparsity_pattern(linsys.lhs)
+            with self._phase('factorization'):
+                if flhs is not None and _same_pattern(pattern, new_pattern):
+                    flhs = self._refactorized(flhs, linsys.lhs)
+                else:
+                    flhs = self._factorized_sys(linsys)
+            pattern = new_pattern
+            with self._phase('solve'):
+                self._count_rhs(rhs)
+                data = self._solve_linear_sys(flhs, rhs, kept_vars)
+
+            yield SMatrix(data, lead_info, out_leads, in_leads,
+                          check_hermiticity)
+
     def greens_function(self, sys, energy=0, args=(),
                         out_leads=None, in_leads=None, check_hermiticity=True):
         """
@@ -424,23 +924,12 @@ class SparseSolver(metaclass=abc.ABCMeta):
         syst = sys  # ensure consistent naming across function bodies
         ensure_isinstance(syst, system.System)
 
-        n = len(syst.lead_interfaces)
-        if in_leads is None:
-            in_leads = list(range(n))
-        else:
-            in_leads = list(in_leads)
-        if out_leads is None:
-            out_leads = list(range(n))
-        else:
-            out_leads = list(out_leads)
-        if (np.any(np.diff(in_leads) <= 0) or np.any(np.diff(out_leads) <= 0)):
-            raise ValueError("Lead lists must be sorted and "
-                             "with unique entries.")
-        if len(in_leads) == 0 or len(out_leads) == 0:
-            raise ValueError("No output is requested.")
+        in_leads, out_leads = _lead_lists(syst, in_leads, out_leads)
 
-        linsys, lead_info = self._make_linear_sys(syst, in_leads, energy, args,
-                                                  check_hermiticity, True)
+        self._start_record('greens_function', energy)
+        with self._building(syst):
+            linsys, lead_info = self._make_linear_sys(
+                syst, in_leads, energy, args, check_hermiticity, True)
 
         kept_vars = np.concatenate([coords for i, coords in
                                     enumerate(linsys.indices) if i in
@@ -456,13 +945,18 @@ class SparseSolver(metaclass=abc.ABCMeta):
         # See comment about zero-shaped sparse matrices at the top of common.py.
         rhs = sp.bmat([[i for i in linsys.rhs if i.shape[1]]],
                       format=self.rhsformat)
-        flhs = self._factorized(linsys.lhs)
-        data = self._solve_linear_sys(flhs, rhs, kept_vars)
+        with self._phase('factorization'):
+            flhs = self._factorized_sys(linsys)
+        with self._phase('solve'):
+            self._count_rhs(rhs)
+            data = self._solve_linear_sys(flhs, rhs, kept_vars)
 
         return GreensFunction(data, lead_info, out_leads, in_leads,
                               check_hermiticity)
 
-    def ldos(self, sys, energy=0, args=(), check_hermiticity=True):
+    def ldos(self, sys, energy=0, args=(), check_hermiticity=True,
+             sites=None, orbitals=None, max_memory=None,
+             selected_inversion=None):
         """
         Calculate the local density of states of a system at a given energy.
 
@@ -478,11 +972,41 @@ class SparseSolver(metaclass=abc.ABCMeta):
             evaluate the hamiltonian matrix elements
         check_hermiticity : ``bool``
             Check if the Hamiltonian matrices are Hermitian.
+        sites : sequence of integers or ``None``
+            Numbers of the sites for which to compute the local density of
+            states.  ``None`` means all sites.
+        orbitals : sequence of integers or ``None``
+            Numbers of the orbitals for which to compute the local density of
+            states.  Cannot be combined with `sites`.
+        max_memory : number or ``None``
+            Approximate upper bound, in bytes, for the memory taken by the
+            right hand sides and solutions that are treated at once.  If
+            given, the number of simultaneously solved right hand sides is
+            chosen accordingly.  Otherwise, the ``nrhs`` option of the solver
+            is used.
+        selected_inversion : ``bool`` or ``None``
+            Whether to compute the local density of states from the diagonal
+            of the retarded Green's function, using the self-energies of the
+            leads, instead of from the scattering wave functions.  ``None``
+            (default) means to do so only if some lead provides only a
+            self-energy.
 
         Returns
         -------
         ldos : a NumPy array
-            Local density of states at each orbital of the system.
+            Local density of states at each orbital of the system, or only at
+            the requested orbitals (in the order of `sites` or `orbitals`).
+
+        Notes
+        -----
+        The right hand sides are processed lead by lead and only the
+        requested orbitals of the solutions are kept, such that restricting
+        the output to a small region also reduces the memory usage.
+
+        With selected inversion, the cost does not depend on the number of
+        modes in the leads.  Solvers that support it (like MUMPS) compute the
+        diagonal of the Green's function directly from the factorization;
+        otherwise one linear system is solved per requested orbital.
         """
 
         syst = sys  # ensure consistent naming across function bodies
@@ -490,32 +1014,75 @@ class SparseSolver(metaclass=abc.ABCMeta):
         if not check_hermiticity:
             raise NotImplementedError("ldos for non-Hermitian Hamiltonians "
                                       "is not implemented yet.")
+        if sites is not None and orbitals is not None:
+            raise ValueError("Only one of `sites` and `orbitals` may be "
+                             "given.")
+
+        if selected_inversion is None:
+            selected_inversion = not all(hasattr(lead, 'modes')
+                                         for lead in syst.leads)
+
+        self._start_record('ldos', energy)
+        with self._building(syst):
+            if selected_inversion:
+                linsys = self._make_linear_sys(syst, [], energy, args,
+                                               check_hermiticity, True)[0]
+            else:
+                linsys = self._make_linear_sys(syst, range(len(syst.leads)),
+                                               energy, args,
+                                               check_hermiticity)[0]
+
+        if sites is not None:
+            offsets = np.zeros(len(linsys.norb) + 1, int)
+            offsets[1:] = np.cumsum(linsys.norb)
+            sites = np.asarray(sites, int)
+            kept_vars = np.concatenate(
+                [np.arange(offsets[i], offsets[i + 1]) for i in sites]
+                or [np.empty(0, int)])
+        elif orbitals is not None:
+            kept_vars = np.asarray(orbitals, int)
+            if np.any((kept_vars < 0) | (kept_vars >= linsys.num_orb)):
+                raise IndexError('Orbital number out of range.')
+        else:
+            kept_vars = np.arange(linsys.num_orb)
+        kept_vars = np.asarray(kept_vars, int)
 
-        for lead in syst.leads:
-            if not hasattr(lead, 'modes') and hasattr(lead, 'selfenergy'):
-                # TODO: fix this
-                raise NotImplementedError("ldos for leads with only "
-                                          "self-energy is not implemented yet.")
-
-        linsys = self._make_linear_sys(syst, range(len(syst.leads)), energy,
-                                       args, check_hermiticity)[0]
-
-        ldos = np.zeros(linsys.num_orb, float)
+        if max_memory is None:
+            nrhs = self.nrhs
+        else:
+            # A dense right hand side column and the kept part of the
+            # solution, in complex double precision.
+            column_size = 16 * (linsys.lhs.shape[0] + len(kept_vars))
+            nrhs = max(1, int(max_memory // column_size))
+
+        if selected_inversion:
+            # The left hand side is H - E + Sigma = -G^-1.
+            if not len(kept_vars):
+                return np.zeros(0, float)
+            with self._phase('factorization'):
+                factored = self._factorized_sys(linsys)
+            with self._phase('solve'):
+                diag = self._inverse_diagonal(factored, linsys.lhs.shape[0],
+                                              kept_vars, nrhs)
+            return diag.imag * (1 / np.pi)
+
+        ldos = np.zeros(len(kept_vars), float)
 
         # Do not perform factorization if no further calculation is needed.
         if not sum(i.shape[1] for i in linsys.rhs):
             return ldos
 
-        factored = self._factorized(linsys.lhs)
+        with self._phase('factorization'):
+            factored = self._factorized_sys(linsys)
 
-        # See comment about zero-shaped sparse matrices at the top of common.py.
-        rhs = sp.bmat([[i for i in linsys.rhs if i.shape[1]]],
-                      format=self.rhsformat)
-        for j in range(0, rhs.shape[1], self.nrhs):
-            jend = min(j + self.nrhs, rhs.shape[1])
-            psi = self._solve_linear_sys(factored, rhs[:, j:jend],
-                                         slice(linsys.num_orb))
-            ldos += np.sum(np.square(abs(psi)), axis=1)
+        for rhs in linsys.rhs:
+            for j in range(0, rhs.shape[1], nrhs):
+                jend = min(j + nrhs, rhs.shape[1])
+                with self._phase('solve'):
+                    self._count_rhs(rhs[:, j:jend])
+                    psi = self._solve_linear_sys(factored, rhs[:, j:jend],
+                                                 kept_vars)
+                ldos += np.sum(np.square(abs(psi)), axis=1)
 
         return ldos * (0.5 / np.pi)
 
@@ -564,16 +1131,25 @@ class WaveFunction:
                 msg = ('Wave functions for leads with only self-energy'
                        ' are not available yet.')
                 raise NotImplementedError(msg)
-        linsys = solver._make_linear_sys(syst, range(len(syst.leads)), energy,
-                                         args, check_hermiticity)[0]
+        solver._start_record('wave_function', energy)
+        with solver._building(syst):
+            linsys = solver._make_linear_sys(syst, range(len(syst.leads)),
+                                             energy, args,
+                                             check_hermiticity)[0]
         self.solve = solver._solve_linear_sys
         self.rhs = linsys.rhs
-        self.factorized_h = solver._factorized(linsys.lhs)
+        with solver._phase('factorization'):
+            self.factorized_h = solver._factorized_sys(linsys)
         self.num_orb = linsys.num_orb
+        # The solves of later calls are added to the statistics of this call.
+        self.record = solver._record
 
     def __call__(self, lead):
-        result = self.solve(self.factorized_h, self.rhs[lead],
-                            slice(self.num_orb))
+        with _timing(self.record, 'solve'):
+            if self.record is not None:
+                self.record.rhs_columns += self.rhs[lead].shape[1]
+            result = self.solve(self.factorized_h, self.rhs[lead],
+                                slice(self.num_orb))
         return result.transpose()
 
 
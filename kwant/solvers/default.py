@@ -6,7 +6,8 @@
 # the file AUTHORS.rst at the top-level directory of this distribution and at
 # http://kwant-project.org/authors.
 
-__all__ = ['smatrix', 'ldos', 'wave_function', 'greens_function']
+__all__ = ['smatrix', 'smatrix_sweep', 'ldos', 'wave_function',
+           'greens_function', 'collect_stats']
 
 # MUMPS usually works best.  Use SciPy as fallback.
 import warnings
@@ -21,6 +22,8 @@ except ImportError:
 hidden_instance = smodule.Solver()
 
 smatrix = hidden_instance.smatrix
+smatrix_sweep = hidden_instance.smatrix_sweep
+collect_stats = hidden_instance.collect_stats
 ldos = hidden_instance.ldos
 wave_function = hidden_instance.wave_function
 greens_function = hidden_instance.greens_function
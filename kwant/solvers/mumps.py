@@ -6,14 +6,28 @@
 # the file AUTHORS.rst at the top-level directory of this distribution and at
 # http://kwant-project.org/authors.
 
-__all__ = ['smatrix', 'ldos', 'wave_function', 'greens_function', 'options',
-           'Solver']
+__all__ = ['smatrix', 'smatrix_sweep', 'ldos', 'wave_function',
+           'greens_function', 'options', 'collect_stats', 'Solver']
 
 import numpy as np
+import scipy.sparse as sp
 from . import common
 from ..linalg import mumps
 
 
+def _real_if_possible(a):
+    """Return a COO matrix with real data if all the entries of `a` are real.
+
+    Real matrices (e.g. the Hamiltonians of closed systems without magnetic
+    field) are factorized by MUMPS in real arithmetics, which is faster and
+    needs half the memory.  The index arrays are shared with `a`.
+    """
+    a = a.tocoo()
+    if np.iscomplexobj(a.data) and not np.any(a.data.imag):
+        a = sp.coo_matrix((a.data.real, (a.row, a.col)), shape=a.shape)
+    return a
+
+
 class Solver(common.SparseSolver):
     """Sparse Solver class based on the sparse direct solver MUMPS."""
 
@@ -22,13 +36,16 @@ class Solver(common.SparseSolver):
 
     def __init__(self):
         self.nrhs = self.ordering = self.sparse_rhs = None
+        self.schur_smatrix = None
         self.reset_options()
 
     def reset_options(self):
         """Set the options to default values.  Return the old options."""
-        return self.options(nrhs=6, ordering='kwant_decides', sparse_rhs=False)
+        return self.options(nrhs=6, ordering='kwant_decides', sparse_rhs=False,
+                            schur_smatrix=False)
 
-    def options(self, nrhs=None, ordering=None, sparse_rhs=None):
+    def options(self, nrhs=None, ordering=None, sparse_rhs=None,
+                schur_smatrix=None):
         """
         Modify some options.  Return the old options.
 
@@ -57,6 +74,13 @@ class Solver(common.SparseSolver):
             MUMPS. Preliminary tests have not shown a significant performance
             increase when this feature is used, but this needs more looking
             into. Default value is False.
+        schur_smatrix : True or False
+            whether to compute scattering matrices as a Schur complement of
+            the linear system, augmented by the right hand sides and the
+            selection of the outgoing modes.  MUMPS then returns the
+            scattering matrix directly from the factorization, and the
+            factors are discarded instead of being used in a separate solve
+            phase.  Default value is False.
 
         Returns
         -------
@@ -75,7 +99,8 @@ class Solver(common.SparseSolver):
 
         old_opts = {'nrhs': self.nrhs,
                     'ordering': self.ordering,
-                    'sparse_rhs': self.sparse_rhs}
+                    'sparse_rhs': self.sparse_rhs,
+                    'schur_smatrix': self.schur_smatrix}
 
         if nrhs is not None:
             if nrhs < 1 and int(nrhs) != nrhs:
@@ -97,13 +122,78 @@ class Solver(common.SparseSolver):
         if sparse_rhs is not None:
             self.sparse_rhs = bool(sparse_rhs)
 
+        if schur_smatrix is not None:
+            self.schur_smatrix = bool(schur_smatrix)
+
         return old_opts
 
+    def _record_factorization(self, stats, analysis=None):
+        """Add MUMPS statistics to the statistics of the current call."""
+        record = self._record
+        if record is None:
+            return
+        info = {'nonzeros': stats.nonzeros, 'flops': stats.flops,
+                'memory': stats.memory}
+        if analysis is not None:
+            # The analysis is part of the timed factorization.
+            record.add_time('factorization', -analysis.time,
+                            -analysis.cpu_time)
+            record.add_time('analysis', analysis.time, analysis.cpu_time)
+            info.update(est_nonzeros=analysis.est_nonzeros,
+                        est_flops=analysis.est_flops,
+                        est_memory=analysis.est_mem_incore,
+                        ordering=analysis.ordering)
+        record.factorizations.append(info)
+
     def _factorized(self, a):
         inst = mumps.MUMPSContext()
-        inst.factor(a, ordering=self.ordering)
+        inst.factor(_real_if_possible(a), ordering=self.ordering,
+                    borrow_a=True)
+        self._record_factorization(inst.factor_stats, inst.analysis_stats)
         return inst
 
+    def _refactorized(self, factorized_a, a):
+        a = _real_if_possible(a)
+        if factorized_a.dtype != ('z' if np.iscomplexobj(a.data) else 'd'):
+            return self._factorized(a)
+        # Keep the MUMPS context and its analysis, only redo the numerical
+        # factorization.
+        factorized_a.factor(a, ordering=self.ordering, reuse_analysis=True,
+                            borrow_a=True)
+        self._record_factorization(factorized_a.factor_stats)
+        return factorized_a
+
+    def _solve_once(self, linsys, b, kept_vars):
+        if not self.schur_smatrix:
+            return super()._solve_once(linsys, b, kept_vars)
+
+        # The solution x[kept_vars] of a x = b is the Schur complement
+        # -C a^-1 (-b) of the augmented matrix [[a, -b], [C, 0]], where C
+        # selects the kept variables.  The Schur block must be square.
+        a = linsys.lhs
+        n = a.shape[0]
+        kept_vars = np.arange(n)[kept_vars]
+        nkept, nrhs = len(kept_vars), b.shape[1]
+        schur_vars = np.arange(n, n + max(nkept, nrhs))
+        a, b = a.tocoo(), b.tocoo()
+        rows = np.concatenate([a.row, b.row, schur_vars[:nkept], schur_vars])
+        cols = np.concatenate([a.col, n + b.col, kept_vars, schur_vars])
+        data = np.concatenate([a.data, -b.data, np.ones(nkept),
+                               np.zeros(len(schur_vars))])
+        size = n + len(schur_vars)
+        augmented = sp.coo_matrix((data, (rows, cols)), shape=(size, size))
+        self._count_rhs(b)
+        with self._phase('factorization'):
+            schur, stats = mumps.schur_complement(augmented, schur_vars,
+                                                  ordering=self.ordering,
+                                                  calc_stats=True,
+                                                  overwrite_a=True)
+        self._record_factorization(stats)
+        return schur[:nkept, :nrhs]
+
+    def _inverse_diagonal(self, factorized_a, size, indices, nrhs):
+        return factorized_a.inverse_diagonal(indices)
+
     def _solve_linear_sys(self, factorized_a, b, kept_vars):
         if b.shape[1] == 0:
             return b[kept_vars]
@@ -124,6 +214,8 @@ class Solver(common.SparseSolver):
 default_solver = Solver()
 
 smatrix = default_solver.smatrix
+smatrix_sweep = default_solver.smatrix_sweep
+collect_stats = default_solver.collect_stats
 greens_function = default_solver.greens_function
 ldos = default_solver.ldos
 wave_function = default_solver.wave_function
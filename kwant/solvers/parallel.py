@@ -0,0 +1,194 @@
+# Copyright 2011-2016 Kwant authors.
+#
+# This file is part of Kwant.  It is subject to the license terms in the file
+# LICENSE.rst found in the top-level directory of this distribution and at
+# http://kwant-project.org/license.  A list of Kwant authors can be found in
+# the file AUTHORS.rst at the top-level directory of this distribution and at
+# http://kwant-project.org/authors.
+
+"""Parallel computation of scattering matrices for many parameter values"""
+
+__all__ = ['smatrix_map']
+
+import collections
+import itertools
+import multiprocessing
+import os
+import pickle
+import sys
+import tempfile
+import threading
+import uuid
+from concurrent import futures
+import numpy as np
+from . import default
+
+
+# Each worker (thread or process) has its own solver instance and keeps
+# a reference to the system, such that it is set up only once per call of
+# `smatrix_map`.
+_worker = threading.local()
+
+# The setups of the running calls of `smatrix_map`.  Threads and forked
+# processes share (a copy of) the memory of the calling process, other
+# worker processes add the setup when they start or on first use.
+_setups = {}
+
+
+def _load_setup(key, pickled_setup):
+    _setups[key] = pickle.loads(pickled_setup)
+
+
+def _init_worker(syst, solver_class, options, kwargs, transmission):
+    solver = solver_class()
+    if options:
+        solver.options(**options)
+    _worker.syst = syst
+    _worker.solver = solver
+    _worker.kwargs = kwargs
+    _worker.transmission = transmission
+
+
+def _solve(key, setup_file, energy, args):
+    if getattr(_worker, 'key', None) != key:
+        if key not in _setups:
+            # Only before Python 3.7, where executors have no initializer.
+            with open(setup_file, 'rb') as f:
+                _load_setup(key, f.read())
+        _init_worker(*_setups[key])
+        _worker.key = key
+    smatrix = _worker.solver.smatrix(_worker.syst, energy, args,
+                                     **_worker.kwargs)
+    if not _worker.transmission:
+        return smatrix
+    return np.array([[smatrix.transmission(i, j) for j in smatrix.in_leads]
+                     for i in smatrix.out_leads])
+
+
+def smatrix_map(syst, points, out_leads=None, in_leads=None,
+                check_hermiticity=True, transmission=False, ordered=True,
+                processes=False, max_workers=None, solver=None, options=None):
+    """Compute scattering matrices for many energies and arguments in parallel.
+
+    Parameters
+    ----------
+    syst : `~kwant.system.FiniteSystem`
+        Low level system, as e.g. obtained from `Builder.finalized`.
+    points : iterable of pairs ``(energy, args)``
+        The energies and the arguments of the Hamiltonian for which to compute
+        the scattering matrix.
+    out_leads : sequence of integers or ``None``
+        Numbers of leads where current or wave function is extracted.  None
+        is interpreted as all leads.
+    in_leads : sequence of integers or ``None``
+        Numbers of leads in which current or wave function is injected.  None
+        is interpreted as all leads.
+    check_hermiticity : ``bool``
+        Check if the Hamiltonian matrices are Hermitian.
+    transmission : ``bool``
+        If true, do not return the scattering matrices but arrays of shape
+        ``(len(out_leads), len(in_leads))`` of the transmissions between all
+        pairs of leads.  For process pools, this avoids transferring the
+        scattering matrices back to the calling process.
+    ordered : ``bool``
+        If true (default), the results are yielded in the order of `points`.
+        Otherwise, pairs ``(n, result)`` are yielded as soon as the results
+        are available, where ``n`` is the position of the point in `points`.
+    processes : ``bool``
+        Whether to use a pool of processes instead of a pool of threads.
+    max_workers : integer or ``None``
+        Number of worker threads or processes.  ``None`` means the default of
+        the `concurrent.futures` executor.
+    solver : class or ``None``
+        Solver class to use, e.g. `kwant.solvers.sparse.Solver`.  ``None``
+        means the solver class that is used by `kwant.solvers.default`.
+    options : dict or ``None``
+        Options to be passed to the ``options`` method of each solver
+        instance.
+
+    Returns
+    -------
+    results : iterator
+        Instances of `~kwant.solvers.common.SMatrix`, or transmission arrays,
+        for each point.
+
+    Notes
+    -----
+    Each worker uses its own solver instance, which is set up when the worker
+    handles its first point.  When processes are used with a start method
+    other than "fork", the system (together with the other parameters) is
+    pickled only once, and sent to and unpickled by each worker only once.
+    This requires the system, including its value functions, to be
+    picklable.
+
+    Only a limited number of points (a few per worker) is submitted ahead of
+    the results that have been consumed, so `points` may be a long or even
+    infinite iterator.
+
+    Thread pools are cheaper to set up, but the evaluation of the
+    Hamiltonian, which is done in Python, cannot run in parallel in several
+    threads.
+
+    Breaking out of the loop over the results cancels the computations that
+    have not been started yet.
+    """
+    if solver is None:
+        solver = default.smodule.Solver
+    kwargs = dict(out_leads=out_leads, in_leads=in_leads,
+                  check_hermiticity=check_hermiticity)
+    setup = (syst, solver, options, kwargs, transmission)
+    key = uuid.uuid4().hex
+    executor_kwargs = {}
+    setup_file = None
+    if processes:
+        executor_class = futures.ProcessPoolExecutor
+        if multiprocessing.get_start_method() != 'fork':
+            pickled_setup = pickle.dumps(setup, pickle.HIGHEST_PROTOCOL)
+            if sys.version_info >= (3, 7):
+                executor_kwargs = dict(initializer=_load_setup,
+                                       initargs=(key, pickled_setup))
+            else:
+                fd, setup_file = tempfile.mkstemp()
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(pickled_setup)
+            del pickled_setup
+    else:
+        executor_class = futures.ThreadPoolExecutor
+    _setups[key] = setup
+    window = 4 * (max_workers or os.cpu_count() or 1)
+    points = enumerate(points)
+
+    try:
+        with executor_class(max_workers, **executor_kwargs) as executor:
+            # Futures of the submitted points, in the order of `points`.
+            tasks = collections.OrderedDict()
+
+            def submit():
+                for n, (energy, args) in itertools.islice(
+                        points, window - len(tasks)):
+                    task = executor.submit(_solve, key, setup_file,
+                                           energy, args)
+                    tasks[task] = n
+
+            try:
+                submit()
+                while tasks:
+                    if ordered:
+                        task, n = tasks.popitem(last=False)
+                        result = task.result()
+                        submit()
+                        yield result
+                    else:
+                        done = futures.wait(
+                            tasks, return_when=futures.FIRST_COMPLETED)[0]
+                        results = [(tasks.pop(task), task.result())
+                                   for task in done]
+                        submit()
+                        yield from results
+            finally:
+                for task in tasks:
+                    task.cancel()
+    finally:
+        del _setups[key]
+        if setup_file is not None:
+            os.remove(setup_file)
@@ -0,0 +1,287 @@
+# Copyright 2011-2016 Kwant authors.
+#
+# This file is part of Kwant.  It is subject to the license terms in the file
+# LICENSE.rst found in the top-level directory of this distribution and at
+# http://kwant-project.org/license.  A list of Kwant authors can be found in
+# the file AUTHORS.rst at the top-level directory of this distribution and at
+# http://kwant-project.org/authors.
+
+"""Recursive Green's function solver"""
+
+__all__ = ['smatrix', 'smatrix_sweep', 'ldos', 'wave_function',
+           'greens_function', 'options', 'reset_options', 'collect_stats',
+           'Solver']
+
+from collections import namedtuple
+import numpy as np
+import scipy.sparse as sp
+import scipy.linalg as la
+from . import common
+from ..graph import slicer
+
+# A linear system of `kwant.solvers.common` together with the numbers of the
+# slices of all its variables.
+_SlicedLinearSys = namedtuple('_SlicedLinearSys',
+                              common.LinearSys._fields + ('slice_of',))
+
+
+def _site_slices(syst):
+    """Slice the sites of `syst` into layers between its leads.
+
+    The first lead is put to the left, all other leads to the right.  Sites
+    in one slice only have neighbors in the same and in the adjacent slices.
+    """
+    interfaces = syst.lead_interfaces
+    if len(interfaces) < 2:
+        return [np.arange(syst.graph.num_nodes)]
+    left = interfaces[0]
+    right = np.concatenate([np.asarray(i, int) for i in interfaces[1:]])
+    if not (len(left) and len(right)):
+        return [np.arange(syst.graph.num_nodes)]
+    return slicer.slice(syst.graph, left, right)
+
+
+def _variable_slices(site_slices, linsys):
+    """Return the numbers of the slices of all variables of `linsys`.
+
+    Orbitals belong to the slice of their site.  Each of the additional
+    variables of the leads is put into the slice of a variable that it is
+    coupled to.
+    """
+    lhs = sp.csr_matrix(linsys.lhs)
+    norb = np.asarray(linsys.norb)
+    slice_of_site = np.empty(len(norb), int)
+    for n, sites in enumerate(site_slices):
+        slice_of_site[np.asarray(sites, int)] = n
+    slice_of = -np.ones(lhs.shape[0], int)
+    slice_of[:linsys.num_orb] = np.repeat(slice_of_site, norb)
+
+    # Lead variables are coupled to the interface orbitals of their lead, or
+    # at least to other variables of the same lead.
+    unassigned = list(range(linsys.num_orb, lhs.shape[0]))
+    while unassigned:
+        remaining = []
+        for var in unassigned:
+            nbors = lhs.indices[lhs.indptr[var] : lhs.indptr[var + 1]]
+            nbor_slices = slice_of[nbors]
+            nbor_slices = nbor_slices[nbor_slices >= 0]
+            if len(nbor_slices):
+                slice_of[var] = nbor_slices.min()
+            else:
+                remaining.append(var)
+        if len(remaining) == len(unassigned):
+            # Not coupled to anything: put the rest into the first slice.
+            slice_of[remaining] = 0
+            break
+        unassigned = remaining
+    return slice_of
+
+
+class _FactorizedBlockTridiagonal:
+    """A matrix together with a partition of its variables into slices.
+
+    The matrix must be block-tridiagonal with respect to the slices, i.e.
+    variables may only be coupled to variables in the same or in the adjacent
+    slices.
+    """
+
+    def __init__(self, a, slice_of):
+        a = sp.csr_matrix(a)
+        coo = a.tocoo()
+        if np.any(abs(slice_of[coo.row] - slice_of[coo.col]) > 1):
+            raise ValueError('Matrix is not block-tridiagonal with respect to '
+                             'the slicing of the system.')
+        order = np.argsort(slice_of, kind='mergesort')
+        bounds = np.searchsorted(slice_of[order],
+                                 np.arange(slice_of.max() + 2))
+        self.slices = [order[i:j] for i, j in zip(bounds[:-1], bounds[1:])]
+        self.slice_of = slice_of
+        self.a = a
+        self.lu = None
+
+    def _block(self, rows, cols):
+        return self.a[rows][:, cols].toarray()
+
+    def solve_kept(self, b, kept_vars):
+        """Solve ``a x = b`` and return ``x[kept_vars]``.
+
+        The slices are eliminated one by one, only the Schur complement of
+        the kept variables and of the current slice is held in memory.
+        """
+        a_block = self._block
+        active = np.empty(0, int)   # Kept variables and current slice.
+        mat = np.empty((0, 0), complex)
+        rhs = np.empty((0, b.shape[1]), complex)
+        is_kept = np.zeros(self.a.shape[0], bool)
+        is_kept[kept_vars] = True
+        prev = np.empty(0, int)     # Indices into `active` of previous slice.
+
+        def eliminate(mat, rhs, elim, keep):
+            lu = la.lu_factor(mat[np.ix_(elim, elim)])
+            x = la.lu_solve(lu, np.hstack([mat[np.ix_(elim, keep)],
+                                           rhs[elim]]))
+            coupling = mat[np.ix_(keep, elim)]
+            n = len(keep)
+            return (mat[np.ix_(keep, keep)] - np.dot(coupling, x[:, :n]),
+                    rhs[keep] - np.dot(coupling, x[:, n:]))
+
+        for new in self.slices + [None]:
+            if new is not None:
+                # Add the next slice.
+                n = len(active)
+                mat, old_mat = np.empty((n + len(new),) * 2, complex), mat
+                mat[:n, :n] = old_mat
+                mat[:n, n:] = a_block(active, new)
+                mat[n:, :n] = a_block(new, active)
+                mat[n:, n:] = a_block(new, new)
+                rhs = np.vstack([rhs, b[new].toarray()])
+                prev_len = len(active)
+                active = np.concatenate([active, new])
+            else:
+                prev_len = len(active)
+            # Eliminate the variables of the previous slice that are not kept.
+            elim = prev[~is_kept[active[prev]]]
+            if len(elim):
+                keep = np.setdiff1d(np.arange(len(active)), elim)
+                mat, rhs = eliminate(mat, rhs, elim, keep)
+                active = active[keep]
+                prev_len -= np.count_nonzero(elim < prev_len)
+            prev = np.arange(prev_len, len(active))
+
+        solution = la.solve(mat, rhs) if len(active) else rhs
+        position = np.empty(self.a.shape[0], int)
+        position[active] = np.arange(len(active))
+        return solution[position[kept_vars]]
+
+    def solve_full(self, b, kept_vars):
+        """Solve ``a x = b`` and return ``x[kept_vars]``.
+
+        The block LU decomposition is computed on first use and kept, such
+        that all the slices of the solution can be obtained by back
+        substitution.  Its memory usage is proportional to the total number
+        of slices.
+        """
+        slices = self.slices
+        a_block = self._block
+        if self.lu is None:
+            self.lu = []
+            upper = None
+            for n, cur in enumerate(slices):
+                diag = a_block(cur, cur)
+                lower = None
+                if n:
+                    lower = a_block(cur, slices[n - 1])
+                    diag -= np.dot(lower, upper)
+                lu = la.lu_factor(diag)
+                if n + 1 < len(slices):
+                    upper = la.lu_solve(lu, a_block(cur, slices[n + 1]))
+                else:
+                    upper = None
+                self.lu.append((lu, lower, upper))
+
+        y = []
+        for (lu, lower, upper), cur in zip(self.lu, slices):
+            rhs = b[cur].toarray().astype(complex)
+            if lower is not None:
+                rhs -= np.dot(lower, y[-1])
+            y.append(la.lu_solve(lu, rhs))
+        x = np.empty((self.a.shape[0], b.shape[1]), complex)
+        x_next = None
+        for (lu, lower, upper), cur, y_cur in zip(reversed(self.lu),
+                                                 reversed(slices), reversed(y)):
+            if upper is not None:
+                y_cur -= np.dot(upper, x_next)
+            x[cur] = x_next = y_cur
+        return x[kept_vars]
+
+
+class Solver(common.SparseSolver):
+    """Sparse solver class based on the recursive Green's function algorithm.
+
+    The scattering region is cut into slices between the first lead and the
+    remaining ones using `kwant.graph.slicer`, and the Hamiltonian is treated
+    as a block-tridiagonal matrix with respect to these slices.
+
+    When only few variables of the solution are needed, like for the
+    scattering matrix, the slices are eliminated one by one and only one
+    slice is held in memory at a time.  Otherwise, the block LU decomposition
+    of all the slices is kept, and the memory usage grows with the number of
+    slices.
+    """
+
+    lhsformat = 'csr'
+    rhsformat = 'csr'
+
+    def __init__(self):
+        self.nrhs = None
+        self.reset_options()
+
+    def reset_options(self):
+        """Set the options to default values.  Return the old options."""
+        return self.options(nrhs=10)
+
+    def options(self, nrhs=None):
+        """
+        Modify some options.  Return the old options.
+
+        Parameters
+        ----------
+        nrhs : number
+            number of right hand sides that should be solved simultaneously
+            when computing the full solution (as for `ldos` or
+            `wave_function`).  Default value is 10.
+
+        Returns
+        -------
+        old_options : dict
+            dictionary containing the previous options.
+        """
+        old_opts = {'nrhs': self.nrhs}
+        if nrhs is not None:
+            if nrhs < 1 or int(nrhs) != nrhs:
+                raise ValueError("nrhs must be an integer bigger than zero")
+            nrhs = int(nrhs)
+            self.nrhs = nrhs
+        return old_opts
+
+    def _make_linear_sys(self, sys, in_leads, energy=0, args=(),
+                         check_hermiticity=True, realspace=False):
+        linsys, lead_info = super()._make_linear_sys(
+            sys, in_leads, energy, args, check_hermiticity, realspace)
+        slice_of = _variable_slices(_site_slices(sys), linsys)
+        return _SlicedLinearSys(*linsys, slice_of=slice_of), lead_info
+
+    def _factorized_sys(self, linsys):
+        return _FactorizedBlockTridiagonal(linsys.lhs, linsys.slice_of)
+
+    def _factorized(self, a):
+        # Without knowledge of the system, treat the matrix as a single slice.
+        return _FactorizedBlockTridiagonal(a, np.zeros(a.shape[0], int))
+
+    def _refactorized(self, factorized_a, a):
+        # A matrix with the same sparsity pattern has the same slicing.
+        return _FactorizedBlockTridiagonal(a, factorized_a.slice_of)
+
+    def _solve_linear_sys(self, factorized_a, b, kept_vars):
+        kept_vars = np.arange(b.shape[0])[kept_vars]
+        if b.shape[1] == 0:
+            return np.zeros((len(kept_vars), 0), complex)
+        b = sp.csr_matrix(b)
+        width = max(len(s) for s in factorized_a.slices)
+        # Only retain the kept variables if that is cheaper than keeping the
+        # full decomposition.
+        if len(kept_vars) <= 2 * width and factorized_a.lu is None:
+            return factorized_a.solve_kept(b, kept_vars)
+        return factorized_a.solve_full(b, kept_vars)
+
+
+default_solver = Solver()
+
+smatrix = default_solver.smatrix
+smatrix_sweep = default_solver.smatrix_sweep
+collect_stats = default_solver.collect_stats
+greens_function = default_solver.greens_function
+ldos = default_solver.ldos
+wave_function = default_solver.wave_function
+options = default_solver.options
+reset_options = default_solver.reset_options
@@ -6,7 +6,8 @@
 # the file AUTHORS.rst at the top-level directory of this distribution and at
 # http://kwant-project.org/authors.
 
-__all__ = ['smatrix', 'greens_function', 'ldos', 'wave_function', 'Solver']
+__all__ = ['smatrix', 'smatrix_sweep', 'greens_function', 'ldos',
+           'wave_function', 'collect_stats', 'Solver']
 
 import numpy as np
 import scipy.sparse as sp
@@ -119,6 +120,8 @@ class Solver(common.SparseSolver):
 default_solver = Solver()
 
 smatrix = default_solver.smatrix
+smatrix_sweep = default_solver.smatrix_sweep
+collect_stats = default_solver.collect_stats
 greens_function = default_solver.greens_function
 ldos = default_solver.ldos
 wave_function = default_solver.wave_function
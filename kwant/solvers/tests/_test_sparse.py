@@ -448,9 +448,44 @@ def test_ldos(ldos):
                    fsyst.precalculate(what='all')):
         assert_almost_equal(ldos(finsyst, 0),
                             np.array([1, 1]) / (2 * np.pi))
+    for finsyst in (fsyst, fsyst.precalculate(what='all')):
+        assert_almost_equal(ldos(finsyst, 0, selected_inversion=True),
+                            np.array([1, 1]) / (2 * np.pi))
     raises(ValueError, ldos, fsyst.precalculate(what='selfenergy'), 0)
+    assert_almost_equal(ldos(fsyst.precalculate(what='selfenergy'), 0,
+                             selected_inversion=True),
+                        np.array([1, 1]) / (2 * np.pi))
     fsyst.leads[0] = LeadWithOnlySelfEnergy(fsyst.leads[0])
-    raises(NotImplementedError, ldos, fsyst, 0)
+    assert_almost_equal(ldos(fsyst, 0), np.array([1, 1]) / (2 * np.pi))
+    assert_almost_equal(ldos(fsyst, 0, orbitals=[1]), [1 / (2 * np.pi)])
+
+
+def test_ldos_subset(ldos):
+    np.random.seed(7)
+    syst = kwant.Builder()
+    lead = kwant.Builder(kwant.TranslationalSymmetry((-1, 0)))
+    for b, sites in [(syst, [square(x, y) for x in range(3) for y in range(2)]),
+                     (lead, [square(0, y) for y in range(2)])]:
+        for site in sites:
+            h = np.random.rand(2, 2) + 1j * np.random.rand(2, 2)
+            b[site] = h + h.conjugate().transpose()
+        b[square.neighbors()] = -np.identity(2)
+    syst.attach_lead(lead)
+    syst.attach_lead(lead.reversed())
+    fsyst = syst.finalized()
+
+    full = ldos(fsyst, 0.5)
+    assert_almost_equal(ldos(fsyst, 0.5, max_memory=1), full)
+    sites = [4, 1]
+    assert_almost_equal(ldos(fsyst, 0.5, sites=sites),
+                        full[[8, 9, 2, 3]])
+    orbitals = [7, 0, 11]
+    assert_almost_equal(ldos(fsyst, 0.5, orbitals=orbitals,
+                             max_memory=1000), full[orbitals])
+    assert ldos(fsyst, 0.5, sites=[]).shape == (0,)
+    assert ldos(fsyst, 0.5, orbitals=[]).shape == (0,)
+    raises(ValueError, ldos, fsyst, 0.5, sites=sites, orbitals=orbitals)
+    raises(IndexError, ldos, fsyst, 0.5, orbitals=[12])
 
 
 def test_wavefunc_ldos_consistency(wave_function, ldos):
@@ -487,10 +522,115 @@ def test_wavefunc_ldos_consistency(wave_function, ldos):
             ldos2 *= (0.5 / np.pi)
 
             assert_almost_equal(ldos2, ldos(syst, energy))
+            assert_almost_equal(ldos2[n : 2 * n],
+                                ldos(syst, energy, sites=[1]))
+            orbitals = [2 * n + 1, 0]
+            assert_almost_equal(ldos2[orbitals],
+                                ldos(syst, energy, orbitals=orbitals))
+            if not isinstance(syst.leads[0], kwant.system.PrecalculatedLead):
+                assert_almost_equal(ldos2, ldos(syst, energy,
+                                                selected_inversion=True))
 
     for fsyst in (syst, syst.precalculate(what='modes'),
                  syst.precalculate(what='all')):
         check(fsyst)
+    for energy in [0, 1000]:
+        fsyst = syst.precalculate(energy, what='all')
+        assert_almost_equal(ldos(fsyst, energy),
+                            ldos(fsyst, energy, selected_inversion=True))
     raises(ValueError, check, syst.precalculate(what='selfenergy'))
     syst.leads[0] = LeadWithOnlySelfEnergy(syst.leads[0])
     raises(NotImplementedError, check, syst)
+
+
+def test_smatrix_sweep(smatrix_sweep, smatrix):
+    W = 3
+    syst = kwant.Builder()
+    lead = kwant.Builder(kwant.TranslationalSymmetry((-1, 0)))
+    syst[(square(x, y) for x in range(4) for y in range(W))] = \
+        lambda site: 4 + 0.5 * kwant.digest.uniform(site.tag)
+    syst[square.neighbors()] = -1
+    lead[(square(0, y) for y in range(W))] = 4
+    lead[square.neighbors()] = -1
+    syst.attach_lead(lead)
+    syst.attach_lead(lead.reversed())
+    fsyst = syst.finalized()
+
+    # The number of modes changes within this range of energies, and there
+    # are no modes at all at the first energy.
+    energies = [-1, 0.3, 0.35, 1.5, 1.6, 3.0, 3.1]
+    sweep = smatrix_sweep(fsyst, energies)
+    for energy, result in zip(energies, sweep):
+        expected = smatrix(fsyst, energy)
+        assert result.data.shape == expected.data.shape
+        assert_almost_equal(result.data, expected.data)
+        assert_almost_equal(result.transmission(1, 0),
+                            expected.transmission(1, 0))
+
+    results = list(smatrix_sweep(fsyst, energies[1:3], (), [1], [0]))
+    for energy, result in zip(energies[1:3], results):
+        expected = smatrix(fsyst, energy, (), [1], [0])
+        assert_almost_equal(result.data, expected.data)
+
+    raises(ValueError, list, smatrix_sweep(fsyst, energies, out_leads=[]))
+
+
+def test_hermiticity_check(smatrix):
+    syst = kwant.Builder()
+    lead = kwant.Builder(kwant.TranslationalSymmetry((-1, 0)))
+    syst[(square(x, 0) for x in range(3))] = np.array([[0, 1], [1, 0]])
+    syst[square.neighbors()] = np.identity(2)
+    lead[square(0, 0)] = np.array([[0, 1], [1, 0]])
+    lead[square.neighbors()] = np.identity(2)
+    syst.attach_lead(lead)
+    syst.attach_lead(lead.reversed())
+    fsyst = syst.finalized()
+    assert_almost_equal(smatrix(fsyst, 0.3).transmission(1, 0), 2)
+
+    syst[square(1, 0)] = np.array([[0, 1], [0.5, 0]])
+    fsyst = syst.finalized()
+    raises(ValueError, smatrix, fsyst, 0.3)
+    smatrix(fsyst, 0.3, check_hermiticity=False)
+
+
+def test_collect_stats(solver):
+    syst = kwant.Builder()
+    lead = kwant.Builder(kwant.TranslationalSymmetry((-1, 0)))
+    syst[(square(x, y) for x in range(3) for y in range(2))] = \
+        lambda site: 4 + 0.1 * kwant.digest.uniform(site.tag)
+    syst[square.neighbors()] = -1
+    lead[(square(0, y) for y in range(2))] = 4
+    lead[square.neighbors()] = -1
+    syst.attach_lead(lead)
+    syst.attach_lead(lead.reversed())
+    fsyst = syst.finalized()
+    expected = solver.smatrix(fsyst, 1)
+
+    with solver.collect_stats() as stats:
+        assert_almost_equal(solver.smatrix(fsyst, 1).data, expected.data)
+        list(solver.smatrix_sweep(fsyst, [1, 2]))
+        solver.ldos(fsyst, 1)
+    assert [call.method for call in stats.calls] == [
+        'smatrix', 'smatrix_sweep', 'smatrix_sweep', 'ldos']
+    assert [call.energy for call in stats.calls] == [1, 1, 2, 1]
+    for call in stats.calls:
+        assert {'hamiltonian', 'leads', 'assembly'} <= set(call.wall_time)
+        assert call.wall_time.keys() == call.cpu_time.keys()
+        assert all(t >= 0 for t in call.cpu_time.values())
+        # One evaluation per site and per hopping of the scattering region,
+        # and more for the leads.
+        assert call.hamiltonian_calls > 6 + 7
+        assert call.lhs_size >= 6 and call.lhs_nnz >= call.lhs_size
+    # Each mode is injected once for the scattering matrix.
+    assert stats.calls[0].rhs_columns == sum(expected.num_propagating(i)
+                                             for i in range(2))
+    assert 'hamiltonian' not in vars(fsyst)
+
+    total = (stats + stats).total()
+    assert total.hamiltonian_calls == 2 * sum(call.hamiltonian_calls
+                                              for call in stats.calls)
+    assert 'leads' in str(stats)
+
+    # Nothing is recorded outside of the block.
+    solver.smatrix(fsyst, 1)
+    assert len(stats.calls) == 4
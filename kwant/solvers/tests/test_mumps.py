@@ -9,7 +9,8 @@
 import pytest
 try:
     from kwant.solvers.mumps import (
-        smatrix, greens_function, ldos, wave_function, options, reset_options)
+        smatrix, smatrix_sweep, greens_function, ldos, wave_function, options,
+        reset_options, default_solver)
     from . import _test_sparse
     no_mumps = False
 except ImportError:
@@ -22,7 +23,8 @@ opt_list=[{},
           {'nrhs' : 10},
           {'nrhs' : 1, 'ordering' : 'amd'},
           {'nrhs' : 10, 'sparse_rhs' : True},
-          {'nrhs' : 2, 'ordering' : 'amd', 'sparse_rhs' : True}]
+          {'nrhs' : 2, 'ordering' : 'amd', 'sparse_rhs' : True},
+          {'schur_smatrix' : True}]
 
 
 def test_output():
@@ -108,7 +110,35 @@ def test_ldos():
         _test_sparse.test_ldos(ldos)
 
 
+def test_ldos_subset():
+    for opts in opt_list:
+        reset_options()
+        options(**opts)
+        _test_sparse.test_ldos_subset(ldos)
+
+
 def test_wavefunc_ldos_consistency():
     for opts in opt_list:
         options(**opts)
         _test_sparse.test_wavefunc_ldos_consistency(wave_function, ldos)
+
+
+def test_smatrix_sweep():
+    for opts in opt_list:
+        reset_options()
+        options(**opts)
+        _test_sparse.test_smatrix_sweep(smatrix_sweep, smatrix)
+
+
+def test_hermiticity_check():
+    for opts in opt_list:
+        reset_options()
+        options(**opts)
+        _test_sparse.test_hermiticity_check(smatrix)
+
+
+def test_collect_stats():
+    for opts in opt_list:
+        reset_options()
+        options(**opts)
+        _test_sparse.test_collect_stats(default_solver)
@@ -0,0 +1,63 @@
+# Copyright 2011-2016 Kwant authors.
+#
+# This file is part of Kwant.  It is subject to the license terms in the file
+# LICENSE.rst found in the top-level directory of this distribution and at
+# http://kwant-project.org/license.  A list of Kwant authors can be found in
+# the file AUTHORS.rst at the top-level directory of this distribution and at
+# http://kwant-project.org/authors.
+
+import itertools
+from numpy.testing import assert_almost_equal
+import kwant
+from kwant.solvers import parallel, sparse
+
+square = kwant.lattice.square()
+
+
+def onsite(site, V):
+    return 4 + V * kwant.digest.uniform(site.tag)
+
+
+def make_system():
+    syst = kwant.Builder()
+    syst[(square(x, y) for x in range(4) for y in range(3))] = onsite
+    syst[square.neighbors()] = -1
+    lead = kwant.Builder(kwant.TranslationalSymmetry((-1, 0)))
+    lead[(square(0, y) for y in range(3))] = 4
+    lead[square.neighbors()] = -1
+    syst.attach_lead(lead)
+    syst.attach_lead(lead.reversed())
+    return syst.finalized()
+
+
+def test_smatrix_map():
+    fsyst = make_system()
+    points = [(energy, (V,)) for energy in [0.5, 1.5, 2.5]
+              for V in [0, 1.2]]
+    expected = [sparse.smatrix(fsyst, energy, args).data
+                for energy, args in points]
+
+    for processes in [False, True]:
+        results = list(parallel.smatrix_map(fsyst, points, max_workers=2,
+                                            processes=processes,
+                                            solver=sparse.Solver))
+        assert len(results) == len(points)
+        for smatrix, data in zip(results, expected):
+            assert_almost_equal(smatrix.data, data)
+
+    results = parallel.smatrix_map(fsyst, points, out_leads=[1], in_leads=[0],
+                                   transmission=True, ordered=False)
+    seen = set()
+    for n, trans in results:
+        energy, args = points[n]
+        smatrix = sparse.smatrix(fsyst, energy, args)
+        assert trans.shape == (1, 1)
+        assert_almost_equal(trans[0, 0], smatrix.transmission(1, 0))
+        seen.add(n)
+    assert seen == set(range(len(points)))
+
+    # Stop early, points are consumed lazily.
+    results = parallel.smatrix_map(fsyst, itertools.cycle(points),
+                                   max_workers=1)
+    assert_almost_equal(next(results).data, expected[0])
+    results.close()
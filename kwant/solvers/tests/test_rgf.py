@@ -0,0 +1,111 @@
+# Copyright 2011-2016 Kwant authors.
+#
+# This file is part of Kwant.  It is subject to the license terms in the file
+# LICENSE.rst found in the top-level directory of this distribution and at
+# http://kwant-project.org/license.  A list of Kwant authors can be found in
+# the file AUTHORS.rst at the top-level directory of this distribution and at
+# http://kwant-project.org/authors.
+
+import numpy as np
+import kwant
+from kwant.solvers import sparse
+from kwant.solvers.rgf import (smatrix, smatrix_sweep, greens_function, ldos,
+                               wave_function, options, reset_options,
+                               default_solver)
+from . import _test_sparse
+
+opt_list = [{}, {'nrhs': 1}]
+
+
+def test_output():
+    _test_sparse.test_output(smatrix)
+
+
+def test_one_lead():
+    _test_sparse.test_one_lead(smatrix)
+
+
+def test_smatrix_shape():
+    _test_sparse.test_smatrix_shape(smatrix)
+
+
+def test_two_equal_leads():
+    _test_sparse.test_two_equal_leads(smatrix)
+
+
+def test_graph_system():
+    _test_sparse.test_graph_system(smatrix)
+
+
+def test_singular_graph_system():
+    _test_sparse.test_singular_graph_system(smatrix)
+
+
+def test_tricky_singular_hopping():
+    _test_sparse.test_tricky_singular_hopping(smatrix)
+
+
+def test_many_leads():
+    _test_sparse.test_many_leads(smatrix)
+
+
+def test_selfenergy():
+    _test_sparse.test_selfenergy(greens_function, smatrix)
+
+
+def test_selfenergy_reflection():
+    _test_sparse.test_selfenergy_reflection(greens_function, smatrix)
+
+
+def test_very_singular_leads():
+    _test_sparse.test_very_singular_leads(smatrix)
+
+
+def test_ldos():
+    for opts in opt_list:
+        reset_options()
+        options(**opts)
+        _test_sparse.test_ldos(ldos)
+
+
+def test_ldos_subset():
+    _test_sparse.test_ldos_subset(ldos)
+
+
+def test_wavefunc_ldos_consistency():
+    for opts in opt_list:
+        reset_options()
+        options(**opts)
+        _test_sparse.test_wavefunc_ldos_consistency(wave_function, ldos)
+
+
+def test_smatrix_sweep():
+    _test_sparse.test_smatrix_sweep(smatrix_sweep, smatrix)
+
+
+def test_hermiticity_check():
+    _test_sparse.test_hermiticity_check(smatrix)
+
+
+def test_collect_stats():
+    _test_sparse.test_collect_stats(default_solver)
+
+
+def test_overlapping_interfaces():
+    # The interface of the last lead overlaps with the one of the first lead,
+    # such that the system cannot be sliced.
+    lat = kwant.lattice.square()
+    syst = kwant.Builder()
+    syst[(lat(x, y) for x in range(4) for y in range(3))] = 4
+    syst[lat.neighbors()] = -1
+    lead = kwant.Builder(kwant.TranslationalSymmetry((-1, 0)))
+    lead[(lat(0, y) for y in range(3))] = 4
+    lead[lat.neighbors()] = -1
+    syst.attach_lead(lead)
+    syst.attach_lead(lead.reversed())
+    syst.attach_lead(lead)
+    syst = syst.finalized()
+
+    s = smatrix(syst, 1.).data
+    assert s.shape == (3, 3)
+    np.testing.assert_almost_equal(s, sparse.smatrix(syst, 1.).data)
@@ -6,7 +6,8 @@
 # the file AUTHORS.rst at the top-level directory of this distribution and at
 # http://kwant-project.org/authors.
 
-from  kwant.solvers.sparse import smatrix, greens_function, ldos, wave_function
+from  kwant.solvers.sparse import (smatrix, smatrix_sweep, greens_function,
+                                   ldos, wave_function, default_solver)
 from . import _test_sparse
 
 def test_output():
@@ -57,5 +58,21 @@ def test_ldos():
     _test_sparse.test_ldos(ldos)
 
 
+def test_ldos_subset():
+    _test_sparse.test_ldos_subset(ldos)
+
+
 def test_wavefunc_ldos_consistency():
     _test_sparse.test_wavefunc_ldos_consistency(wave_function, ldos)
+
+
+def test_smatrix_sweep():
+    _test_sparse.test_smatrix_sweep(smatrix_sweep, smatrix)
+
+
+def test_hermiticity_check():
+    _test_sparse.test_hermiticity_check(smatrix)
+
+
+def test_collect_stats():
+    _test_sparse.test_collect_stats(default_solver)
@@ -11,6 +11,8 @@
 __all__ = ['System', 'FiniteSystem', 'InfiniteSystem']
 
 import abc
+import threading
+from collections import OrderedDict, namedtuple
 from copy import copy
 from . import _system
 
@@ -60,6 +62,29 @@ class System(metaclass=abc.ABCMeta):
         """
         pass
 
+    def hamiltonian_blocks(self, args=()):
+        """Return the Hamiltonian as a block-sparse matrix.
+
+        Parameters
+        ----------
+        args : tuple, defaults to empty
+            Positional arguments to pass to the ``hamiltonian`` method.
+
+        Returns
+        -------
+        hamiltonian : ``kwant._system.BlockSparseMatrix``
+            The Hamiltonian of all the sites of the system, with one dense
+            block per pair of connected sites.  Its ``dot`` method multiplies
+            it with a block of vectors.
+
+        Notes
+        -----
+        Only the onsite Hamiltonians and one of the two hoppings of each pair
+        of connected sites are evaluated, the other one is obtained by
+        Hermitian conjugation.
+        """
+        return _system.make_block_sparse(self.hamiltonian, args, self.graph)
+
 # Add a C-implemented function as an unbound method to class System.
 System.hamiltonian_submatrix = _system.HamiltonianSubmatrix()
 
@@ -212,7 +237,16 @@ class InfiniteSystem(System, metaclass=abc.ABCMeta):
 
         See documentation of `~kwant.physics.PropagatingModes` and
         `~kwant.physics.StabilizedModes` for the return format details.
+
+        If the mode cache is enabled (see `enable_mode_cache`), the modes are
+        only computed when they are not found in the cache.
         """
+        cache = getattr(self, '_mode_cache', None)
+        if cache is not None:
+            return cache.get(energy, args, self._compute_modes)
+        return self._compute_modes(energy, args)
+
+    def _compute_modes(self, energy, args):
         from . import physics   # Putting this here avoids a circular import.
         ham = self.cell_hamiltonian(args)
         shape = ham.shape
@@ -228,7 +262,12 @@ class InfiniteSystem(System, metaclass=abc.ABCMeta):
         The returned matrix has the shape (s, s), where s is
         ``sum(len(self.hamiltonian(i, i)) for i in range(self.graph.num_nodes -
         self.cell_size))``.
+
+        If the mode cache is enabled, the self-energy is obtained from the
+        (possibly cached) modes.
         """
+        if getattr(self, '_mode_cache', None) is not None:
+            return self.modes(energy, args)[1].selfenergy()
         from . import physics   # Putting this here avoids a circular import.
         ham = self.cell_hamiltonian(args)
         shape = ham.shape
@@ -238,6 +277,115 @@ class InfiniteSystem(System, metaclass=abc.ABCMeta):
         ham.flat[::ham.shape[0] + 1] -= energy
         return physics.selfenergy(ham, self.inter_cell_hopping(args))
 
+    def enable_mode_cache(self, maxsize=128, relevant_args=None):
+        """Cache the modes of the system for the most recent parameters.
+
+        Once enabled, `modes` (and `selfenergy`) remember their results for
+        up to `maxsize` different combinations of energy and arguments, and
+        discard the least recently used ones when more are needed.  This
+        avoids recomputing the modes of a lead when a parameter is varied
+        that only enters the scattering region.  Calling this method again
+        discards the cached modes and resets the statistics.
+
+        Parameters
+        ----------
+        maxsize : integer
+            Maximal number of cached mode decompositions.
+        relevant_args : sequence of integers or ``None``
+            Positions of the elements of ``args`` on which the Hamiltonian of
+            the system depends.  The other elements of ``args`` are ignored
+            when looking up the cache.  ``None`` means that all of ``args``
+            is relevant.
+
+        Notes
+        -----
+        Arguments that are not hashable (like numpy arrays) prevent caching:
+        the modes are then always computed and the call counts as a miss.
+
+        The cache is looked up by the values of the arguments as seen by
+        their ``__hash__`` and ``__eq__`` methods.  Objects that compare by
+        identity (e.g. instances of classes that do not define ``__eq__``)
+        and are modified between calls are therefore considered unchanged,
+        and the modes computed for their old state are returned.  Pass such
+        parameters as immutable values, or disable the cache.
+
+        The cache may be used by several threads at the same time.
+
+        Declaring arguments as irrelevant that the Hamiltonian in fact
+        depends on leads to wrong results.
+        """
+        if maxsize < 1 or int(maxsize) != maxsize:
+            raise ValueError("maxsize must be an integer bigger than zero.")
+        self._mode_cache = _ModeCache(int(maxsize), relevant_args)
+
+    def disable_mode_cache(self):
+        """Disable the mode cache and discard the cached modes."""
+        self._mode_cache = None
+
+    def mode_cache_info(self):
+        """Return the statistics of the mode cache.
+
+        Returns
+        -------
+        info : ``ModeCacheInfo`` or ``None``
+            A named tuple ``(hits, misses, maxsize, currsize)``, or ``None``
+            if the mode cache is not enabled.
+        """
+        cache = getattr(self, '_mode_cache', None)
+        return None if cache is None else cache.info()
+
+
+ModeCacheInfo = namedtuple('ModeCacheInfo',
+                           ['hits', 'misses', 'maxsize', 'currsize'])
+
+
+class _ModeCache:
+    """Least recently used cache of lead modes."""
+
+    def __init__(self, maxsize, relevant_args=None):
+        self.maxsize = maxsize
+        self.relevant_args = (None if relevant_args is None
+                              else tuple(relevant_args))
+        self.data = OrderedDict()
+        self.hits = self.misses = 0
+        # Protects `data` and the statistics.  The modes are computed
+        # without holding it.
+        self.lock = threading.Lock()
+
+    def get(self, energy, args, compute):
+        if self.relevant_args is None:
+            key = (energy, tuple(args))
+        else:
+            key = (energy, tuple(args[i] for i in self.relevant_args))
+        with self.lock:
+            try:
+                result = self.data[key]
+            except KeyError:
+                pass
+            except TypeError:
+                # Unhashable arguments: cannot be cached.
+                key = None
+            else:
+                self.hits += 1
+                self.data.move_to_end(key)
+                return result
+            self.misses += 1
+
+        result = compute(energy, args)
+        if key is None:
+            return result
+        with self.lock:
+            self.data[key] = result
+            self.data.move_to_end(key)
+            if len(self.data) > self.maxsize:
+                self.data.popitem(last=False)
+        return result
+
+    def info(self):
+        with self.lock:
+            return ModeCacheInfo(self.hits, self.misses, self.maxsize,
+                                 len(self.data))
+
 
 class PrecalculatedLead:
     def __init__(self, modes=None, selfenergy=None):
@@ -795,3 +795,364 @@ def test_ModesLead_and_SelfEnergyLead():
     fsyst = syst.finalized()
     ts2 = [kwant.greens_function(fsyst, e).transmission(1, 0) for e in energies]
     assert_almost_equal(ts2, ts)
+
+
+def test_vectorized_value_functions():
+    lat = kwant.lattice.honeycomb()
+    a, b = lat.sublattices
+    pauli_z = np.diag([1, -1])
+
+    def onsite(site, salt, phi):
+        return (kwant.digest.uniform(site.tag, salt) * np.identity(2) +
+                site.pos[0] * pauli_z)
+
+    def hopping(site1, site2, salt, phi):
+        x = site1.pos[0] + site2.pos[0]
+        return np.exp(1j * phi * x) * np.array([[1, 0.5], [0.5j, -1]])
+
+    @builder.vectorized
+    def v_onsite(sites, salt, phi):
+        assert isinstance(sites, builder.SiteArray)
+        rnd = [kwant.digest.uniform(ta.array(tag), salt) for tag in sites.tags]
+        x = sites.positions[:, 0]
+        return (np.array(rnd)[:, None, None] * np.identity(2) +
+                x[:, None, None] * pauli_z)
+
+    @builder.vectorized
+    def v_hopping(sites1, sites2, salt, phi):
+        x = sites1.positions[:, 0] + sites2.positions[:, 0]
+        return (np.exp(1j * phi * x)[:, None, None] *
+                np.array([[1, 0.5], [0.5j, -1]]))
+
+    def make_system(onsite, hopping):
+        syst = builder.Builder()
+        syst[lat.shape(lambda pos: np.linalg.norm(pos) < 3, (0, 0))] = onsite
+        syst[lat.neighbors()] = hopping
+        # Mix in some constant and ordinary values.
+        syst[a(0, 0)] = 2 * np.identity(2)
+        syst[a(0, 0), b(0, 0)] = np.identity(2)
+        return syst.finalized()
+
+    fsyst = make_system(onsite, hopping)
+    v_fsyst = make_system(v_onsite, v_hopping)
+    args = ('salt', 0.3)
+    for sparse in [False, True]:
+        h = fsyst.hamiltonian_submatrix(args, sparse=sparse)
+        v_h = v_fsyst.hamiltonian_submatrix(args, sparse=sparse)
+        if sparse:
+            h, v_h = h.toarray(), v_h.toarray()
+        assert_almost_equal(v_h, h)
+
+    # Single elements and submatrices use the same functions.
+    sites = [0, 3, 5]
+    assert_almost_equal(v_fsyst.hamiltonian(3, 3, *args),
+                        fsyst.hamiltonian(3, 3, *args))
+    assert_almost_equal(
+        v_fsyst.hamiltonian_submatrix(args, sites, sites),
+        fsyst.hamiltonian_submatrix(args, sites, sites))
+
+    # Scalar return values and wrong shapes.
+    syst = builder.Builder()
+    syst[(a(i, 0) for i in range(3))] = builder.vectorized(
+        lambda sites: np.zeros(len(sites)))
+    syst[lat.neighbors()] = builder.vectorized(lambda s1, s2: 1)
+    syst[b(0, 0)] = builder.vectorized(lambda sites: np.zeros((2, 1, 1)))
+    with raises(kwant.UserCodeError):
+        syst.finalized().hamiltonian_submatrix()
+
+
+def test_value_index():
+    lat = kwant.lattice.square()
+    syst = builder.Builder()
+
+    def onsite(site):
+        return site.tag[0]
+
+    def hopping(site1, site2):
+        return 1j
+
+    syst[(lat(x, y) for x in range(4) for y in range(3))] = 4
+    syst[(lat(x, 0) for x in range(4))] = onsite
+    syst[lat.neighbors()] = -1
+    syst[kwant.HoppingKind((1, 0), lat)] = hopping
+    fsyst = syst.finalized()
+
+    # Every site and every edge that is not marked as `Other` belongs to
+    # exactly one group, which has the right value.
+    seen = []
+    for value, site_ids in fsyst._onsite_groups:
+        for i in site_ids:
+            assert fsyst.onsite_hamiltonians[i] is value
+        seen.extend(site_ids)
+    assert sorted(seen) == list(range(fsyst.graph.num_nodes))
+    assert {4, onsite} == set(v for v, ids in fsyst._onsite_groups)
+
+    seen = []
+    for value, edge_ids in fsyst._hopping_groups:
+        for e in edge_ids:
+            assert fsyst.hoppings[e] is value
+        seen.extend(edge_ids)
+    conj_edges = [e for e, value in enumerate(fsyst.hoppings)
+                  if value is builder.Other]
+    assert np.all(np.flatnonzero(fsyst._conj_edges) == conj_edges)
+    assert sorted(seen + conj_edges) == list(range(fsyst.graph.num_edges))
+    assert len(conj_edges) * 2 == fsyst.graph.num_edges
+
+    for e, (tail, head) in enumerate(fsyst._edges):
+        assert fsyst.graph.first_edge_id(tail, head) == e
+
+
+def test_hamiltonian_reassembly():
+    lat = kwant.lattice.square()
+    syst = builder.Builder()
+    syst[(lat(x, y) for x in range(5) for y in range(4))] = 4
+    syst[lat.neighbors()] = -1
+
+    def onsite(site, V, norbs):
+        return V * site.pos[0] * np.identity(norbs)
+
+    def hopping(site1, site2, V, norbs):
+        return 1j * V * np.ones((norbs, 1))
+
+    syst[lat(0, 0)] = onsite
+    syst[lat(1, 0)] = np.zeros((2, 2))
+    del syst[lat(1, 0), lat(2, 0)]
+    del syst[lat(1, 0), lat(1, 1)]
+    syst[lat(0, 0), lat(1, 0)] = lambda s1, s2, V, norbs: V * np.ones((1, 2))
+    syst[lat(0, 0), lat(0, 1)] = hopping
+    fsyst = syst.finalized()
+    n = fsyst.graph.num_nodes
+
+    def check(args):
+        for sparse in [False, True]:
+            h = fsyst.hamiltonian_submatrix(args, sparse=sparse)
+            # The generic code path is used for explicit lists of sites.
+            h_ref = fsyst.hamiltonian_submatrix(args, range(n), range(n),
+                                                sparse=sparse)
+            if sparse:
+                h, h_ref = h.toarray(), h_ref.toarray()
+            assert_almost_equal(h, h_ref)
+
+    check((0.5, 1))
+    layout = fsyst._assembly_cache
+    check((1.5, 1))
+    assert fsyst._assembly_cache is layout
+    # The constant part is not modified by the value functions.
+    assert not np.any(layout[3][layout[4][0]])
+
+    # Changing the number of orbitals of a site requires a new layout.
+    with raises(ValueError):
+        fsyst.hamiltonian_submatrix((1, 2))
+    syst[lat(0, 0), lat(1, 0)] = lambda s1, s2, V, norbs: np.ones((norbs, 2))
+    fsyst = syst.finalized()
+    check((0.5, 2))
+    h, norb, norb = fsyst.hamiltonian_submatrix((0.5, 2), return_norb=True)
+    assert h.shape == (n + 2, n + 2)
+    assert norb[fsyst.id_by_site[lat(0, 0)]] == 2
+    assert norb[fsyst.id_by_site[lat(1, 0)]] == 2
+
+
+def test_value_profile():
+    lat = kwant.lattice.square()
+
+    def onsite(site, t):
+        return 4 * t
+
+    @builder.vectorized
+    def hopping(sites1, sites2, t):
+        return -t
+
+    def make_system(symmetry=None, L=4):
+        syst = builder.Builder(symmetry)
+        syst[(lat(x, y) for x in range(L) for y in range(3))] = onsite
+        syst[lat.neighbors()] = hopping
+        return syst.finalized()
+
+    fsyst = make_system()
+    assert fsyst.value_profile() is None
+    fsyst.hamiltonian_submatrix((1,))
+    assert fsyst.value_profile() is None
+
+    fsyst.enable_value_profile()
+    h = fsyst.hamiltonian_submatrix((1,))
+    fsyst.hamiltonian(0, 0, 1)
+    fsyst.hamiltonian(0, 1, 1)
+    fsyst.hamiltonian(1, 0, 1)
+    rows = {row.name: row for row in fsyst.value_profile().rows()}
+    assert set(rows) == {onsite.__qualname__, hopping.__qualname__}
+    assert rows[onsite.__qualname__][1:3] == (13, 13)
+    # The vectorized function is called once for the full Hamiltonian, and
+    # once for each single hopping (also when it is the conjugate).
+    assert rows[hopping.__qualname__][1:3] == (3, 17 + 2)
+    assert all(row.time >= 0 for row in rows.values())
+    assert onsite.__qualname__ in str(fsyst.value_profile())
+    assert_almost_equal(h, fsyst.hamiltonian_submatrix((1,)))
+
+    fsyst.enable_value_profile()
+    assert fsyst.value_profile().rows() == []
+    fsyst.disable_value_profile()
+    assert fsyst.value_profile() is None
+
+    flead = make_system(kwant.TranslationalSymmetry((-1, 0)), 1)
+    flead.enable_value_profile()
+    flead.cell_hamiltonian((1,))
+    flead.inter_cell_hopping((1,))
+    rows = {row.name: row for row in flead.value_profile().rows()}
+    assert rows[onsite.__qualname__].calls >= 3
+    assert rows[hopping.__qualname__].calls > 0
+
+
+def test_compact_builder():
+    lat = kwant.lattice.honeycomb()
+    a, b = lat.sublattices
+
+    def onsite(site, t):
+        return t * site.pos[0]
+
+    def make_systems(compact):
+        syst = builder.Builder(compact=compact)
+        # Large enough for the hoppings to be merged into the compressed
+        # arrays several times.
+        syst[lat.shape(lambda pos: np.linalg.norm(pos) < 12, (0, 0))] = onsite
+        syst[lat.neighbors()] = -1
+        syst[lat.neighbors(2)] = 0.1j
+        del syst[a(0, 0)]
+        del syst[a(3, 1), b(3, 1)]
+        syst[b(2, 2), a(1, 3)] = 3
+        syst[a(1, 3), b(2, 2)] = 2
+        syst[b(20, 0)] = 1
+        syst.eradicate_dangling()
+        syst[a(0, 0)] = 5
+        syst[a(0, 0), b(0, 0)] = 1j
+
+        lead = builder.Builder(kwant.TranslationalSymmetry(lat.vec((-1, 0))),
+                               compact=compact)
+        lead[lat.shape(lambda pos: abs(pos[1]) < 4, (0, 0))] = 4
+        lead[lat.neighbors()] = -1
+        syst.attach_lead(lead)
+        syst.attach_lead(lead.reversed())
+        return syst, lead
+
+    syst, lead = make_systems(False)
+    c_syst, c_lead = make_systems(True)
+    assert isinstance(c_syst.H, builder._CompactGraph)
+    assert c_syst.H._indptr[-1] > 0
+
+    for s, c_s in [(syst, c_syst), (lead, c_lead)]:
+        assert len(s.H) == len(c_s.H)
+        assert set(s.sites()) == set(c_s.sites())
+        assert set(s.hoppings()) == set(c_s.hoppings())
+        assert dict(s.site_value_pairs()) == dict(c_s.site_value_pairs())
+        for hop, value in s.hopping_value_pairs():
+            assert c_s[hop] == value
+            assert c_s[hop[::-1]] == s[hop[::-1]]
+            assert hop in c_s and hop[::-1] in c_s
+        for site in s.sites():
+            assert s.degree(site) == c_s.degree(site)
+            assert set(s.neighbors(site)) == set(c_s.neighbors(site))
+
+    fsyst, c_fsyst = syst.finalized(), c_syst.finalized()
+    assert fsyst.sites == c_fsyst.sites
+    assert_almost_equal(fsyst.hamiltonian_submatrix((2,)),
+                        c_fsyst.hamiltonian_submatrix((2,)))
+    assert_almost_equal(lead.finalized().cell_hamiltonian(),
+                        c_lead.finalized().cell_hamiltonian())
+
+    # Missing sites and hoppings.
+    for key in [a(100, 100), (a(100, 100), b(0, 0)), (a(0, 0), a(5, 5))]:
+        assert key not in c_syst
+        raises(KeyError, c_syst.__getitem__, key)
+        raises(KeyError, c_syst.__delitem__, key)
+    with raises(KeyError):
+        c_syst[a(100, 100), b(0, 0)] = 1
+
+    # Only tags that are integer tinyarrays are supported.
+    c_syst = builder.Builder(compact=True)
+    for tag in [('a',), (1, 2)]:
+        with raises(TypeError):
+            c_syst[builder.SimpleSiteFamily()(*tag)] = 1
+
+    # Equal numbers are stored once, and unused values are dropped.
+    chain = kwant.lattice.chain()
+    c_syst = builder.Builder(compact=True)
+    for x in range(3000):
+        c_syst[chain(x)] = float(x % 10)
+    for x in range(2999):
+        c_syst[chain(x), chain(x + 1)] = np.array([[x]])
+    for x in range(2999):
+        del c_syst[chain(x), chain(x + 1)]
+    for x in range(2999):
+        c_syst[chain(x), chain(x + 1)] = -1.
+    assert len(c_syst.H._values) < 1000
+    for x in range(3000):
+        assert c_syst[chain(x)] == x % 10
+    for x in range(2999):
+        assert c_syst[chain(x), chain(x + 1)] == -1
+        assert c_syst[chain(x + 1), chain(x)] == -1
+    assert c_syst[chain(10)] == 0 and type(c_syst[chain(10)]) is float
+
+
+def test_add_sites_and_hoppings():
+    lat = kwant.lattice.honeycomb()
+    a, b = lat.sublattices
+    rng = np.random.RandomState(7)
+    tags = rng.randint(-6, 6, (300, 2))
+    hop = lambda site1, site2: 2j
+
+    for compact in [False, True]:
+        for sym in [None, kwant.TranslationalSymmetry(lat.vec((-2, 1)))]:
+            syst = builder.Builder(sym, compact=compact)
+            bulk = builder.Builder(sym, compact=compact)
+            for fam in [a, b]:
+                for tag in tags:
+                    syst[fam(*tag)] = 4
+                bulk.add_sites(fam, tags, 4)
+            assert set(syst.sites()) == set(bulk.sites())
+
+            for kind, value in zip(lat.neighbors(), [-1, 0.5, hop]):
+                delta = np.array(kind.delta)
+                present = [i for i, tag in enumerate(tags)
+                           if kind.family_b(*(tag - delta)) in syst]
+                tags_a, tags_b = tags[present], tags[present] - delta
+                for tag_a, tag_b in zip(tags_a, tags_b):
+                    syst[kind.family_a(*tag_a), kind.family_b(*tag_b)] = value
+                # Duplicates and reversed hoppings are fine.
+                bulk.add_hoppings(kind.family_a, tags_a, kind.family_b,
+                                  tags_b, value)
+                bulk.add_hoppings(kind.family_b, tags_b, kind.family_a,
+                                  tags_a, builder.HermConjOfFunc(value)
+                                  if callable(value) else value)
+
+            hoppings = list(syst.hoppings())
+            assert len(hoppings) == len(list(bulk.hoppings()))
+            for hopping in hoppings:
+                assert syst[hopping] == bulk[hopping]
+                if not callable(syst[hopping[::-1]]):
+                    assert syst[hopping[::-1]] == bulk[hopping[::-1]]
+            for site in syst.sites():
+                assert syst.degree(site) == bulk.degree(site)
+
+            # Setting the values of existing sites and hoppings.
+            bulk.add_sites(a, tags[:10], 5)
+            assert bulk[a(*tags[0])] == 5
+            bulk.add_hoppings(a, tags_a[:1], b, tags_b[:1], 3)
+            assert bulk[kind.family_a(*tags_a[0]),
+                        kind.family_b(*tags_b[0])] == 3
+
+            # Errors.
+            with raises(KeyError):
+                bulk.add_hoppings(a, [[100, 100]], b, [[0, 0]], 1)
+            raises(ValueError, bulk.add_hoppings, a, [[1, 1]], a, [[1, 1]], 1)
+            raises(ValueError, bulk.add_sites, a, [1, 2], 1)
+            raises(TypeError, bulk.add_sites, a, [[0.5, 2]], 1)
+            raises(ValueError, bulk.add_sites, a, [[1, 2, 3]], 1)
+
+    # Both directions of a hopping in a single call.
+    lat = kwant.lattice.chain()
+    for compact in [False, True]:
+        syst = builder.Builder(compact=compact)
+        syst.add_sites(lat, [[0], [1]], 0)
+        syst.add_hoppings(lat, [[0], [1]], lat, [[1], [0]], -1)
+        assert syst[lat(0), lat(1)] == syst[lat(1), lat(0)] == -1
+        ham = syst.finalized().hamiltonian_submatrix()
+        assert np.all(ham == [[0, -1], [-1, 0]])
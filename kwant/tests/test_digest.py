@@ -0,0 +1,37 @@
+# Copyright 2011-2016 Kwant authors.
+#
+# This file is part of Kwant.  It is subject to the license terms in the file
+# LICENSE.rst found in the top-level directory of this distribution and at
+# http://kwant-project.org/license.  A list of Kwant authors can be found in
+# the file AUTHORS.rst at the top-level directory of this distribution and at
+# http://kwant-project.org/authors.
+
+import numpy as np
+import tinyarray as ta
+from pytest import raises
+from kwant import digest
+
+
+def test_array_versions():
+    rng = np.random.RandomState(3)
+    # Lengths around the MD5 block size test the padding.
+    for dim in [0, 1, 2, 3, 6, 7, 8, 9, 15]:
+        for salt in ['', 'salt', b'x' * 60]:
+            tags = rng.randint(-1000, 1000, (20, dim))
+            u = digest.uniform_array(tags, salt)
+            g = digest.gauss_array(tags, salt)
+            assert u.shape == g.shape == (20,)
+            for n, tag in enumerate(tags.tolist()):
+                tag = ta.array(tag, int)
+                assert u[n] == digest.uniform(tag, salt)
+                assert g[n] == digest.gauss(tag, salt)
+
+    positions = rng.random_sample((10, 2))
+    u = digest.uniform_array(positions)
+    for n, pos in enumerate(positions.tolist()):
+        assert u[n] == digest.uniform(ta.array(pos))
+
+    tags = np.arange(6, dtype=np.int16).reshape(3, 2)
+    assert np.all(digest.uniform_array(tags) == digest.uniform_array(tags + 0))
+    assert len(digest.gauss_array(np.empty((0, 2), int))) == 0
+    raises(ValueError, digest.uniform_array, 1)
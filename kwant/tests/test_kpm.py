@@ -0,0 +1,82 @@
+# Copyright 2011-2016 Kwant authors.
+#
+# This file is part of Kwant.  It is subject to the license terms in the file
+# LICENSE.rst found in the top-level directory of this distribution and at
+# http://kwant-project.org/license.  A list of Kwant authors can be found in
+# the file AUTHORS.rst at the top-level directory of this distribution and at
+# http://kwant-project.org/authors.
+
+import numpy as np
+from pytest import raises
+import kwant
+from kwant import kpm
+assert_allclose = np.testing.assert_allclose
+
+
+def make_system(L=10):
+    lat = kwant.lattice.square()
+    syst = kwant.Builder()
+    syst[(lat(x, y) for x in range(L) for y in range(L))] = \
+        lambda site: kwant.digest.uniform(site.tag, 'kpm') - 0.5
+    syst[lat.neighbors()] = -1
+    return syst.finalized()
+
+
+def integrate(energies, densities):
+    return np.trapz(densities, energies, axis=0)
+
+
+def test_spectral_density():
+    syst = make_system()
+    ham = syst.hamiltonian_submatrix()
+    raises(ValueError, kpm.SpectralDensity, syst, num_moments=1)
+
+    # The integral of the density is the number of orbitals, up to the
+    # statistical error.
+    rho = kpm.SpectralDensity(syst, num_moments=200, num_vectors=20)
+    energies, densities = rho()
+    assert energies.shape == densities.shape == (400,)
+    assert np.all(np.diff(energies) > 0)
+    assert_allclose(integrate(energies, densities), len(ham), rtol=0.02)
+    assert_allclose(rho(energies), densities)
+    assert rho(10.) == 0
+
+    # Moments and vectors can be added later on.
+    rho2 = kpm.SpectralDensity(syst, num_moments=100, num_vectors=5)
+    rho2.add_moments(100)
+    rho2.add_vectors(15)
+    assert (rho2.num_moments, rho2.num_vectors) == (200, 20)
+    assert_allclose(rho2(energies), densities)
+
+    # Other salts give other random vectors.
+    rho3 = kpm.SpectralDensity(syst, num_moments=200, num_vectors=20,
+                               salt='other')
+    assert not np.allclose(rho3(energies), densities)
+
+
+def test_local_density():
+    syst = make_system(6)
+    ham = syst.hamiltonian_submatrix()
+    orbitals = [0, 7, 20]
+    rho = kpm.SpectralDensity(syst, num_moments=300, orbitals=orbitals)
+    raises(ValueError, rho.add_vectors, 1)
+    energies, densities = rho()
+    assert densities.shape == (600, 3)
+    # The local density is normalized and its first moment is the onsite
+    # energy.
+    assert_allclose(integrate(energies, densities), 1, rtol=1e-3)
+    assert_allclose(integrate(energies, energies[:, None] * densities),
+                    ham.diagonal()[orbitals].real, atol=1e-2)
+
+    # Compare to the exact result at the same resolution.
+    evals, evecs = np.linalg.eigh(ham)
+    weights = abs(evecs[orbitals])**2
+    width = 0.1
+    exact = np.dot(np.exp(-(energies[:, None] - evals)**2 / (2 * width**2)),
+                   weights.T) / np.sqrt(2 * np.pi) / width
+    smoothed = np.array([integrate(energies, np.exp(-(energies - e)**2
+                                                    / (2 * 0.08**2))[:, None]
+                                   * densities) / np.sqrt(2 * np.pi) / 0.08
+                         for e in energies])
+    inside = abs(energies) < 4
+    assert np.max(abs(smoothed - exact)[inside]) < 0.1 * np.max(exact)
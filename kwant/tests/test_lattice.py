@@ -81,6 +81,41 @@ def test_shape():
         assert len(sites) > 35
 
 
+def test_vectorized_shape():
+    def in_ring(pos):
+        r_squared = pos[0] ** 2 + pos[1] ** 2
+        return 20 < r_squared < 100
+
+    def in_ring_vectorized(pos):
+        r_squared = (pos ** 2).sum(1)
+        return (20 < r_squared) & (r_squared < 100)
+
+    for lat in (lattice.honeycomb(), lattice.kagome(), lattice.square()):
+        sites = set(lat.shape(in_ring, (5, 0))())
+        sites_vectorized = list(lat.shape(in_ring_vectorized, (5, 0),
+                                          vectorized=True)())
+        assert len(sites_vectorized) == len(sites)
+        assert set(sites_vectorized) == sites
+    raises(ValueError,
+           lat.shape(in_ring_vectorized, (0, 0), vectorized=True)().__next__)
+    raises(ValueError,
+           lat.shape(lambda pos: True, (5, 0), vectorized=True)().__next__)
+
+    lat = lattice.honeycomb()
+    for period in (0, 1), (1, 0), (1, -1):
+        vec = lat.vec(period)
+        sym = lattice.TranslationalSymmetry(vec)
+        def shape(pos):
+            return abs(pos[0] * vec[1] - pos[1] * vec[0]) < 10
+        def shape_vectorized(pos):
+            return abs(pos[:, 0] * vec[1] - pos[:, 1] * vec[0]) < 10
+        sites = set(lat.shape(shape, (0, 0))(sym))
+        sites_vectorized = list(lat.shape(shape_vectorized, (0, 0),
+                                          vectorized=True)(sym))
+        assert len(sites_vectorized) == len(sites)
+        assert set(sites_vectorized) == sites
+
+
 def test_wire():
     np.random.seed(5)
     vecs = np.random.randn(3, 3)
@@ -191,6 +226,23 @@ def test_translational_symmetry_reversed():
                 pass
 
 
+def test_translational_symmetry_tags():
+    np.random.seed(31)
+    lat = lattice.general(np.identity(3))
+    tags = np.random.randint(-20, 20, (50, 3))
+    for periods in [[(2, 1, 0)], [(1, 0, 3), (0, -2, 1)]]:
+        sym = lattice.TranslationalSymmetry(*periods)
+        for s in [sym, sym.reversed()]:
+            elements = s.which_tags(lat, tags)
+            # Compare to the generic implementations.
+            assert np.all(elements ==
+                          builder.Symmetry.which_tags(s, lat, tags))
+            assert np.all(s.act_tags(-elements, lat, tags) ==
+                          builder.Symmetry.act_tags(s, -elements, lat, tags))
+            for tag, fd_tag in zip(tags, s.act_tags(-elements, lat, tags)):
+                assert s.to_fd(lat(*tag)) == lat(*fd_tag)
+
+
 def test_monatomic_lattice():
     lat = lattice.square()
     lat2 = lattice.general(np.identity(2))
@@ -6,6 +6,7 @@
 # the file AUTHORS.rst at the top-level directory of this distribution and at
 # http://kwant-project.org/authors.
 
+from concurrent import futures
 from pytest import raises
 import numpy as np
 from scipy import sparse
@@ -99,3 +100,125 @@ def test_hamiltonian_submatrix():
     mat = mat[perm, :]
     mat = mat[:, perm]
     np.testing.assert_array_equal(mat, mat_should_be)
+
+
+
+def test_hamiltonian_blocks():
+    chain = kwant.lattice.chain()
+    syst = kwant.Builder()
+    syst[chain(0)] = np.array([[0, 1j], [-1j, 0]])
+    syst[chain(1)] = np.array([[1]])
+    syst[chain(2)] = np.array([[2]])
+    syst[chain(1), chain(0)] = np.array([[1, 2j]])
+    syst[chain(2), chain(1)] = np.array([[3j]])
+    syst[chain(3)] = 4 * np.identity(3)
+    syst2 = syst.finalized()
+    ham = syst2.hamiltonian_blocks()
+    mat_dense = syst2.hamiltonian_submatrix()
+    assert ham.shape == mat_dense.shape == (7, 7)
+    np.testing.assert_array_equal(ham.tocoo().toarray(), mat_dense)
+
+    np.random.seed(3)
+    vecs = np.random.randn(7, 5) + 1j * np.random.randn(7, 5)
+    np.testing.assert_almost_equal(ham.dot(vecs), np.dot(mat_dense, vecs))
+    np.testing.assert_almost_equal(ham.dot(vecs[:, 0], num_threads=2),
+                                   np.dot(mat_dense, vecs[:, 0]))
+    raises(ValueError, ham.dot, vecs[:6])
+
+    # The BSR format needs the same number of orbitals everywhere.
+    raises(ValueError, ham.tobsr)
+    raises(ValueError, syst2.hamiltonian_submatrix, format='bsr')
+    syst2 = kwant.Builder()
+    syst2[(chain(i) for i in range(4))] = np.array([[0, 1], [1, 3]])
+    syst2[chain.neighbors()] = np.array([[1j, 2], [0, -1]])
+    syst2 = syst2.finalized()
+    mat_dense = syst2.hamiltonian_submatrix()
+    mat = syst2.hamiltonian_submatrix(format='bsr')
+    assert sparse.isspmatrix_bsr(mat) and mat.blocksize == (2, 2)
+    np.testing.assert_array_equal(mat.toarray(), mat_dense)
+    mat, to_norb, from_norb = syst2.hamiltonian_submatrix(
+        (), [0, 1], [2], format='bsr', return_norb=True)
+    assert sparse.isspmatrix_bsr(mat)
+    np.testing.assert_array_equal(mat.toarray(), mat_dense[:4, 4:6])
+    np.testing.assert_array_equal(to_norb, [2, 2])
+    np.testing.assert_array_equal(from_norb, [2])
+    mat = syst2.hamiltonian_submatrix(format='csr')
+    assert sparse.isspmatrix_csr(mat)
+    np.testing.assert_array_equal(mat.toarray(), mat_dense)
+    raises(ValueError, syst2.hamiltonian_submatrix, format='dense')
+
+    # All formats give the same matrix, also for a Hamiltonian that is not
+    # Hermitian.
+    class NonHermitian(kwant.system.FiniteSystem):
+        graph = kwant.graph.Graph()
+        graph.add_edges([(0, 1), (1, 0), (1, 2), (2, 1)])
+        graph = graph.compressed()
+        leads = lead_interfaces = []
+
+        def hamiltonian(self, i, j, *args):
+            return [[1 + i + 10j * j, 2], [3j, 4 * i]]
+
+    syst3 = NonHermitian()
+    mat_dense = syst3.hamiltonian_submatrix()
+    for format in ['bsr', 'csr', 'lil']:
+        mat = syst3.hamiltonian_submatrix(format=format)
+        np.testing.assert_array_equal(mat.toarray(), mat_dense)
+
+    # Test for shape errors.
+    syst[chain(0), chain(2)] = 1
+    raises(ValueError, syst.finalized().hamiltonian_blocks)
+
+
+def test_mode_cache():
+    chain = kwant.lattice.chain()
+    calls = []
+
+    def hopping(site1, site2, t, B):
+        calls.append(None)
+        return -t
+
+    lead = kwant.Builder(kwant.TranslationalSymmetry((-1,)))
+    lead[chain(0)] = 1
+    lead[chain(0), chain(1)] = hopping
+    flead = lead.finalized()
+    assert flead.mode_cache_info() is None
+    raises(ValueError, flead.enable_mode_cache, 0)
+
+    flead.enable_mode_cache(maxsize=2, relevant_args=[0])
+    modes = flead.modes(0.5, (1, 0))
+    num_calls = len(calls)
+    # B does not influence the lead.
+    assert flead.modes(0.5, (1, 10)) is modes
+    assert len(calls) == num_calls
+    assert flead.mode_cache_info() == (1, 1, 2, 1)
+
+    flead.modes(0.5, (2, 0))
+    flead.modes(0.7, (1, 0))
+    assert flead.mode_cache_info() == (1, 3, 2, 2)
+    # The least recently used entry has been discarded.
+    assert flead.modes(0.5, (1, 0)) is not modes
+    assert flead.mode_cache_info().misses == 4
+
+    # Unhashable arguments are not cached.
+    flead.enable_mode_cache(relevant_args=None)
+    flead.modes(0, (1, np.zeros(2)))
+    flead.modes(0, (1, np.zeros(2)))
+    assert flead.mode_cache_info() == (0, 2, 128, 0)
+
+    # Concurrent use from several threads.
+    flead.enable_mode_cache(maxsize=3)
+    energies = 10 * [0.1, 0.2, 0.3, 0.4, 0.5]
+    with futures.ThreadPoolExecutor(4) as executor:
+        results = list(executor.map(lambda e: flead.modes(e, (1, 0)),
+                                    energies))
+    info = flead.mode_cache_info()
+    assert info.hits + info.misses == len(energies)
+    assert info.currsize == 3
+    for energy, modes in zip(energies, results):
+        np.testing.assert_almost_equal(modes[0].momenta,
+                                       flead.modes(energy, (1, 0))[0].momenta)
+
+    sigma = flead.selfenergy(0.5, (1, 0))
+    flead.disable_mode_cache()
+    assert flead.mode_cache_info() is None
+    np.testing.assert_almost_equal(sigma, flead.selfenergy(0.5, (1, 0)))
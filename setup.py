@@ -268,8 +268,8 @@ def search_mumps():
     This is known to work with the MUMPS provided by the Debian package
     libmumps-scotch-dev."""
 
-    libs = ['zmumps_scotch', 'mumps_common_scotch', 'pord', 'mpiseq_scotch',
-            'gfortran']
+    libs = ['zmumps_scotch', 'dmumps_scotch', 'mumps_common_scotch', 'pord',
+            'mpiseq_scotch', 'gfortran']
 
     cmd = ['gcc']
     cmd.extend(['-l' + lib for lib in libs])
@@ -295,6 +295,7 @@ def extensions():
     result = [
         (['kwant._system', ['kwant/_system.pyx']],
          {'include_dirs': ['kwant/graph']}),
+        (['kwant._digest', ['kwant/_digest.pyx']], {}),
         (['kwant.graph.core', ['kwant/graph/core.pyx']],
          {'depends': ['kwant/graph/core.pxd', 'kwant/graph/defs.h',
                       'kwant/graph/defs.pxd']}),
@@ -359,6 +360,15 @@ def extensions():
     else:
         build_summary.append('No MUMPS support')
 
+    # Setup OpenMP for the multithreaded loops of kwant._system.
+    kwrds = kwrds_by_section.get('openmp')
+    if kwrds:
+        build_summary.append('User-configured OpenMP')
+        system_kwrds = result[0][1]
+        for name, value in kwrds.items():
+            system_kwrds.setdefault(name, []).extend(value)
+        system_kwrds.setdefault('depends', []).append(CONFIG_FILE)
+
     build_summary = '\n'.join(build_summary)
     return result
 